@@ -4,13 +4,13 @@ import typer
 from typing import Optional
 from rich.console import Console
 import boto3
-import json
 import time
-import yaml
 import logging
 
 from .core import run_with_spinner
 from .core.cache import parse_ttl, get_default_ttl, set_default_ttl
+from .core.records import dump_yaml, json_default
+from .config import RuntimeConfig
 from .modules import tgw, anfw, vpc, cloudwan
 
 app = typer.Typer(
@@ -77,10 +77,10 @@ def _render(data, fmt: str):
     if fmt == "table":
         return False  # caller should render with display
     if fmt == "json":
-        console.print_json(json.dumps(data, default=str))
+        console.print_json(data=data, default=json_default)
         return True
     if fmt == "yaml":
-        console.print(yaml.safe_dump(data, sort_keys=False))
+        console.print(dump_yaml(data))
         return True
     console.print(f"[yellow]Unknown format: {fmt}. Defaulting to table.[/]")
     return False
@@ -105,6 +105,7 @@ def get_or_fetch(
     msg: str,
 ):
     account_id = get_account_id(profile)
+    RuntimeConfig.set_no_cache(no_cache or refresh_cache)
 
     if refresh_cache:
         cache_obj.clear()
@@ -143,6 +144,7 @@ def get_cached_or_fetch(
 ):
     """Get from cache or fetch - clears stale/wrong-account cache automatically"""
     account_id = get_account_id(profile)
+    RuntimeConfig.set_no_cache(no_cache)
 
     if no_cache:
         client = client_class(profile)
@@ -209,6 +211,8 @@ def clear_all_cache():
             console.print(f"[green]Cleared {name} cache[/]")
         except Exception as e:
             console.print(f"[yellow]Skip {name} cache: {e}[/]")
+    tgw.clear_discovery_cache()
+    console.print("[green]Cleared tgw_discovery cache[/]")
 
     # Clear traceroute topology and staleness markers
     try:
@@ -474,6 +478,7 @@ def tgw_main(
         return
     if ref == "clear-cache":
         tgw.cache.clear()
+        tgw.clear_discovery_cache()
         console.print("[green]Cache cleared[/]")
         return
 
@@ -685,34 +690,24 @@ def find_ip_cmd(ip: str = typer.Argument(..., help="IPv4 or IPv6 address")):
 
     resolver = IpResolver(profile=gctx.profile)
     regions = gctx.regions or resolver.session.get_available_regions("ec2")
-    eni_id = resolver.resolve_ip(ip, regions)
-    if not eni_id:
+    found = resolver.resolve_ip_with_metadata(ip, regions)
+    if not found:
         console.print(f"[yellow]No ENI found for {ip}[/]")
         raise typer.Exit(1)
-    # Get details of the ENI
-    for region in regions:
-        ec2 = boto3.Session(profile_name=gctx.profile).client("ec2", region_name=region)
-        try:
-            resp = ec2.describe_network_interfaces(NetworkInterfaceIds=[eni_id])
-            if resp.get("NetworkInterfaces"):
-                eni = resp["NetworkInterfaces"][0]
-                out = {
-                    "eni_id": eni_id,
-                    "region": region,
-                    "vpc_id": eni.get("VpcId"),
-                    "subnet_id": eni.get("SubnetId"),
-                    "private_ip": eni.get("PrivateIpAddress"),
-                    "public_ip": eni.get("Association", {}).get("PublicIp"),
-                    "attachment": eni.get("Attachment", {}).get("InstanceId")
-                    or eni.get("InterfaceType"),
-                }
-                if _render(out, gctx.format):
-                    return
-                console.print(out)
-                return
-        except Exception:
-            continue
-    console.print(f"[yellow]Found ENI {eni_id} but could not fetch details[/]")
+    eni_id, region, eni = found
+    out = {
+        "eni_id": eni_id,
+        "region": region,
+        "vpc_id": eni.get("VpcId"),
+        "subnet_id": eni.get("SubnetId"),
+        "private_ip": eni.get("PrivateIpAddress"),
+        "public_ip": eni.get("Association", {}).get("PublicIp"),
+        "attachment": eni.get("Attachment", {}).get("InstanceId")
+        or eni.get("InterfaceType"),
+    }
+    if _render(out, gctx.format):
+        return
+    console.print(out)
 
 
 @app.command("run")
@@ -19,6 +19,8 @@ import re
 
 import pexpect
 
+ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 class ShellRunner:
     """Run commands against aws-net-shell interactively."""
@@ -136,8 +138,7 @@ class ShellRunner:
     @staticmethod
     def _strip_ansi(text: str) -> str:
         """Remove ANSI escape codes."""
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        return ANSI_ESCAPE.sub("", text)
 
 
 def main():
@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 from threading import Lock
 
 
@@ -45,6 +45,7 @@ class Config:
             "cache": {
                 "enabled": True,
                 "expire_minutes": 30,
+                "persist": False,  # Keep show results on disk across sessions
             },
         }
 
@@ -102,11 +103,21 @@ def get_config() -> Config:
     return Config()
 
 
+class RuntimeSettings(NamedTuple):
+    """Immutable snapshot of the runtime settings."""
+
+    profile: Optional[str] = None
+    regions: tuple[str, ...] = ()
+    no_cache: bool = False
+    output_format: str = "table"
+
+
 class RuntimeConfig:
     """Thread-safe singleton for runtime configuration.
 
     Used by modules to access shell runtime settings (profile, regions, no_cache)
-    without explicit parameter passing.
+    without explicit parameter passing. Settings live in one immutable
+    snapshot: writers swap in a new one under the lock, readers never lock.
 
     Usage:
         # In shell:
@@ -118,6 +129,8 @@ class RuntimeConfig:
         regions = RuntimeConfig.get_regions()
     """
 
+    __slots__ = ("_settings", "_initialized")
+
     _instance = None
     _lock = Lock()
 
@@ -132,70 +145,76 @@ class RuntimeConfig:
     def __init__(self):
         if self._initialized:
             return
-        self._profile: Optional[str] = None
-        self._regions: list[str] = []
-        self._no_cache: bool = False
-        self._output_format: str = "table"
+        self._settings = RuntimeSettings()
         self._initialized = True
 
+    @classmethod
+    def _get(cls) -> "RuntimeConfig":
+        """The singleton, skipping ``__new__``/``__init__`` once it exists."""
+        return cls._instance or cls()
+
+    @classmethod
+    def _update(cls, **changes) -> None:
+        instance = cls._get()
+        with cls._lock:
+            instance._settings = instance._settings._replace(**changes)
+
+    @classmethod
+    def snapshot(cls) -> RuntimeSettings:
+        """All settings as one consistent, immutable tuple."""
+        return cls._get()._settings
+
     @classmethod
     def set_profile(cls, profile: Optional[str]) -> None:
         """Set AWS profile for all modules."""
-        instance = cls()
-        instance._profile = profile
+        cls._update(profile=profile)
 
     @classmethod
     def get_profile(cls) -> Optional[str]:
         """Get current AWS profile."""
-        instance = cls()
-        return instance._profile
+        return cls._get()._settings.profile
 
     @classmethod
     def set_regions(cls, regions: list[str]) -> None:
         """Set target regions for discovery operations."""
-        instance = cls()
-        instance._regions = regions if regions else []
+        cls._update(regions=tuple(regions) if regions else ())
 
     @classmethod
     def get_regions(cls) -> list[str]:
         """Get target regions. Empty list means all regions."""
-        instance = cls()
-        return instance._regions
+        return list(cls._get()._settings.regions)
 
     @classmethod
     def set_no_cache(cls, no_cache: bool) -> None:
         """Set cache disable flag."""
-        instance = cls()
-        instance._no_cache = no_cache
+        cls._update(no_cache=no_cache)
 
     @classmethod
     def is_cache_disabled(cls) -> bool:
         """Check if caching is disabled."""
-        instance = cls()
-        return instance._no_cache
+        return cls._get()._settings.no_cache
 
     @classmethod
     def set_output_format(cls, format: str) -> None:
         """Set output format (table, json, yaml)."""
-        instance = cls()
         if format not in ("table", "json", "yaml"):
             raise ValueError(f"Invalid format: {format}")
-        instance._output_format = format
+        cls._update(output_format=format)
 
     @classmethod
     def get_output_format(cls) -> str:
         """Get current output format."""
-        instance = cls()
-        return instance._output_format
+        return cls._get()._settings.output_format
 
     @classmethod
     def reset(cls) -> None:
         """Reset to defaults (mainly for testing)."""
-        instance = cls()
-        instance._profile = None
-        instance._regions = []
-        instance._no_cache = False
-        instance._output_format = "table"
+        from ..modules.flowlogs import clear_flow_log_cache
+
+        instance = cls._get()
+        with cls._lock:
+            instance._settings = RuntimeSettings()
+        clear_flow_log_cache()
 
 
 def get_runtime_config() -> RuntimeConfig:
@@ -3,10 +3,18 @@
 from .cache import Cache, parse_ttl, get_default_ttl, set_default_ttl
 from .spinner import run_with_spinner
 from .display import BaseDisplay
-from .base import BaseClient, ModuleInterface, Context
+from .base import (
+    BaseClient,
+    ModuleInterface,
+    Context,
+    get_client,
+    get_session,
+    session_client,
+)
 from .decorators import requires_context, requires_root, cached_command
 from .renderer import DisplayRenderer
 from .logging import setup_logging, get_logger, logger
+from .records import Record, json_default
 
 __all__ = [
     "Cache",
@@ -18,6 +26,9 @@ __all__ = [
     "BaseClient",
     "ModuleInterface",
     "Context",
+    "get_client",
+    "get_session",
+    "session_client",
     "requires_context",
     "requires_root",
     "cached_command",
@@ -25,4 +36,6 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "logger",
+    "Record",
+    "json_default",
 ]
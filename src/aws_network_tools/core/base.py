@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+import functools
+import threading
+import weakref
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 import logging
@@ -9,16 +12,84 @@ from ..config import RuntimeConfig
 # Library-wide logger
 logger = logging.getLogger("aws_network_tools")
 
-# Centralized botocore configuration (timeouts, retries, UA)
+# Centralized botocore configuration (timeouts, retries, UA). Adaptive retries
+# rate-limit each shared client when AWS throttles, so regional fan-outs ease
+# off under load instead of burning their retry budget.
 DEFAULT_BOTO_CONFIG = Config(
-    retries={"max_attempts": 10, "mode": "standard"},
+    retries={"max_attempts": 10, "mode": "adaptive"},
     connect_timeout=5,
     read_timeout=20,
     user_agent_extra="aws-network-tools/0.1.0",
 )
 
 
-@dataclass
+@functools.cache
+def get_session(profile: Optional[str] = None) -> boto3.Session:
+    """Get the process-wide boto3 session for a profile.
+
+    Sessions resolve credentials lazily and are safe to share for creating
+    clients, so one per profile is kept for the life of the process.
+    """
+    return boto3.Session(profile_name=profile) if profile else boto3.Session()
+
+
+# session -> {(service, region, config): client}. boto3 clients are
+# thread-safe, so modules, the shell and traceroute share one per key; they
+# go away with their session.
+_clients: "weakref.WeakKeyDictionary[boto3.Session, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def session_client(
+    session: boto3.Session,
+    service: str,
+    region: Optional[str] = None,
+    config: Config = DEFAULT_BOTO_CONFIG,
+):
+    """Get the process-wide boto3 client for a session, service and region.
+
+    Building a client loads its service model and endpoint rules, so it is
+    done once per session, service, region and config.
+    """
+    key = (service, region, config)
+    client = _clients.get(session, {}).get(key)
+    if client is None:
+        with _clients_lock:
+            clients = _clients.setdefault(session, {})
+            client = clients.get(key)
+            if client is None:
+                client = clients[key] = session.client(
+                    service, region_name=region, config=config
+                )
+    return client
+
+
+def get_client(
+    profile: Optional[str],
+    service: str,
+    region: Optional[str] = None,
+    config: Config = DEFAULT_BOTO_CONFIG,
+):
+    """Get the process-wide boto3 client for a profile, service and region."""
+    return session_client(get_session(profile), service, region, config)
+
+
+@functools.lru_cache(maxsize=16)
+def enabled_regions(profile: Optional[str], region: str) -> tuple[str, ...]:
+    """Regions enabled for a profile's account, looked up once per process.
+
+    Every module's ``get_regions`` needs this list; caching it here saves a
+    ``describe_regions`` round-trip per client. Failures are not cached.
+    """
+    ec2 = get_client(profile, "ec2", region)
+    return tuple(
+        r["RegionName"] for r in ec2.describe_regions(AllRegions=False)["Regions"]
+    )
+
+
+@dataclass(slots=True)
 class Context:
     """Shell execution context"""
 
@@ -42,25 +113,29 @@ class BaseClient:
         if profile is None and session is None:
             profile = RuntimeConfig.get_profile()
 
+        # Only sessions built from the profile may share profile-keyed caches
+        self._injected_session = session is not None
         if session:
             self.session = session
             self.profile = profile
         else:
-            self.session = (
-                boto3.Session(profile_name=profile) if profile else boto3.Session()
-            )
+            # Shared per profile: service models and credentials load once
+            self.session = get_session(profile)
             self.profile = profile
         # Concurrency control for modules using thread pools
         import os
 
         self.max_workers = max_workers or int(os.getenv("AWS_NET_MAX_WORKERS", "10"))
 
-    def client(self, service: str, region_name: Optional[str] = None):
-        """Create a boto3 client with standardized config."""
+    def client(
+        self,
+        service: str,
+        region_name: Optional[str] = None,
+        config: Config = DEFAULT_BOTO_CONFIG,
+    ):
+        """Get a boto3 client with standardized config, shared per session."""
         try:
-            return self.session.client(
-                service, region_name=region_name, config=DEFAULT_BOTO_CONFIG
-            )
+            return session_client(self.session, service, region_name, config)
         except Exception as e:
             logger.warning(
                 "Failed to create client for %s (region=%s): %s",
@@ -71,6 +146,16 @@ class BaseClient:
             # Fallback without custom config
             return self.session.client(service, region_name=region_name)
 
+    def enabled_regions(self) -> list[str]:
+        """All regions enabled for the account; raises if the lookup fails."""
+        region = self.session.region_name or "us-east-1"
+        if not self._injected_session:
+            return list(enabled_regions(self.profile, region))
+        ec2 = self.client("ec2", region_name=region)
+        return [
+            r["RegionName"] for r in ec2.describe_regions(AllRegions=False)["Regions"]
+        ]
+
     def get_regions(self) -> list[str]:
         """Get target regions from RuntimeConfig or default to session region.
 
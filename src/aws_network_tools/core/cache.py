@@ -1,31 +1,50 @@
 """Generic file-based cache with TTL and account safety"""
 
+import functools
 import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Any
 
+from .records import json_default
+
 CACHE_DIR = Path.home() / ".cache" / "aws-network-tools"
 CONFIG_FILE = CACHE_DIR / "config.json"
 DEFAULT_TTL = 900  # 15 minutes
 
+_TTL_RE = re.compile(r"(\d+)([mhd]?)")
+_TTL_MULTIPLIERS = {"": 60, "m": 60, "h": 3600, "d": 86400}
+
 
 def parse_ttl(value: str) -> int:
     """Parse TTL string like '15m', '1h', '2d' to seconds"""
-    match = re.match(r"^(\d+)([mhd]?)$", value.lower())
+    match = _TTL_RE.fullmatch(value.lower())
     if not match:
         raise ValueError(
             f"Invalid TTL format: {value}. Use number with optional m/h/d suffix"
         )
-    num = int(match.group(1))
-    unit = match.group(2) or "m"
-    multipliers = {"m": 60, "h": 3600, "d": 86400}
-    return num * multipliers[unit]
+    return int(match.group(1)) * _TTL_MULTIPLIERS[match.group(2)]
+
+
+@functools.cache
+def _ensure_cache_dir() -> None:
+    """Create CACHE_DIR once per process rather than before every write"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
 
+def _write_text(path: Path, text: str) -> None:
+    """Write a cache file, recreating its directory if it was removed since"""
+    try:
+        path.write_text(text)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
 
+
+@functools.cache
 def get_default_ttl() -> int:
-    """Get default TTL from config or use default"""
+    """Get default TTL from config or use default (read once per process)"""
     if CONFIG_FILE.exists():
         try:
             config = json.loads(CONFIG_FILE.read_text())
@@ -37,7 +56,7 @@ def get_default_ttl() -> int:
 
 def set_default_ttl(ttl_seconds: int) -> None:
     """Set default TTL in config"""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_cache_dir()
     config = {}
     if CONFIG_FILE.exists():
         try:
@@ -45,7 +64,8 @@ def set_default_ttl(ttl_seconds: int) -> None:
         except Exception:
             pass
     config["ttl_seconds"] = ttl_seconds
-    CONFIG_FILE.write_text(json.dumps(config))
+    _write_text(CONFIG_FILE, json.dumps(config))
+    get_default_ttl.cache_clear()
 
 
 class Cache:
@@ -54,14 +74,12 @@ class Cache:
         self.cache_file = CACHE_DIR / f"{namespace}.json"
 
     def _ensure_dir(self):
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_cache_dir()
 
     def get(
         self, ignore_expiry: bool = False, current_account: Optional[str] = None
     ) -> Optional[dict]:
         """Get cached data if available, not expired, and same account"""
-        if not self.cache_file.exists():
-            return None
         try:
             raw = json.loads(self.cache_file.read_text())
 
@@ -98,17 +116,17 @@ class Cache:
             "ttl_seconds": ttl_seconds or get_default_ttl(),
             "account_id": account_id,
         }
-        self.cache_file.write_text(json.dumps(raw, default=str))
+        _write_text(
+            self.cache_file,
+            json.dumps(raw, default=json_default, separators=(",", ":")),
+        )
 
     def clear(self) -> None:
         """Clear the cache"""
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        self.cache_file.unlink(missing_ok=True)
 
     def get_info(self) -> Optional[dict]:
         """Get cache metadata"""
-        if not self.cache_file.exists():
-            return None
         try:
             raw = json.loads(self.cache_file.read_text())
             cached_at = datetime.fromisoformat(raw["cached_at"])  # aware
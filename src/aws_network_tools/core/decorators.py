@@ -23,16 +23,18 @@ def requires_context(*context_types: str) -> Callable:
             ...
     """
 
+    # Built once here rather than on every call of the wrapped command
+    allowed = frozenset(context_types)
+    if len(context_types) == 1:
+        message = f"[red]Must be in {context_types[0]} context[/]"
+    else:
+        message = f"[red]Must be in one of: {', '.join(context_types)}[/]"
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs) -> Any:
-            if self.ctx_type not in context_types:
-                if len(context_types) == 1:
-                    console.print(f"[red]Must be in {context_types[0]} context[/]")
-                else:
-                    console.print(
-                        f"[red]Must be in one of: {', '.join(context_types)}[/]"
-                    )
+            if self.ctx_type not in allowed:
+                console.print(message)
                 return None
             return func(self, *args, **kwargs)
 
@@ -50,12 +52,12 @@ def requires_root(func: Callable) -> Callable:
             ...
     """
 
+    message = f"[red]{func.__name__.replace('do_', '')} only at root level[/]"
+
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> Any:
         if self.ctx_type is not None:
-            console.print(
-                f"[red]{func.__name__.replace('do_', '')} only at root level[/]"
-            )
+            console.print(message)
             return None
         return func(self, *args, **kwargs)
 
@@ -1,50 +1,79 @@
 """IP Resolution Utility"""
 
 import concurrent.futures
-from typing import Optional, List
+import ipaddress
+import threading
+from typing import Optional, List, Tuple
 from .base import BaseClient
 
+# Upper bound on concurrent region lookups (one HTTPS connection each)
+MAX_REGION_WORKERS = 16
+
+
+def _eni_filter_names(ip: str) -> List[str]:
+    """describe_network_interfaces filters to try for an IP, most likely first.
+
+    EC2 ANDs distinct filter names, so private and public lookups are separate
+    calls. Non-global addresses can only be private IPs and need one call.
+    """
+    try:
+        is_global = ipaddress.ip_address(ip).is_global
+    except ValueError:
+        return ["private-ip-address", "association.public-ip"]
+    if is_global:
+        return ["association.public-ip", "private-ip-address"]
+    return ["private-ip-address"]
+
 
 class IpResolver(BaseClient):
     def __init__(self, profile: Optional[str] = None):
         super().__init__(profile)
 
-    def _check_region(self, ip: str, region: str) -> Optional[str]:
+    def _check_region(
+        self, ip: str, region: str, found: Optional[threading.Event] = None
+    ) -> Optional[dict]:
         try:
-            ec2 = self.session.client("ec2", region_name=region)
-
-            # Try private IP
-            resp = ec2.describe_network_interfaces(
-                Filters=[{"Name": "private-ip-address", "Values": [ip]}]
-            )
-            if resp["NetworkInterfaces"]:
-                return resp["NetworkInterfaces"][0]["NetworkInterfaceId"]
-
-            # Try public IP
-            resp = ec2.describe_network_interfaces(
-                Filters=[{"Name": "association.public-ip", "Values": [ip]}]
-            )
-            if resp["NetworkInterfaces"]:
-                return resp["NetworkInterfaces"][0]["NetworkInterfaceId"]
-
+            ec2 = self.client("ec2", region)
+            for name in _eni_filter_names(ip):
+                # Another region already matched; skip remaining lookups
+                if found is not None and found.is_set():
+                    return None
+                resp = ec2.describe_network_interfaces(
+                    Filters=[{"Name": name, "Values": [ip]}]
+                )
+                if resp["NetworkInterfaces"]:
+                    return resp["NetworkInterfaces"][0]
         except Exception:
             pass
         return None
 
     def resolve_ip(self, ip: str, regions: List[str]) -> Optional[str]:
         """Resolve an IP address to an ENI ID across multiple regions in parallel"""
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=len(regions)
-        ) as executor:
+        found = self.resolve_ip_with_metadata(ip, regions)
+        return found[0] if found else None
+
+    def resolve_ip_with_metadata(
+        self, ip: str, regions: List[str]
+    ) -> Optional[Tuple[str, str, dict]]:
+        """Resolve an IP address to (eni_id, region, ENI description) in parallel"""
+        found = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(regions), MAX_REGION_WORKERS))
+        )
+        try:
             future_to_region = {
-                executor.submit(self._check_region, ip, r): r for r in regions
+                executor.submit(self._check_region, ip, r, found): r for r in regions
             }
-
             for future in concurrent.futures.as_completed(future_to_region):
                 result = future.result()
                 if result:
-                    # Cancel other pending futures as we found it
-                    for f in future_to_region:
-                        f.cancel()
-                    return result
+                    found.set()
+                    return (
+                        result["NetworkInterfaceId"],
+                        future_to_region[future],
+                        result,
+                    )
+        finally:
+            # Return on first hit without waiting for in-flight regions
+            executor.shutdown(wait=False, cancel_futures=True)
         return None
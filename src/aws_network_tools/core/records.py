@@ -0,0 +1,65 @@
+"""Slotted record types for high-volume discovery results"""
+
+import json
+from dataclasses import fields
+from typing import Any, Optional
+
+import yaml
+
+
+class Record:
+    """Mixin for ``@dataclass(slots=True)`` records with dict-style reads.
+
+    Discovery results are consumed as dicts by displays, the shell and the
+    CLI, so records keep ``record["key"]``, ``record.get(key)`` and
+    ``key in record`` working while storing fields in ``__slots__``.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        # Fields only: methods such as keys or to_dict are not items
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> list[str]:
+        return [f.name for f in fields(self)]
+
+    def to_dict(self) -> dict:
+        # Shallow: record fields are scalars, so asdict's deep copy is waste
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+def json_default(obj: Any) -> Any:
+    """``json.dumps`` default hook: records become dicts, anything else a str"""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    return str(obj)
+
+
+def dump_json(data: Any) -> str:
+    """Indented JSON text as ``Console.print_json`` lays it out, minus colour"""
+    return json.dumps(data, indent=2, ensure_ascii=False, default=json_default)
+
+
+# libyaml's C emitter when PyYAML was built with it, else the pure-Python one
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+for _dumper in {yaml.SafeDumper, _YAML_DUMPER}:
+    _dumper.add_multi_representer(
+        Record, lambda dumper, rec: dumper.represent_dict(rec.to_dict())
+    )
+
+
+def dump_yaml(data: Any, stream: Any = None) -> Optional[str]:
+    """``yaml.safe_dump(data, sort_keys=False)`` on the fastest safe dumper"""
+    return yaml.dump(data, stream, Dumper=_YAML_DUMPER, sort_keys=False)
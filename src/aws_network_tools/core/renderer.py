@@ -1,11 +1,13 @@
 """Unified display renderer for consistent Rich output."""
 
-from typing import Any, Optional
+from itertools import islice
+from typing import Any, Iterable, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-import json
-import yaml
+from rich.style import Style
+from rich.text import Text
+from .records import dump_json, dump_yaml, json_default
 
 
 class DisplayRenderer:
@@ -27,9 +29,17 @@ class DisplayRenderer:
         "pending": "yellow",
         "error": "red",
     }
+    # Parsed once; state cells reuse these instead of per-cell markup
+    STATE_STYLES = {name: Style.parse(color) for name, color in COLORS.items()}
+    DEFAULT_STATE_STYLE = Style.parse("white")
+    # Tables with more rows than this are printed in blocks of this size
+    TABLE_CHUNK_ROWS = 500
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, plain: Optional[bool] = None):
         self.console = console or Console()
+        # Colourless consoles get status lines written straight to the file,
+        # skipping Rich's markup and segment rendering
+        self.plain = self.console.no_color if plain is None else plain
 
     def render(
         self,
@@ -50,69 +60,137 @@ class DisplayRenderer:
             True if rendered as non-table format, False if table
         """
         if fmt == "json":
-            self.console.print_json(json.dumps(data, default=str))
+            if self.plain:
+                # Nothing to colour, so skip Rich's JSON highlighting pass
+                print(dump_json(data), file=self.console.file)
+            else:
+                # data= serialises once; a JSON string would be parsed and re-dumped
+                self.console.print_json(data=data, default=json_default)
             return True
         if fmt == "yaml":
-            self.console.print(yaml.safe_dump(data, sort_keys=False))
+            if self.plain:
+                print(dump_yaml(data), file=self.console.file)
+            else:
+                self.console.print(dump_yaml(data))
             return True
         return False
 
-    def table(
+    def _new_table(
         self,
-        data: list[dict],
-        title: str,
+        title: Optional[str],
         columns: list[dict],
-        show_index: bool = True,
-        hint: Optional[str] = None,
-    ) -> None:
-        """Render data as a Rich table.
-
-        Args:
-            data: List of dicts to display
-            title: Table title
-            columns: List of {name, key, style?, width?}
-            show_index: Whether to show row numbers
-            hint: Optional hint text below table
-        """
-        if not data:
-            self.console.print(f"[yellow]No {title.lower()} found[/]")
-            return
-
-        table = Table(title=title, show_header=True, header_style="bold")
+        show_index: bool,
+        widths: Optional[list[int]] = None,
+        show_header: bool = True,
+    ) -> Table:
+        """Empty table with the index column and the given columns."""
+        table = Table(title=title, show_header=show_header, header_style="bold")
 
         if show_index:
             table.add_column("#", style="dim", justify="right", width=4)
 
-        for col in columns:
+        for n, col in enumerate(columns):
             table.add_column(
                 col["name"],
                 style=col.get("style", ""),
-                width=col.get("width"),
+                width=widths[n] if widths else col.get("width"),
                 justify=col.get("justify", "left"),
+                # Fixed block widths: fold long values onto more lines, never cut
+                overflow="fold" if widths else "ellipsis",
             )
+        return table
 
-        for i, row in enumerate(data, 1):
+    def _cells(
+        self,
+        rows: Iterable[dict],
+        first_index: int,
+        keys: list[str],
+        is_state: list[bool],
+        show_index: bool,
+    ) -> list[list]:
+        """Cell values for a block of rows, numbered from ``first_index``."""
+        block = []
+        for i, row in enumerate(rows, first_index):
             values = []
             if show_index:
                 values.append(str(i))
-            for col in columns:
-                val = row.get(col["key"], "")
+            for key, state in zip(keys, is_state):
+                val = row.get(key, "")
                 if val is None:
                     val = "-"
                 elif isinstance(val, list):
-                    val = ", ".join(str(v) for v in val[:3])
-                    if len(row.get(col["key"], [])) > 3:
-                        val += "..."
+                    shown = ", ".join(str(v) for v in val[:3])
+                    val = shown + "..." if len(val) > 3 else shown
                 else:
                     val = str(val)
                 # Apply state-based coloring
-                if col["key"] == "state":
-                    color = self.COLORS.get(val.lower(), "white")
-                    val = f"[{color}]{val}[/]"
+                if state:
+                    style = self.STATE_STYLES.get(val.lower(), self.DEFAULT_STATE_STYLE)
+                    val = Text(val, style=style)
                 values.append(val)
-            table.add_row(*values)
+            block.append(values)
+        return block
+
+    def table(
+        self,
+        data: Iterable[dict],
+        title: str,
+        columns: list[dict],
+        show_index: bool = True,
+        hint: Optional[str] = None,
+    ) -> None:
+        """Render data as a Rich table.
+
+        Args:
+            data: Dicts to display (a list or any iterable, e.g. a generator)
+            title: Table title
+            columns: List of {name, key, style?, width?}
+            show_index: Whether to show row numbers
+            hint: Optional hint text below table
+        """
+        # Per-column facts looked up once, not once per cell
+        keys = [col["key"] for col in columns]
+        is_state = [key == "state" for key in keys]
+
+        chunk = self.TABLE_CHUNK_ROWS
+        rows = iter(data)
+        block = self._cells(islice(rows, chunk), 1, keys, is_state, show_index)
+        if not block:
+            self.console.print(f"[yellow]No {title.lower()} found[/]")
+            return
 
-        self.console.print(table)
+        if len(block) < chunk:
+            table = self._new_table(title, columns, show_index)
+            for values in block:
+                table.add_row(*values)
+            self.console.print(table)
+        else:
+            # Large tables are built and printed block by block, so memory
+            # stays at one block and output starts at once. Widths come from
+            # the column definition or the first block and stay fixed so the
+            # blocks line up; longer values further down fold onto extra lines.
+            offset = 1 if show_index else 0
+            widths = [
+                col.get("width")
+                or max(len(col["name"]), *(len(str(r[n + offset])) for r in block))
+                for n, col in enumerate(columns)
+            ]
+            first_index = 1
+            while block:
+                table = self._new_table(
+                    title if first_index == 1 else None,
+                    columns,
+                    show_index,
+                    widths=widths,
+                    show_header=first_index == 1,
+                )
+                for values in block:
+                    table.add_row(*values)
+                self.console.print(table)
+                first_index += len(block)
+                block = self._cells(
+                    islice(rows, chunk), first_index, keys, is_state, show_index
+                )
         if hint:
             self.console.print(f"[dim]{hint}[/]")
 
@@ -143,18 +221,24 @@ class DisplayRenderer:
         ]
         self.table(routes, title, columns, show_index=False)
 
+    def _message(self, message: str, style: str) -> None:
+        if self.plain:
+            print(message, file=self.console.file)
+        else:
+            self.console.print(f"[{style}]{message}[/]")
+
     def status(self, message: str, style: str = "green") -> None:
         """Print a status message."""
-        self.console.print(f"[{style}]{message}[/]")
+        self._message(message, style)
 
     def error(self, message: str) -> None:
         """Print an error message."""
-        self.console.print(f"[red]{message}[/]")
+        self._message(message, "red")
 
     def warning(self, message: str) -> None:
         """Print a warning message."""
-        self.console.print(f"[yellow]{message}[/]")
+        self._message(message, "yellow")
 
     def info(self, message: str) -> None:
         """Print an info message."""
-        self.console.print(f"[dim]{message}[/]")
+        self._message(message, "dim")
@@ -9,6 +9,9 @@ AWS_REGION_PATTERN = re.compile(
     r"^(us|eu|ap|sa|ca|me|af|il)-(north|south|east|west|central|northeast|southeast|southwest|northwest)-\d+$"
 )
 
+# AWS profile names: letters, digits, hyphens and underscores
+PROFILE_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 # Known AWS regions (as of 2025)
 VALID_AWS_REGIONS = {
     # US regions
@@ -155,7 +158,7 @@ def validate_profile(profile_input: str) -> Tuple[bool, Optional[str], Optional[
     profile = profile_input.strip()
 
     # Check for invalid characters (AWS profile names are alphanumeric + _-)
-    if not re.match(r"^[a-zA-Z0-9_-]+$", profile):
+    if not PROFILE_NAME_PATTERN.match(profile):
         return (
             False,
             None,
@@ -4,6 +4,8 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import re
 
+_CIDR_RE = re.compile(r"(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})/(\d{1,2})")
+
 
 class CIDRBlock(BaseModel):
     """Validated CIDR block."""
@@ -13,8 +15,13 @@ class CIDRBlock(BaseModel):
     @field_validator("cidr")
     @classmethod
     def validate_cidr(cls, v: str) -> str:
-        pattern = r"^(\d{1,3}\.){3}\d{1,3}/\d{1,2}$"
-        if not re.match(pattern, v):
+        # Regex plus range checks; cheaper than building an ip_network object
+        m = _CIDR_RE.fullmatch(v)
+        if (
+            not m
+            or any(int(octet) > 255 for octet in m.groups()[:4])
+            or int(m.group(5)) > 32
+        ):
             raise ValueError(f"Invalid CIDR format: {v}")
         return v
 
@@ -83,12 +83,7 @@ class ANFWClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.client("ec2", region_name=region)
-            return [
-                r["RegionName"]
-                for r in ec2.describe_regions(AllRegions=False)["Regions"]
-            ]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -255,7 +250,7 @@ class ANFWClient(BaseClient):
         try:
             client = self.client("network-firewall", region_name=region)
             paginator = client.get_paginator("list_firewalls")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                 for fw in page.get("Firewalls", []):
                     fw_name = fw.get("FirewallName", "")
                     detail = client.describe_firewall(FirewallName=fw_name)["Firewall"]
@@ -478,8 +473,10 @@ def resolve_item(
     for item in items:
         if item.get(id_key) == ref:
             return item
+    ref_lower = ref.lower()
     for item in items:
-        if item.get(name_key) and item[name_key].lower() == ref.lower():
+        name = item.get(name_key)
+        if name and name.lower() == ref_lower:
             return item
     return None
 
@@ -19,22 +19,19 @@ class ClientVPNClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
     def _scan_region(self, region: str) -> dict:
         data = {"region": region, "endpoints": [], "connections": []}
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
 
             # Get Client VPN endpoints
             try:
                 paginator = ec2.get_paginator("describe_client_vpn_endpoints")
-                for page in paginator.paginate():
+                for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                     for ep in page.get("ClientVpnEndpoints", []):
                         # Get target networks
                         target_networks = []
@@ -143,7 +140,7 @@ class ClientVPNClient(BaseClient):
     def get_connections(self, region: str, endpoint_id: str) -> List[dict]:
         """Get active connections for a Client VPN endpoint"""
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
             resp = ec2.describe_client_vpn_connections(ClientVpnEndpointId=endpoint_id)
             return [
                 {
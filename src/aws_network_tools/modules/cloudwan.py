@@ -1,5 +1,6 @@
 """Cloud WAN module"""
 
+import concurrent.futures
 import json
 import logging
 from typing import Optional, Dict, List, Any
@@ -143,6 +144,15 @@ class CloudWANClient(BaseClient):
                 )
         return self._nm
 
+    def _map_parallel(self, fn, items: list) -> list:
+        """``fn`` over items on a thread pool; results in input order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(items), self.max_workers)
+        ) as executor:
+            return list(executor.map(fn, items))
+
     def _get_name(self, tags: list) -> Optional[str]:
         return next((t["Value"] for t in tags if t["Key"] == "Name"), None)
 
@@ -587,16 +597,19 @@ class CloudWANClient(BaseClient):
         ]
         segments = [s.get("name") for s in policy.get("segments", []) if s.get("name")]
 
-        for region in regions:
-            for segment in segments:
-                key = f"{segment}|{region}"
-                routes = self.get_routing_information_base(cn_id, segment, region)
-                if routes:
-                    rib_data[key] = {
-                        "segment": segment,
-                        "edge_location": region,
-                        "routes": routes,
-                    }
+        # One RIB call per edge/segment pair, run side by side
+        pairs = [(region, segment) for region in regions for segment in segments]
+        ribs = self._map_parallel(
+            lambda pair: self.get_routing_information_base(cn_id, pair[1], pair[0]),
+            pairs,
+        )
+        for (region, segment), routes in zip(pairs, ribs):
+            if routes:
+                rib_data[f"{segment}|{region}"] = {
+                    "segment": segment,
+                    "edge_location": region,
+                    "routes": routes,
+                }
 
         return rib_data
 
@@ -643,33 +656,35 @@ class CloudWANClient(BaseClient):
                         if n.get("name")
                     ]
 
-                    # Build route tables
-                    route_tables = []
+                    # Build route tables, fetching every segment and NFG
+                    # table side by side (region, then segment, then NFG order)
+                    specs = []
                     for region in regions:
-                        for segment in segments:
-                            routes = self._get_routes(gn_id, cn_id, region, segment)
-                            if routes:
-                                route_tables.append(
-                                    {
-                                        "id": f"{segment}|{region}",
-                                        "name": segment,
-                                        "region": region,
-                                        "type": "segment",
-                                        "routes": routes,
-                                    }
-                                )
-                        for nfg in nfgs:
-                            routes = self._get_nfg_routes(gn_id, cn_id, region, nfg)
-                            if routes:
-                                route_tables.append(
-                                    {
-                                        "id": f"NFG-{nfg}|{region}",
-                                        "name": f"NFG-{nfg}",
-                                        "region": region,
-                                        "type": "nfg",
-                                        "routes": routes,
-                                    }
-                                )
+                        specs += [("segment", region, s) for s in segments]
+                        specs += [("nfg", region, n) for n in nfgs]
+
+                    def fetch(spec, gn_id=gn_id, cn_id=cn_id):
+                        kind, region, name = spec
+                        if kind == "segment":
+                            return self._get_routes(gn_id, cn_id, region, name)
+                        return self._get_nfg_routes(gn_id, cn_id, region, name)
+
+                    route_tables = []
+                    for (kind, region, name), routes in zip(
+                        specs, self._map_parallel(fetch, specs)
+                    ):
+                        if not routes:
+                            continue
+                        label = name if kind == "segment" else f"NFG-{name}"
+                        route_tables.append(
+                            {
+                                "id": f"{label}|{region}",
+                                "name": label,
+                                "region": region,
+                                "type": kind,
+                                "routes": routes,
+                            }
+                        )
 
                     core_networks.append(
                         {
@@ -1346,8 +1361,10 @@ def resolve_item(
     for item in items:
         if item.get(id_key) == ref:
             return item
+    ref_lower = ref.lower()
     for item in items:
-        if item.get(name_key) and item[name_key].lower() == ref.lower():
+        name = item.get(name_key)
+        if name and name.lower() == ref_lower:
             return item
     return None
 
@@ -118,11 +118,7 @@ class DXClient(BaseClient):
     def get_regions(self) -> list[str]:
         # Fetch all enabled regions
         try:
-            # Try using the session's configured region first
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -134,7 +130,7 @@ class DXClient(BaseClient):
     def _scan_region(self, region: str) -> list[dict]:
         connections = []
         try:
-            dx = self.session.client("directconnect", region_name=region)
+            dx = self.client("directconnect", region_name=region)
             # Describe connections
             resp = dx.describe_connections()
             for conn in resp.get("connections", []):
@@ -199,7 +195,7 @@ class DXClient(BaseClient):
         )
 
     def get_connection_detail(self, connection_id: str, region: str) -> dict:
-        dx = self.session.client("directconnect", region_name=region)
+        dx = self.client("directconnect", region_name=region)
 
         # Get Connection
         conn_resp = dx.describe_connections(connectionId=connection_id)
@@ -417,8 +413,10 @@ def resolve_item(
     for item in items:
         if item.get(id_key) == ref:
             return item
+    ref_lower = ref.lower()
     for item in items:
-        if item.get(name_key) and item[name_key].lower() == ref.lower():
+        name = item.get(name_key)
+        if name and name.lower() == ref_lower:
             return item
     return None
 
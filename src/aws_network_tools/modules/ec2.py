@@ -18,13 +18,7 @@ class EC2Client(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            ec2 = self.client(
-                "ec2", region_name=self.session.region_name or "us-east-1"
-            )
-            return [
-                r["RegionName"]
-                for r in ec2.describe_regions(AllRegions=False)["Regions"]
-            ]
+            return self.enabled_regions()
         except Exception as e:
             logger.warning(
                 "describe_regions failed (region=%s): %s", self.session.region_name, e
@@ -39,7 +33,7 @@ class EC2Client(BaseClient):
         try:
             ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_instances")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                 for res in page.get("Reservations", []):
                     for i in res.get("Instances", []):
                         tags = i.get("Tags", [])
@@ -1,6 +1,7 @@
 """ELB module for Application and Network Load Balancers"""
 
 import concurrent.futures
+import logging
 from typing import Optional, Dict, List
 import boto3
 from rich.table import Table
@@ -16,6 +17,7 @@ from ..core import (
 )
 
 cache = Cache("elb")
+logger = logging.getLogger("aws_network_tools.elb")
 
 
 class ELBModule(ModuleInterface):
@@ -90,10 +92,7 @@ class ELBClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -102,9 +101,9 @@ class ELBClient(BaseClient):
     def _scan_region(self, region: str) -> list[dict]:
         elbs = []
         try:
-            client = self.session.client("elbv2", region_name=region)
+            client = self.client("elbv2", region_name=region)
             paginator = client.get_paginator("describe_load_balancers")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 400}):
                 for lb in page["LoadBalancers"]:
                     elbs.append(
                         {
@@ -144,14 +143,12 @@ class ELBClient(BaseClient):
         Returns:
             List of listener dictionaries
         """
-        client = self.session.client("elbv2", region_name=region)
+        client = self.client("elbv2", region_name=region)
         try:
             resp = client.describe_listeners(LoadBalancerArn=elb_arn)
             return resp.get("Listeners", [])
         except Exception as e:
-            import logging
-
-            logging.warning(f"Failed to get listeners for {elb_arn}: {e}")
+            logger.warning("Failed to get listeners for %s: %s", elb_arn, e)
             return []
 
     def get_target_groups(self, elb_arn: str, region: str) -> list[dict]:
@@ -164,7 +161,7 @@ class ELBClient(BaseClient):
         Returns:
             List of target group dictionaries
         """
-        client = self.session.client("elbv2", region_name=region)
+        client = self.client("elbv2", region_name=region)
         try:
             # Get listeners first to find target groups
             listeners = self.get_listeners(elb_arn, region)
@@ -182,9 +179,7 @@ class ELBClient(BaseClient):
                 return resp.get("TargetGroups", [])
             return []
         except Exception as e:
-            import logging
-
-            logging.warning(f"Failed to get target groups for {elb_arn}: {e}")
+            logger.warning("Failed to get target groups for %s: %s", elb_arn, e)
             return []
 
     def get_target_health(self, tg_arns: list[str], region: str) -> dict:
@@ -197,7 +192,7 @@ class ELBClient(BaseClient):
         Returns:
             Dict mapping target group ARN to list of health descriptions
         """
-        client = self.session.client("elbv2", region_name=region)
+        client = self.client("elbv2", region_name=region)
         health_status = {}
 
         for tg_arn in tg_arns:
@@ -205,15 +200,13 @@ class ELBClient(BaseClient):
                 resp = client.describe_target_health(TargetGroupArn=tg_arn)
                 health_status[tg_arn] = resp.get("TargetHealthDescriptions", [])
             except Exception as e:
-                import logging
-
-                logging.warning(f"Failed to get health for {tg_arn}: {e}")
+                logger.warning("Failed to get health for %s: %s", tg_arn, e)
                 health_status[tg_arn] = []
 
         return health_status
 
     def get_elb_detail(self, elb_arn: str, region: str) -> dict:
-        client = self.session.client("elbv2", region_name=region)
+        client = self.client("elbv2", region_name=region)
 
         # Get basic info
         resp = client.describe_load_balancers(LoadBalancerArns=[elb_arn])
@@ -334,11 +327,7 @@ class ELBClient(BaseClient):
                 detail["listeners"].append(listener_data)
         except Exception as e:
             # Issue #10: Log error but don't abort - continue to return what we have
-            import logging
-
-            logging.getLogger(__name__).warning(
-                f"Error fetching listeners for {elb_arn}: {e}"
-            )
+            logger.warning("Error fetching listeners for %s: %s", elb_arn, e)
 
         # Issue #10: If no listeners found, still try to get target groups from ARN patterns
         # Some load balancers have target groups but listeners aren't attached
@@ -1,5 +1,6 @@
 """Elastic Network Interface (ENI) module"""
 
+from sys import intern
 from typing import Optional, Dict, List, Any
 import boto3
 from rich.table import Table
@@ -49,12 +50,7 @@ class ENIClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            return [
-                r["RegionName"]
-                for r in ec2.describe_regions(AllRegions=False)["Regions"]
-            ]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -62,10 +58,12 @@ class ENIClient(BaseClient):
 
     def _scan_region(self, region: str) -> list[dict]:
         enis = []
+        region = intern(region)
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_network_interfaces")
-            for page in paginator.paginate():
+            # Largest page the API allows: fewer round-trips on big accounts
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                 for eni in page["NetworkInterfaces"]:
                     # Determine what it's attached to
                     attachment = eni.get("Attachment", {})
@@ -97,14 +95,15 @@ class ENIClient(BaseClient):
                         {
                             "id": eni["NetworkInterfaceId"],
                             "name": name,
+                            # Low-cardinality values: one shared string each
                             "region": region,
-                            "status": eni["Status"],
-                            "type": eni["InterfaceType"],
+                            "status": intern(eni["Status"]),
+                            "type": intern(eni["InterfaceType"]),
                             "private_ip": eni.get("PrivateIpAddress"),
                             "public_ip": eni.get("Association", {}).get("PublicIp"),
                             "mac": eni.get("MacAddress"),
-                            "subnet_id": eni["SubnetId"],
-                            "vpc_id": eni["VpcId"],
+                            "subnet_id": intern(eni["SubnetId"]),
+                            "vpc_id": intern(eni["VpcId"]),
                             "attached_to": attached_to,
                             "security_groups": [
                                 sg["GroupId"] for sg in eni.get("Groups", [])
@@ -122,7 +121,10 @@ class ENIClient(BaseClient):
         import concurrent.futures
 
         all_enis = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        # One worker per region, capped at the client's max_workers
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(regions), self.max_workers))
+        ) as executor:
             futures = {executor.submit(self._scan_region, r): r for r in regions}
             for future in concurrent.futures.as_completed(futures):
                 all_enis.extend(future.result())
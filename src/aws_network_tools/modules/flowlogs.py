@@ -1,5 +1,6 @@
 """VPC Flow Logs monitoring module"""
 
+import random
 import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -12,6 +13,39 @@ from ..core import Cache, BaseDisplay, BaseClient, ModuleInterface, run_with_spi
 
 cache = Cache("flowlogs")
 
+# Poll delay doubles from the first value up to the cap (plus jitter);
+# queries still running after the budget are stopped
+POLL_INITIAL_DELAY = 0.2
+POLL_MAX_DELAY = 2.0
+POLL_BUDGET = 60.0  # seconds
+
+# find_log_group lookups, keyed by (profile, resource id): ENI -> (subnet,
+# VPC), and flow-log resource (ENI/subnet/VPC) -> log group. Misses are not
+# cached, so newly created flow logs are still found; clear_flow_log_cache()
+# drops the rest on refresh, clear-cache and profile/region changes.
+FLOW_LOG_CACHE_SIZE = 256
+_eni_scopes: dict[tuple[Optional[str], str], tuple[str, str]] = {}
+_scope_log_groups: dict[tuple[Optional[str], str], str] = {}
+
+
+def _remember(lookups: dict, key: tuple, value: Any) -> None:
+    """Store a lookup, dropping the oldest entries past FLOW_LOG_CACHE_SIZE."""
+    lookups[key] = value
+    while len(lookups) > FLOW_LOG_CACHE_SIZE:
+        del lookups[next(iter(lookups))]
+
+
+def _forget_log_group(log_group: str) -> None:
+    """Drop cached lookups that point at a log group that no longer exists."""
+    for key in [k for k, v in _scope_log_groups.items() if v == log_group]:
+        _scope_log_groups.pop(key, None)
+
+
+def clear_flow_log_cache() -> None:
+    """Forget every cached ENI scope and log group lookup."""
+    _eni_scopes.clear()
+    _scope_log_groups.clear()
+
 
 class FlowLogsModule(ModuleInterface):
     @property
@@ -106,20 +140,32 @@ class FlowLogsClient(BaseClient):
 
     def find_log_group(self, eni_id: str) -> Optional[str]:
         # Try to find flow logs attached to ENI, Subnet, or VPC
-        ec2 = self.session.client("ec2")
+        ec2 = None
         try:
-            # Get ENI details to find Subnet/VPC
-            eni = ec2.describe_network_interfaces(NetworkInterfaceIds=[eni_id])[
-                "NetworkInterfaces"
-            ][0]
-            vpc_id = eni["VpcId"]
-            subnet_id = eni["SubnetId"]
+            # Get ENI details to find Subnet/VPC (fixed for the ENI's lifetime)
+            scope = _eni_scopes.get((self.profile, eni_id))
+            if scope is None:
+                ec2 = self.client("ec2")
+                eni = ec2.describe_network_interfaces(NetworkInterfaceIds=[eni_id])[
+                    "NetworkInterfaces"
+                ][0]
+                scope = (eni["SubnetId"], eni["VpcId"])
+                _remember(_eni_scopes, (self.profile, eni_id), scope)
+            resource_ids = [eni_id, *scope]
+
+            # A log group already found on this ENI, its subnet or its VPC
+            # covers it too, so no need to describe flow logs again
+            for resource_id in resource_ids:
+                log_group = _scope_log_groups.get((self.profile, resource_id))
+                if log_group:
+                    return log_group
 
             # Check for Flow Logs
             # We look for ANY flow log that covers this resource and sends to CloudWatch
+            ec2 = ec2 or self.client("ec2")
             resp = ec2.describe_flow_logs(
                 Filters=[
-                    {"Name": "resource-id", "Values": [eni_id, subnet_id, vpc_id]},
+                    {"Name": "resource-id", "Values": resource_ids},
                     {"Name": "log-destination-type", "Values": ["cloud-watch-logs"]},
                     {"Name": "traffic-type", "Values": ["ALL", "ACCEPT", "REJECT"]},
                 ]
@@ -127,41 +173,69 @@ class FlowLogsClient(BaseClient):
 
             if resp["FlowLogs"]:
                 # Return the first one found
-                return resp["FlowLogs"][0]["LogGroupName"]
+                flow_log = resp["FlowLogs"][0]
+                log_group = flow_log["LogGroupName"]
+                _remember(
+                    _scope_log_groups, (self.profile, flow_log["ResourceId"]), log_group
+                )
+                return log_group
 
             return None
         except Exception:
             return None
 
     def _execute_query(self, cw, log_group, query, start_time, end_time):
-        start_resp = cw.start_query(
-            logGroupName=log_group,
-            startTime=start_time,
-            endTime=end_time,
-            queryString=query,
-        )
-        query_id = start_resp["queryId"]
+        return self._execute_queries(cw, log_group, [query], start_time, end_time)[0]
 
-        # Wait for results
+    def _execute_queries(self, cw, log_group, queries, start_time, end_time):
+        """Run Logs Insights queries side by side; results in query order."""
+        # Start every query before polling so they run concurrently server-side
+        try:
+            pending = {
+                i: cw.start_query(
+                    logGroupName=log_group,
+                    startTime=start_time,
+                    endTime=end_time,
+                    queryString=query,
+                )["queryId"]
+                for i, query in enumerate(queries)
+            }
+        except cw.exceptions.ResourceNotFoundException:
+            # Log group deleted since it was found: look it up afresh next time
+            _forget_log_group(log_group)
+            raise
+        results: list[list[dict]] = [[] for _ in queries]
+
+        # Wait for results, backing off between rounds
+        deadline = time.monotonic() + POLL_BUDGET
+        delay = POLL_INITIAL_DELAY
         while True:
-            resp = cw.get_query_results(queryId=query_id)
-            status = resp["status"]
-            if status in ["Complete", "Failed", "Cancelled"]:
-                break
-            time.sleep(0.5)
-
-        if status != "Complete":
-            return []
-
-        # Parse results
-        parsed = []
-        for row in resp["results"]:
-            item = {field["field"]: field["value"] for field in row}
-            parsed.append(item)
-        return parsed
+            for i, query_id in list(pending.items()):
+                resp = cw.get_query_results(queryId=query_id)
+                status = resp["status"]
+                if status not in ["Complete", "Failed", "Cancelled"]:
+                    continue
+                del pending[i]
+                if status == "Complete":
+                    # Parse results
+                    results[i] = [
+                        {field["field"]: field["value"] for field in row}
+                        for row in resp["results"]
+                    ]
+            if not pending:
+                return results
+            if time.monotonic() >= deadline:
+                for query_id in pending.values():
+                    try:
+                        cw.stop_query(queryId=query_id)
+                    except Exception:
+                        pass
+                return results
+            time.sleep(delay + random.uniform(0, 0.1))
+            delay = min(POLL_MAX_DELAY, delay * 2)
 
     def query_flow_logs(self, log_group: str, eni_id: str, minutes: int) -> list[dict]:
-        cw = self.session.client("logs")
+        cw = self.client("logs")
         try:
             query = f"""
                 fields @timestamp, srcAddr, dstAddr, srcPort, dstPort, protocol, action, bytes
@@ -182,7 +256,7 @@ class FlowLogsClient(BaseClient):
     def analyze_traffic(
         self, log_group: str, eni_id: str, minutes: int
     ) -> Dict[str, Any]:
-        cw = self.session.client("logs")
+        cw = self.client("logs")
         start_time = int((datetime.now() - timedelta(minutes=minutes)).timestamp())
         end_time = int(datetime.now().timestamp())
 
@@ -194,17 +268,18 @@ class FlowLogsClient(BaseClient):
                 | sort total_bytes desc
                 | limit 10
             """
-            top_talkers = self._execute_query(
-                cw, log_group, query_talkers, start_time, end_time
-            )
 
             # 2. Rejections
             query_rejections = f"""
                 filter interfaceId = "{eni_id}" and action = "REJECT"
                 | stats count(*) as rejection_count
             """
-            rejections_data = self._execute_query(
-                cw, log_group, query_rejections, start_time, end_time
+            top_talkers, rejections_data = self._execute_queries(
+                cw,
+                log_group,
+                [query_talkers, query_rejections],
+                start_time,
+                end_time,
             )
             rejection_count = (
                 int(rejections_data[0]["rejection_count"]) if rejections_data else 0
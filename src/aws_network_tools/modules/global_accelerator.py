@@ -21,7 +21,7 @@ class GlobalAcceleratorClient(BaseClient):
         accelerators = []
         try:
             # GA API is only available in us-west-2
-            ga = self.session.client("globalaccelerator", region_name="us-west-2")
+            ga = self.client("globalaccelerator", region_name="us-west-2")
 
             paginator = ga.get_paginator("list_accelerators")
             for page in paginator.paginate():
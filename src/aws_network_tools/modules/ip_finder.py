@@ -4,19 +4,24 @@ import concurrent.futures
 from typing import Optional
 import boto3
 
+from ..core.base import get_session
 
-def find_ip(ip: str, profile: Optional[str] = None) -> Optional[dict]:
-    """Find ENI by IP address across all regions."""
-    session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+
+def find_ip(
+    ip: str, profile: Optional[str] = None, regions: Optional[list[str]] = None
+) -> Optional[dict]:
+    """Find ENI by IP address across regions (all enabled regions by default)."""
+    session = get_session(profile)
     config = boto3.session.Config(
         connect_timeout=5, read_timeout=10, retries={"max_attempts": 2}
     )
 
     # Get regions
-    ec2 = session.client("ec2", region_name="us-east-1", config=config)
-    regions = [
-        r["RegionName"] for r in ec2.describe_regions(AllRegions=False)["Regions"]
-    ]
+    if not regions:
+        ec2 = session.client("ec2", region_name="us-east-1", config=config)
+        regions = [
+            r["RegionName"] for r in ec2.describe_regions(AllRegions=False)["Regions"]
+        ]
 
     result = None
 
@@ -61,7 +66,9 @@ def find_ip(ip: str, profile: Optional[str] = None) -> Optional[dict]:
             pass
         return None
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=15) as ex:
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(15, len(regions)))
+    ) as ex:
         futures = {ex.submit(search_region, r): r for r in regions}
         for future in concurrent.futures.as_completed(futures):
             res = future.result()
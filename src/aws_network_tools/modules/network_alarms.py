@@ -39,10 +39,7 @@ class NetworkAlarmsClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
@@ -72,7 +69,7 @@ class NetworkAlarmsClient(BaseClient):
     def _scan_region(self, region: str) -> dict:
         data = {"region": region, "alarms": [], "metric_alarms": []}
         try:
-            cw = self.session.client("cloudwatch", region_name=region)
+            cw = self.client("cloudwatch", region_name=region)
 
             # Get all alarms and filter for network-related ones
             paginator = cw.get_paginator("describe_alarms")
@@ -147,7 +144,7 @@ class NetworkAlarmsClient(BaseClient):
     ) -> List[dict]:
         """Get alarm state history"""
         try:
-            cw = self.session.client("cloudwatch", region_name=region)
+            cw = self.client("cloudwatch", region_name=region)
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(hours=hours)
 
@@ -61,7 +61,7 @@ class OrgClient(BaseClient):
 
     def get_organization(self) -> dict:
         """Get organization details"""
-        org_client = self.session.client("organizations")
+        org_client = self.client("organizations")
         try:
             resp = org_client.describe_organization()
             return resp["Organization"]
@@ -72,7 +72,7 @@ class OrgClient(BaseClient):
 
     def list_accounts(self) -> List[dict]:
         """List all accounts in the organization"""
-        org_client = self.session.client("organizations")
+        org_client = self.client("organizations")
         accounts = []
         try:
             paginator = org_client.get_paginator("list_accounts")
@@ -19,10 +19,7 @@ class PeeringClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
@@ -32,10 +29,10 @@ class PeeringClient(BaseClient):
     def _scan_region(self, region: str) -> List[dict]:
         peerings = []
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_vpc_peering_connections")
 
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                 for pcx in page.get("VpcPeeringConnections", []):
                     status = pcx.get("Status", {})
                     requester = pcx.get("RequesterVpcInfo", {})
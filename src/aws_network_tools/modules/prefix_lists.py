@@ -19,20 +19,17 @@ class PrefixListClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
     def _scan_region(self, region: str) -> List[dict]:
         prefix_lists = []
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_managed_prefix_lists")
 
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                 for pl in page.get("PrefixLists", []):
                     pl_id = pl["PrefixListId"]
 
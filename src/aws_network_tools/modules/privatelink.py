@@ -19,24 +19,21 @@ class PrivateLinkClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
     def _scan_region(self, region: str) -> dict:
         data = {"region": region, "endpoint_services": [], "vpc_endpoints": []}
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region_name=region)
 
             # Get VPC Endpoint Services (services you provide)
             try:
                 paginator = ec2.get_paginator(
                     "describe_vpc_endpoint_service_configurations"
                 )
-                for page in paginator.paginate():
+                for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                     for svc in page.get("ServiceConfigurations", []):
                         # Get endpoint connections
                         connections = []
@@ -104,7 +101,8 @@ class PrivateLinkClient(BaseClient):
                             "Name": "vpc-endpoint-type",
                             "Values": ["Interface", "GatewayLoadBalancer"],
                         }
-                    ]
+                    ],
+                    PaginationConfig={"PageSize": 1000},
                 ):
                     for ep in page.get("VpcEndpoints", []):
                         # Get name from tags
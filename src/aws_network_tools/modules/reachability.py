@@ -1,6 +1,7 @@
 """Reachability Analyzer module"""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 import boto3
 from rich.tree import Tree
@@ -39,9 +40,16 @@ class ReachabilityModule(ModuleInterface):
 
             self._run_trace(shell, source, dest, protocol, port)
 
-    def _resolve_if_ip(self, shell, target: str) -> Optional[str]:
+    @staticmethod
+    def _is_ip(target: str) -> bool:
         # Simple heuristic: if it looks like an IP (contains dots), try to resolve
-        if "." in target and not target.startswith("eni-"):
+        return "." in target and not target.startswith("eni-")
+
+    def _resolve_targets(self, shell, *targets: str) -> list[Optional[str]]:
+        """Resource IDs for the targets, resolving IPs to ENIs concurrently."""
+        ips = [t for t in dict.fromkeys(targets) if self._is_ip(t)]
+        resolved: dict[str, Optional[str]] = {}
+        if ips:
             resolver = IpResolver(shell.profile)
             # Use shell regions if set, otherwise default to list including common ones or let resolver handle it
             # The shell.regions might be empty (all regions implied) or specific.
@@ -52,27 +60,26 @@ class ReachabilityModule(ModuleInterface):
                 else ["us-east-1", "eu-west-1", "eu-west-2", "us-west-2"]
             )
 
-            resolved_id = run_with_spinner(
-                lambda: resolver.resolve_ip(target, regions),
-                f"Resolving IP {target}",
-                console=shell.console,
+            def resolve_all() -> list[Optional[str]]:
+                with ThreadPoolExecutor(max_workers=len(ips)) as pool:
+                    return list(pool.map(lambda ip: resolver.resolve_ip(ip, regions), ips))
+
+            eni_ids = run_with_spinner(
+                resolve_all, f"Resolving IP {', '.join(ips)}", console=shell.console
             )
+            resolved = dict(zip(ips, eni_ids))
 
-            if resolved_id:
-                shell.console.print(f"[green]Resolved {target} to {resolved_id}[/]")
-                return resolved_id
-            else:
-                shell.console.print(f"[red]Could not resolve IP {target} to an ENI.[/]")
-                return None
+            for ip in ips:
+                if resolved[ip]:
+                    shell.console.print(f"[green]Resolved {ip} to {resolved[ip]}[/]")
+                else:
+                    shell.console.print(f"[red]Could not resolve IP {ip} to an ENI.[/]")
+        return [resolved[t] if t in resolved else t for t in targets]
 
     def _run_trace(self, shell, source, dest, protocol, port):
-        # Resolve IPs if necessary
-        source_id = self._resolve_if_ip(shell, source)
-        if not source_id:
-            return
-
-        dest_id = self._resolve_if_ip(shell, dest)
-        if not dest_id:
+        # Resolve IPs if necessary (source and destination together)
+        source_id, dest_id = self._resolve_targets(shell, source, dest)
+        if not source_id or not dest_id:
             return
 
         client = ReachabilityClient(shell.profile)
@@ -126,7 +133,8 @@ class ReachabilityClient(BaseClient):
         return self.session.region_name or "us-east-1"
 
     def create_path(self, source: str, dest: str, protocol: str, port: int) -> str:
-        ec2 = self.session.client("ec2")  # Uses default region from profile/config
+        # Default region from profile/config; one client for all three steps
+        ec2 = self.client("ec2")
 
         try:
             resp = ec2.create_network_insights_path(
@@ -148,7 +156,7 @@ class ReachabilityClient(BaseClient):
             raise Exception(f"Failed to create path: {e}")
 
     def start_analysis(self, path_id: str) -> str:
-        ec2 = self.session.client("ec2")
+        ec2 = self.client("ec2")
         try:
             resp = ec2.start_network_insights_analysis(
                 NetworkInsightsPathId=path_id,
@@ -164,7 +172,7 @@ class ReachabilityClient(BaseClient):
             raise Exception(f"Failed to start analysis: {e}")
 
     def wait_for_analysis(self, analysis_id: str) -> Optional[dict]:
-        ec2 = self.session.client("ec2")
+        ec2 = self.client("ec2")
         while True:
             resp = ec2.describe_network_insights_analyses(
                 NetworkInsightsAnalysisIds=[analysis_id]
@@ -19,22 +19,19 @@ class Route53ResolverClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception:
             return [self.session.region_name] if self.session.region_name else []
 
     def _scan_region(self, region: str) -> dict:
         data = {"region": region, "endpoints": [], "rules": [], "query_log_configs": []}
         try:
-            r53r = self.session.client("route53resolver", region_name=region)
+            r53r = self.client("route53resolver", region_name=region)
 
             # Get resolver endpoints
             try:
                 paginator = r53r.get_paginator("list_resolver_endpoints")
-                for page in paginator.paginate():
+                for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                     for ep in page.get("ResolverEndpoints", []):
                         ip_addresses = []
                         try:
@@ -69,7 +66,7 @@ class Route53ResolverClient(BaseClient):
             # Get resolver rules
             try:
                 paginator = r53r.get_paginator("list_resolver_rules")
-                for page in paginator.paginate():
+                for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                     for rule in page.get("ResolverRules", []):
                         # Get associated VPCs
                         assoc_vpcs = []
@@ -107,7 +104,7 @@ class Route53ResolverClient(BaseClient):
             # Get query log configs
             try:
                 paginator = r53r.get_paginator("list_resolver_query_log_configs")
-                for page in paginator.paginate():
+                for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                     for cfg in page.get("ResolverQueryLogConfigs", []):
                         data["query_log_configs"].append(
                             {
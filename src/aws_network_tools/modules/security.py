@@ -125,10 +125,7 @@ class SecurityClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception as e:
             logger.warning(
                 "describe_regions failed (region=%s): %s", self.session.region_name, e
@@ -243,7 +240,7 @@ class SecurityClient(BaseClient):
         try:
             ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_security_groups")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                 for sg in page.get("SecurityGroups", []):
                     name = next(
                         (t["Value"] for t in sg.get("Tags", []) if t["Key"] == "Name"),
@@ -267,7 +264,7 @@ class SecurityClient(BaseClient):
         try:
             ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_network_interfaces")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
                 for eni in page.get("NetworkInterfaces", []):
                     groups = [
                         g.get("GroupId")
@@ -296,7 +293,7 @@ class SecurityClient(BaseClient):
         try:
             ec2 = self.client("ec2", region_name=region)
             paginator = ec2.get_paginator("describe_network_acls")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
                 for nacl in page.get("NetworkAcls", []):
                     if self._has_ephemeral_issue(nacl):
                         name = next(
@@ -1,20 +1,88 @@
 """Transit Gateway module"""
 
 import concurrent.futures
+import csv
+import hashlib
+import heapq
 import logging
+from dataclasses import dataclass
 from typing import Optional, Dict, List
 import boto3
+from botocore.config import Config
 from rich.table import Table
 from rich.tree import Tree
 from rich.text import Text
 from thefuzz import fuzz
 
-from ..core import Cache, BaseDisplay, BaseClient, ModuleInterface, Context
+from ..core import Cache, BaseDisplay, BaseClient, ModuleInterface, Context, Record
+from ..core.base import DEFAULT_BOTO_CONFIG
+from ..core.cache import CACHE_DIR
+from ..config import RuntimeConfig
 
 logger = logging.getLogger("aws_network_tools.tgw")
 
 cache = Cache("tgw")
 
+# Raw discover() results, one cache file per account/profile/regions key
+# (see TGWClient.discover)
+DISCOVERY_NAMESPACE = "tgw_discovery"
+DISCOVERY_TTL = 300  # 5 minutes
+
+
+def discovery_cache(key: str) -> Cache:
+    """The discover() cache entry for one account/profile/regions key"""
+    return Cache(f"{DISCOVERY_NAMESPACE}-{key}")
+
+
+def clear_discovery_cache() -> None:
+    """Remove every cached discover() result"""
+    for path in CACHE_DIR.glob(f"{DISCOVERY_NAMESPACE}*.json"):
+        path.unlink(missing_ok=True)
+
+
+# Regional scans issue many TGW calls over one client, so it needs a larger
+# connection pool; retries come from DEFAULT_BOTO_CONFIG.
+TGW_BOTO_CONFIG = DEFAULT_BOTO_CONFIG.merge(Config(max_pool_connections=32))
+# Route tables of one TGW whose details are fetched at the same time
+RT_DETAIL_WORKERS = 8
+
+
+@dataclass(slots=True)
+class TGWRoute(Record):
+    """Route entry in a TGW route table"""
+
+    prefix: str
+    target: str
+    target_type: str
+    state: str
+    type: str
+
+
+@dataclass(slots=True)
+class TGWAttachment(Record):
+    """Attachment on a Transit Gateway"""
+
+    id: str
+    name: Optional[str]
+    type: str
+    resource_id: str
+    state: str
+
+
+@dataclass(slots=True)
+class TGWAssociation(Record):
+    """Attachment associated with a TGW route table"""
+
+    id: Optional[str]
+    resource_id: Optional[str]
+    type: Optional[str]
+    state: Optional[str]
+
+
+@dataclass(slots=True)
+class TGWPropagation(TGWAssociation):
+    """Attachment propagating routes into a TGW route table"""
+
 
 class TGWModule(ModuleInterface):
     @property
@@ -69,12 +137,7 @@ class TGWClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            return [
-                r["RegionName"]
-                for r in ec2.describe_regions(AllRegions=False)["Regions"]
-            ]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -83,7 +146,7 @@ class TGWClient(BaseClient):
     def _scan_region(self, region: str) -> list[dict]:
         tgws = []
         try:
-            ec2 = self.client("ec2", region_name=region)
+            ec2 = self.client("ec2", region, config=TGW_BOTO_CONFIG)
             resp = ec2.describe_transit_gateways()
             for tgw in resp.get("TransitGateways", []):
                 if tgw["State"] != "available":
@@ -115,104 +178,143 @@ class TGWClient(BaseClient):
                             None,
                         )
                         tgw_data["attachments"].append(
-                            {
-                                "id": att["TransitGatewayAttachmentId"],
-                                "name": att_name,
-                                "type": att["ResourceType"],
-                                "resource_id": att.get("ResourceId", "N/A"),
-                                "state": att.get("State", ""),
-                            }
+                            TGWAttachment(
+                                att["TransitGatewayAttachmentId"],
+                                att_name,
+                                att["ResourceType"],
+                                att.get("ResourceId", "N/A"),
+                                att.get("State", ""),
+                            )
                         )
 
                 rt_resp = ec2.describe_transit_gateway_route_tables(
                     Filters=[{"Name": "transit-gateway-id", "Values": [tgw_id]}]
                 )
-                for rt in rt_resp.get("TransitGatewayRouteTables", []):
-                    rt_id = rt["TransitGatewayRouteTableId"]
-                    rt_name = next(
-                        (t["Value"] for t in rt.get("Tags", []) if t["Key"] == "Name"),
-                        None,
-                    )
-                    rt_data = {
-                        "id": rt_id,
-                        "name": rt_name,
-                        "routes": [],
-                        "associations": [],
-                        "propagations": [],
-                    }
-
-                    # Fetch Associations
-                    try:
-                        assoc_resp = ec2.get_transit_gateway_route_table_associations(
-                            TransitGatewayRouteTableId=rt_id
-                        )
-                        for assoc in assoc_resp.get("Associations", []):
-                            rt_data["associations"].append(
-                                {
-                                    "id": assoc.get("TransitGatewayAttachmentId"),
-                                    "resource_id": assoc.get("ResourceId"),
-                                    "type": assoc.get("ResourceType"),
-                                    "state": assoc.get("State"),
-                                }
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to fetch associations for RT %s: %s", rt_id, e
+                rts = rt_resp.get("TransitGatewayRouteTables", [])
+                # Each table needs three more calls; fetch tables concurrently
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(1, min(len(rts), RT_DETAIL_WORKERS))
+                ) as executor:
+                    tgw_data["route_tables"] = list(
+                        executor.map(
+                            lambda rt: self._route_table_details(ec2, rt), rts
                         )
+                    )
+                tgws.append(tgw_data)
+        except Exception as e:
+            logger.warning("Failed to discover TGW in %s: %s", region, e)
+        return tgws
 
-                    # Fetch Propagations
-                    try:
-                        prop_resp = ec2.get_transit_gateway_route_table_propagations(
-                            TransitGatewayRouteTableId=rt_id
-                        )
-                        for prop in prop_resp.get(
-                            "TransitGatewayRouteTablePropagations", []
-                        ):
-                            rt_data["propagations"].append(
-                                {
-                                    "id": prop.get("TransitGatewayAttachmentId"),
-                                    "resource_id": prop.get("ResourceId"),
-                                    "type": prop.get("ResourceType"),
-                                    "state": prop.get("State"),
-                                }
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to fetch propagations for RT %s: %s", rt_id, e
-                        )
+    def _route_table_details(self, ec2, rt: dict) -> dict:
+        """Associations, propagations and routes for one TGW route table."""
+        rt_id = rt["TransitGatewayRouteTableId"]
+        rt_name = next(
+            (t["Value"] for t in rt.get("Tags", []) if t["Key"] == "Name"),
+            None,
+        )
+        rt_data = {
+            "id": rt_id,
+            "name": rt_name,
+            "routes": [],
+            "associations": [],
+            "propagations": [],
+        }
 
-                    routes_resp = ec2.search_transit_gateway_routes(
-                        TransitGatewayRouteTableId=rt_id,
-                        Filters=[{"Name": "state", "Values": ["active", "blackhole"]}],
+        # Fetch Associations
+        try:
+            paginator = ec2.get_paginator(
+                "get_transit_gateway_route_table_associations"
+            )
+            for page in paginator.paginate(
+                TransitGatewayRouteTableId=rt_id, PaginationConfig={"PageSize": 1000}
+            ):
+                for assoc in page.get("Associations", []):
+                    rt_data["associations"].append(
+                        TGWAssociation(
+                            assoc.get("TransitGatewayAttachmentId"),
+                            assoc.get("ResourceId"),
+                            assoc.get("ResourceType"),
+                            assoc.get("State"),
+                        )
                     )
-                    for route in routes_resp.get("Routes", []):
-                        cidr = route.get("DestinationCidrBlock", "N/A")
-                        state = route.get("State", "unknown")
-                        route_type = route.get("Type", "unknown")
-                        target, target_type = "blackhole", "blackhole"
-                        if state != "blackhole" and route.get(
-                            "TransitGatewayAttachments"
-                        ):
-                            att = route["TransitGatewayAttachments"][0]
-                            target = att["TransitGatewayAttachmentId"]
-                            target_type = att.get("ResourceType", "unknown")
-                        rt_data["routes"].append(
-                            {
-                                "prefix": cidr,
-                                "target": target,
-                                "target_type": target_type,
-                                "state": state,
-                                "type": route_type,
-                            }
+        except Exception as e:
+            logger.warning("Failed to fetch associations for RT %s: %s", rt_id, e)
+
+        # Fetch Propagations
+        try:
+            paginator = ec2.get_paginator(
+                "get_transit_gateway_route_table_propagations"
+            )
+            for page in paginator.paginate(
+                TransitGatewayRouteTableId=rt_id, PaginationConfig={"PageSize": 1000}
+            ):
+                for prop in page.get("TransitGatewayRouteTablePropagations", []):
+                    rt_data["propagations"].append(
+                        TGWPropagation(
+                            prop.get("TransitGatewayAttachmentId"),
+                            prop.get("ResourceId"),
+                            prop.get("ResourceType"),
+                            prop.get("State"),
                         )
-                    tgw_data["route_tables"].append(rt_data)
-                tgws.append(tgw_data)
+                    )
         except Exception as e:
-            logger.warning("Failed to discover TGW in %s: %s", region, e)
+            logger.warning("Failed to fetch propagations for RT %s: %s", rt_id, e)
+
+        routes_resp = ec2.search_transit_gateway_routes(
+            TransitGatewayRouteTableId=rt_id,
+            Filters=[{"Name": "state", "Values": ["active", "blackhole"]}],
+        )
+        for route in routes_resp.get("Routes", []):
+            cidr = route.get("DestinationCidrBlock", "N/A")
+            state = route.get("State", "unknown")
+            route_type = route.get("Type", "unknown")
+            target, target_type = "blackhole", "blackhole"
+            if state != "blackhole" and route.get("TransitGatewayAttachments"):
+                att = route["TransitGatewayAttachments"][0]
+                target = att["TransitGatewayAttachmentId"]
+                target_type = att.get("ResourceType", "unknown")
+            rt_data["routes"].append(
+                TGWRoute(cidr, target, target_type, state, route_type)
+            )
+        return rt_data
+
+    def _account_id(self) -> Optional[str]:
+        from ..traceroute.clients import get_account_id
+
+        try:
+            return get_account_id(self.session)  # STS once per session
+        except Exception:
+            return None
+
+    def _discovery_key(self, account_id: Optional[str], regions: list[str]) -> str:
+        raw = f"{account_id}|{self.profile or 'default'}|{'|'.join(sorted(regions))}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _from_cached(tgws: list[dict]) -> list[dict]:
+        """Rebuild the records of a cached discover() result in place"""
+        for tgw in tgws:
+            tgw["attachments"] = [TGWAttachment(**a) for a in tgw["attachments"]]
+            for rt in tgw["route_tables"]:
+                rt["routes"] = [TGWRoute(**r) for r in rt["routes"]]
+                rt["associations"] = [TGWAssociation(**a) for a in rt["associations"]]
+                rt["propagations"] = [TGWPropagation(**p) for p in rt["propagations"]]
         return tgws
 
     def discover(self, regions: Optional[list[str]] = None) -> list[dict]:
         regions = regions or self.get_regions()
+        use_cache = not RuntimeConfig.is_cache_disabled()
+        if use_cache:
+            account_id = self._account_id()
+            entry = discovery_cache(self._discovery_key(account_id, regions))
+            cached = entry.get(current_account=account_id)
+            if cached is not None:
+                logger.debug("Using cached TGW discovery for %s", regions)
+                try:
+                    return self._from_cached(cached)
+                except (KeyError, TypeError):
+                    pass  # Written by an older version: discover again
+
         all_tgws = []
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=getattr(self, "max_workers", 10)
@@ -220,7 +322,10 @@ class TGWClient(BaseClient):
             futures = {executor.submit(self._scan_region, r): r for r in regions}
             for future in concurrent.futures.as_completed(futures):
                 all_tgws.extend(future.result())
-        return sorted(all_tgws, key=lambda t: (t["region"], t["name"] or t["id"]))
+        all_tgws.sort(key=lambda t: (t["region"], t["name"] or t["id"]))
+        if use_cache:
+            entry.set(all_tgws, ttl_seconds=DISCOVERY_TTL, account_id=account_id)
+        return all_tgws
 
 
 class TGWDisplay(BaseDisplay):
@@ -295,12 +400,22 @@ class TGWDisplay(BaseDisplay):
             self.console.print(rt_table)
 
     def show_prefixes(self, tgws: list[dict]):
+        # Piped/redirected output never shows styling, so skip Rich table layout
+        if not self.console.is_terminal:
+            self._write_plain_prefixes(tgws)
+            return
         for tgw in tgws:
             for rt in tgw.get("route_tables", []):
                 if not rt["routes"]:
                     continue
                 title = f"[bold]{tgw['name'] or tgw['id']}[/] → [cyan]{tgw['region']}[/] → [magenta]{rt['name'] or rt['id']}[/]"
-                table = Table(title=title, show_header=True, header_style="bold")
+                table = Table(
+                    title=title,
+                    show_header=True,
+                    header_style="bold",
+                    pad_edge=False,
+                    collapse_padding=True,
+                )
                 table.add_column("#", style="dim", justify="right")
                 table.add_column("Prefix", style="green", no_wrap=True)
                 table.add_column("Target", style="cyan")
@@ -320,6 +435,39 @@ class TGWDisplay(BaseDisplay):
                 self.console.print(table)
                 self.console.print()
 
+    def _write_plain_prefixes(self, tgws: list[dict]):
+        """Write prefixes as CSV rows without Rich styling"""
+        writer = csv.writer(self.console.file, lineterminator="\n")
+        writer.writerow(
+            (
+                "tgw",
+                "region",
+                "route_table",
+                "prefix",
+                "target",
+                "type",
+                "state",
+                "target_type",
+            )
+        )
+        for tgw in tgws:
+            tgw_label = tgw["name"] or tgw["id"]
+            for rt in tgw.get("route_tables", []):
+                rt_label = rt["name"] or rt["id"]
+                writer.writerows(
+                    (
+                        tgw_label,
+                        tgw["region"],
+                        rt_label,
+                        route["prefix"],
+                        route["target"],
+                        route["type"].upper(),
+                        route["state"],
+                        route["target_type"],
+                    )
+                    for route in rt["routes"]
+                )
+
     def show_route_tables_list(self, tgw: dict):
         """Show list of route tables for a TGW"""
         rts = tgw.get("route_tables", [])
@@ -443,8 +591,10 @@ def resolve_item(
     for item in items:
         if item.get(id_key) == ref:
             return item
+    ref_lower = ref.lower()
     for item in items:
-        if item.get(name_key) and item[name_key].lower() == ref.lower():
+        name = item.get(name_key)
+        if name and name.lower() == ref_lower:
             return item
     return None
 
@@ -456,24 +606,38 @@ def resolve_tgw(tgws: list[dict], ref: str) -> Optional[dict]:
 def search_prefixes(
     tgws: list[dict], query: str, min_score: int = 60, max_results: int = 50
 ) -> list[dict]:
+    q = query.lower()
+    # Fuzzy scores for 1-2 character queries are noise (nearly every prefix
+    # scores high), so short queries only use substring matching.
+    substring_only = len(q) < 3
     matches = []
     for tgw in tgws:
+        tgw_label = tgw["name"] or tgw["id"]
         for rt in tgw.get("route_tables", []):
+            rt_label = f"{tgw_label} → {rt.get('name') or rt['id']}"
             for route in rt["routes"]:
-                score = fuzz.partial_ratio(query.lower(), route["prefix"].lower())
-                if query.lower() in route["prefix"].lower():
-                    score = max(score, 90)
-                if query.lower() == route["prefix"].lower():
-                    score = 100
+                prefix = route["prefix"].lower()
+                if substring_only:
+                    if q not in prefix:
+                        continue
+                    score = 100 if q == prefix else 90
+                else:
+                    score = fuzz.partial_ratio(q, prefix)
+                    if q in prefix:
+                        score = max(score, 90)
+                    if q == prefix:
+                        score = 100
                 if score >= min_score:
                     matches.append(
                         {
                             "prefix": route["prefix"],
                             "target": route["target"],
                             "state": route["state"],
-                            "route_table": f"{tgw['name'] or tgw['id']} → {rt['name'] or rt['id']}",
+                            "route_table": rt_label,
                             "score": score,
                         }
                     )
-    matches.sort(key=lambda m: (-m["score"], m["route_table"]))
-    return matches[:max_results]
+    # Partial selection: O(N log K) instead of sorting every match
+    return heapq.nsmallest(
+        max_results, matches, key=lambda m: (-m["score"], m["route_table"])
+    )
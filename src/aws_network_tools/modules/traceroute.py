@@ -5,6 +5,7 @@ from rich.table import Table
 
 from ..core import ModuleInterface
 from ..traceroute import AWSTraceroute, TopologyDiscovery
+from ..traceroute.topology import complete_ips
 
 
 class TracerouteModule(ModuleInterface):
@@ -66,14 +67,7 @@ class TracerouteModule(ModuleInterface):
         shell.console.print(f"\n[bold]Tracing {src_ip} → {dst_ip}[/]\n")
 
         def on_hop(hop):
-            style = "green" if hop.type == "destination" else "white"
-            if hop.type == "nfg":
-                style = "yellow"
-            elif hop.type == "firewall":
-                style = "red"
-            shell.console.print(
-                f"[dim]{hop.seq}.[/] [{style}]{hop.type:18}[/] {hop.id} [dim]({hop.name})[/] @ {hop.region}"
-            )
+            shell.console.print(hop.markup())
 
         def on_status(msg):
             shell.console.print(f"[dim]  → {msg}[/]")
@@ -110,6 +104,7 @@ class TracerouteModule(ModuleInterface):
         )
         discovery.clear_cache()
         asyncio.run(discovery.discover())
+        self._ip_completions = None
         shell.console.print("[green]Topology cache refreshed[/]")
 
     def _show_cache_info(self, shell):
@@ -143,4 +138,12 @@ class TracerouteModule(ModuleInterface):
         if text.startswith("--"):
             options = ["--skip-stale-check", "--refresh-cache"]
             return [o for o in options if o.startswith(text)]
-        return []
+        # Known IPs from the topology cache, reloaded whenever the cache file
+        # changes and prefix-searched; an empty list is not kept
+        stamp = TopologyDiscovery.cache_stamp()
+        memo = getattr(self, "_ip_completions", None)
+        if memo is None or memo[0] != stamp:
+            ips = TopologyDiscovery.all_ips()
+            self._ip_completions = (stamp, ips) if ips else None
+            return complete_ips(ips, text)
+        return complete_ips(memo[1], text)
@@ -94,11 +94,7 @@ class VPCClient(BaseClient):
     def get_regions(self) -> list[str]:
         # Fetch all enabled regions
         try:
-            # Try using the session's configured region first
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.client("ec2", region_name=region)
-            resp = ec2.describe_regions(AllRegions=False)
-            return [r["RegionName"] for r in resp["Regions"]]
+            return self.enabled_regions()
         except Exception as e:
             logger.warning(
                 "describe_regions failed (region=%s): %s", self.session.region_name, e
@@ -157,7 +153,37 @@ class VPCClient(BaseClient):
 
     def get_vpc_detail(self, vpc_id: str, region: str) -> dict:
         ec2 = self.client("ec2", region_name=region)
-        vpc_resp = ec2.describe_vpcs(VpcIds=[vpc_id])
+        vpc_filter = [{"Name": "vpc-id", "Values": [vpc_id]}]
+        # The describes below are all scoped to this VPC and independent of
+        # one another, so they run side by side instead of back to back
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            calls = {
+                "vpcs": executor.submit(ec2.describe_vpcs, VpcIds=[vpc_id]),
+                "subnets": executor.submit(ec2.describe_subnets, Filters=vpc_filter),
+                "igws": executor.submit(
+                    ec2.describe_internet_gateways,
+                    Filters=[{"Name": "attachment.vpc-id", "Values": [vpc_id]}],
+                ),
+                "nats": executor.submit(
+                    ec2.describe_nat_gateways,
+                    Filters=vpc_filter + [{"Name": "state", "Values": ["available"]}],
+                ),
+                "route_tables": executor.submit(
+                    ec2.describe_route_tables, Filters=vpc_filter
+                ),
+                "security_groups": executor.submit(
+                    ec2.describe_security_groups, Filters=vpc_filter
+                ),
+                "nacls": executor.submit(ec2.describe_network_acls, Filters=vpc_filter),
+                "attachments": executor.submit(
+                    ec2.describe_transit_gateway_vpc_attachments, Filters=vpc_filter
+                ),
+                "endpoints": executor.submit(
+                    ec2.describe_vpc_endpoints, Filters=vpc_filter
+                ),
+            }
+
+        vpc_resp = calls["vpcs"].result()
         if not vpc_resp["Vpcs"]:
             return {}
         vpc = vpc_resp["Vpcs"][0]
@@ -172,9 +198,7 @@ class VPCClient(BaseClient):
             ):
                 cidrs.append(assoc["CidrBlock"])
 
-        subnets_resp = ec2.describe_subnets(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-        )
+        subnets_resp = calls["subnets"].result()
         subnets, azs = [], set()
         for s in subnets_resp.get("Subnets", []):
             azs.add(s["AvailabilityZone"])
@@ -187,20 +211,13 @@ class VPCClient(BaseClient):
                 }
             )
 
-        igw_resp = ec2.describe_internet_gateways(
-            Filters=[{"Name": "attachment.vpc-id", "Values": [vpc_id]}]
-        )
+        igw_resp = calls["igws"].result()
         igws = [
             {"id": i["InternetGatewayId"], "name": self._get_name(i.get("Tags", []))}
             for i in igw_resp.get("InternetGateways", [])
         ]
 
-        nat_resp = ec2.describe_nat_gateways(
-            Filters=[
-                {"Name": "vpc-id", "Values": [vpc_id]},
-                {"Name": "state", "Values": ["available"]},
-            ]
-        )
+        nat_resp = calls["nats"].result()
         nats = [
             {
                 "id": n["NatGatewayId"],
@@ -210,9 +227,7 @@ class VPCClient(BaseClient):
             for n in nat_resp.get("NatGateways", [])
         ]
 
-        rt_resp = ec2.describe_route_tables(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-        )
+        rt_resp = calls["route_tables"].result()
         route_tables = []
         for rt in rt_resp.get("RouteTables", []):
             rt_name = self._get_name(rt.get("Tags", []))
@@ -256,9 +271,7 @@ class VPCClient(BaseClient):
                 }
             )
 
-        sg_resp = ec2.describe_security_groups(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-        )
+        sg_resp = calls["security_groups"].result()
         sgs = []
         for sg in sg_resp.get("SecurityGroups", []):
             ingress, egress = [], []
@@ -332,9 +345,7 @@ class VPCClient(BaseClient):
                 }
             )
 
-        nacl_resp = ec2.describe_network_acls(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-        )
+        nacl_resp = calls["nacls"].result()
         nacls = []
         for nacl in nacl_resp.get("NetworkAcls", []):
             entries = [
@@ -359,9 +370,7 @@ class VPCClient(BaseClient):
 
         attachments = []
         try:
-            tgw_att_resp = ec2.describe_transit_gateway_vpc_attachments(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-            )
+            tgw_att_resp = calls["attachments"].result()
             for att in tgw_att_resp.get("TransitGatewayVpcAttachments", []):
                 if att["State"] in ["available", "pending"]:
                     attachments.append(
@@ -380,9 +389,7 @@ class VPCClient(BaseClient):
 
         endpoints = []
         try:
-            vpce_resp = ec2.describe_vpc_endpoints(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-            )
+            vpce_resp = calls["endpoints"].result()
             for vpce in vpce_resp.get("VpcEndpoints", []):
                 endpoints.append(
                     {
@@ -686,8 +693,10 @@ def resolve_item(
     for item in items:
         if item.get(id_key) == ref:
             return item
+    ref_lower = ref.lower()
     for item in items:
-        if item.get(name_key) and item[name_key].lower() == ref.lower():
+        name = item.get(name_key)
+        if name and name.lower() == ref_lower:
             return item
     return None
 
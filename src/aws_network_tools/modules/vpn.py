@@ -59,12 +59,7 @@ class VPNClient(BaseClient):
 
     def get_regions(self) -> list[str]:
         try:
-            region = self.session.region_name or "us-east-1"
-            ec2 = self.session.client("ec2", region_name=region)
-            return [
-                r["RegionName"]
-                for r in ec2.describe_regions(AllRegions=False)["Regions"]
-            ]
+            return self.enabled_regions()
         except Exception:
             if self.session.region_name:
                 return [self.session.region_name]
@@ -72,7 +67,7 @@ class VPNClient(BaseClient):
 
     def _scan_region(self, region: str) -> list[dict]:
         neighbors = []
-        ec2 = self.session.client("ec2", region_name=region)
+        ec2 = self.client("ec2", region_name=region)
 
         try:
             # 1. Site-to-Site VPNs
@@ -166,7 +161,10 @@ class VPNClient(BaseClient):
         import concurrent.futures
 
         all_neighbors = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        # One worker per region, capped at the client's max_workers
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(regions), self.max_workers))
+        ) as executor:
             futures = {executor.submit(self._scan_region, r): r for r in regions}
             for future in concurrent.futures.as_completed(futures):
                 all_neighbors.extend(future.result())
@@ -184,7 +182,7 @@ class VPNClient(BaseClient):
         def scan(region):
             vpns = []
             try:
-                ec2 = self.session.client("ec2", region_name=region)
+                ec2 = self.client("ec2", region_name=region)
                 resp = ec2.describe_vpn_connections()
                 for v in resp.get("VpnConnections", []):
                     name = next(
@@ -207,14 +205,16 @@ class VPNClient(BaseClient):
                 pass
             return vpns
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(regions), self.max_workers))
+        ) as ex:
             for result in ex.map(scan, regions):
                 all_vpns.extend(result)
         return sorted(all_vpns, key=lambda x: (x["region"], x.get("name") or x["id"]))
 
     def get_vpn_detail(self, vpn_id: str, region: str) -> dict:
         """Get VPN connection details including tunnel status."""
-        ec2 = self.session.client("ec2", region_name=region)
+        ec2 = self.client("ec2", region_name=region)
         resp = ec2.describe_vpn_connections(VpnConnectionIds=[vpn_id])
         if not resp.get("VpnConnections"):
             return {}
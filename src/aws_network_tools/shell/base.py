@@ -1,15 +1,42 @@
 """Base shell class with hierarchy and context management."""
 
 import cmd2
-from typing import Optional
+import functools
+import hashlib
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Hashable, Optional
 from rich.console import Console
 from rich.text import Text
 from dataclasses import dataclass, field
 from ..themes import load_theme
 from ..config import get_config, RuntimeConfig
+from ..core.cache import CACHE_DIR, Cache
+from ..core.records import Record, dump_yaml, json_default
 
 console = Console()
 
+# Show-command caches of recently used profile/region selections are set
+# aside rather than discarded, so switching back is a cache hit
+MAX_STASHED_CONFIGS = 4
+CONFIG_CACHE_TTL = 300  # seconds
+
+# Resource lists that keep an ID/name index for _resolve
+RESOLVE_INDEX_SIZE = 32
+
+# Rendered prompts kept per shell
+PROMPT_MEMO_SIZE = 64
+
+# Prompt abbreviations for context types (others use their first two letters)
+PROMPT_ABBREVIATIONS = {
+    "global-network": "gl",
+    "core-network": "cn",
+    "transit-gateway": "tg",
+    "ec2-instance": "ec",
+}
+
 # Cisco IOS-style command aliases
 ALIASES = {
     "sh": "show",
@@ -202,8 +229,65 @@ HIERARCHY = {
     },
 }
 
+# Frozen copies of each context's option lists for O(1) membership checks;
+# HIERARCHY keeps the ordered lists used for help and completion output
+HIERARCHY_SETS = {
+    ctx: {op: frozenset(opts) for op, opts in ctx_def.items()}
+    for ctx, ctx_def in HIERARCHY.items()
+}
+
+# Sorted view of HIERARCHY for help listings and tab completion
+HIERARCHY_SORTED = {
+    ctx: {op: tuple(sorted(opts)) for op, opts in ctx_def.items()}
+    for ctx, ctx_def in HIERARCHY.items()
+}
 
-@dataclass
+# (verb, option) -> name of the method handling "show <option>"/"set <option>"
+HANDLER_NAMES = {
+    (op, opt): f"_{op}_{opt.replace('-', '_')}"
+    for ctx_def in HIERARCHY.values()
+    for op in ("show", "set")
+    for opt in ctx_def.get(op, ())
+}
+
+
+# Show caches holding per-region resource lists (global services excluded)
+REGIONAL_CACHE_KEYS = frozenset(
+    {
+        "vpcs",
+        "transit_gateways",
+        "firewalls",
+        "dx_connections",
+        "enis",
+        "bgp_neighbors",
+        "elbs",
+        "vpns",
+        "security_groups",
+        "peering_connections",
+        "prefix_lists",
+        "vpc_endpoints",
+        "client_vpn_endpoints",
+        "network_alarms",
+    }
+)
+
+
+def _narrow_cache(cache: dict, regions: list[str]) -> dict:
+    """Regional entries of ``cache`` filtered down to items in ``regions``.
+
+    Only lists under REGIONAL_CACHE_KEYS whose items all carry a ``region``
+    are narrowed; anything else cannot be derived and is left out.
+    """
+    keep = frozenset(regions)
+    narrowed = {}
+    for key, items in cache.items():
+        if key in REGIONAL_CACHE_KEYS and isinstance(items, list):
+            if all(isinstance(i, (dict, Record)) and "region" in i for i in items):
+                narrowed[key] = [i for i in items if i["region"] in keep]
+    return narrowed
+
+
+@dataclass(slots=True)
 class Context:
     """Shell execution context."""
 
@@ -214,6 +298,12 @@ class Context:
     selection_index: int = 0  # The index from the show command (1-based)
 
 
+@functools.lru_cache(maxsize=64)
+def _line_matcher(pattern: str) -> re.Pattern:
+    """Regex matching whole lines that contain pattern, ignoring case."""
+    return re.compile(f"^.*{re.escape(pattern)}.*$", re.IGNORECASE | re.MULTILINE)
+
+
 class AWSNetShellBase(cmd2.Cmd):
     """Base shell with context management and navigation."""
 
@@ -228,6 +318,19 @@ class AWSNetShellBase(cmd2.Cmd):
         self.watch_interval: int = 0
         self.context_stack: list[Context] = []
         self._cache: dict = {}
+        # Show keys being fetched -> Event set once the fetch is done
+        self._inflight: dict[Hashable, threading.Event] = {}
+        self._cache_lock = threading.Lock()
+        # (profile, regions) -> (set-aside time, _cache), oldest first
+        self._config_caches: dict[tuple, tuple[float, dict]] = {}
+        # Rendered listings: key -> (source data, console width, output)
+        self._render_memo: dict = {}
+        # (prompt settings, context stack) -> rendered prompt; cleared on theme change
+        self._prompt_memo: dict[tuple, str] = {}
+        # id(list) -> (list, length, {id: position}, {lowercased name: position})
+        self._resolve_index: dict[int, tuple[list, int, dict, dict]] = {}
+        # (topology cache mtime, sorted IPs) for trace completion
+        self._ip_completions: Optional[tuple[Optional[int], tuple[str, ...]]] = None
 
         # Load theme and config
         self.config = get_config()
@@ -269,6 +372,63 @@ class AWSNetShellBase(cmd2.Cmd):
         RuntimeConfig.set_no_cache(self.no_cache)
         RuntimeConfig.set_output_format(self.output_format)
 
+    def _swap_config_cache(
+        self, old_profile: Optional[str], old_regions: list[str], reason: str
+    ):
+        """Set ``_cache`` aside for the previous profile/regions and restore
+        recent entries for the current ones, instead of clearing it."""
+        from ..modules.flowlogs import clear_flow_log_cache
+
+        clear_flow_log_cache()
+        now = time.monotonic()
+        stash = self._config_caches
+        old_cache = self._cache
+        count = len(old_cache)
+        if count:
+            old_key = (old_profile, tuple(old_regions))
+            stash.pop(old_key, None)
+            stash[old_key] = (now, self._cache)
+        for key in [k for k, (ts, _) in stash.items() if now - ts > CONFIG_CACHE_TTL]:
+            del stash[key]
+        while len(stash) > MAX_STASHED_CONFIGS:
+            del stash[next(iter(stash))]
+
+        restored = stash.pop((self.profile, tuple(self.regions)), None)
+        narrowed = (
+            not restored
+            and count
+            and old_profile == self.profile
+            and old_regions
+            and self.regions
+            and set(self.regions) <= set(old_regions)
+        )
+        if restored:
+            self._cache = restored[1]
+        elif narrowed:
+            self._cache = _narrow_cache(old_cache, self.regions)
+        else:
+            self._cache = {}
+        if count:
+            console.print(f"[dim]Set aside {count} cache entries ({reason})[/]")
+        if restored:
+            console.print(f"[dim]Restored {len(self._cache)} cache entries[/]")
+        elif narrowed and self._cache:
+            console.print(
+                f"[dim]Kept {len(self._cache)} cache entries for the new regions[/]"
+            )
+
+    def _get_session(self):
+        """Get the shared boto3 session for the current profile."""
+        from ..core.base import get_session
+
+        return get_session(self.profile)
+
+    def _get_client(self, service: str, region: str):
+        """Get the boto3 client shared by (profile, service, region)."""
+        from ..core.base import get_client
+
+        return get_client(self.profile, service, region)
+
     @property
     def ctx(self) -> Optional[Context]:
         return self.context_stack[-1] if self.context_stack else None
@@ -285,6 +445,24 @@ class AWSNetShellBase(cmd2.Cmd):
     def hierarchy(self) -> dict:
         return HIERARCHY.get(self.ctx_type, HIERARCHY[None])
 
+    @property
+    def hierarchy_sets(self) -> dict:
+        return HIERARCHY_SETS.get(self.ctx_type, HIERARCHY_SETS[None])
+
+    @property
+    def hierarchy_sorted(self) -> dict:
+        return HIERARCHY_SORTED.get(self.ctx_type, HIERARCHY_SORTED[None])
+
+    def _complete_option(self, verb: str, text: str) -> list[str]:
+        """Show/set options starting with text, by bisecting the sorted tuple."""
+        options = self.hierarchy_sorted.get(verb, ())
+        matches = []
+        for opt in options[bisect_left(options, text) :]:
+            if not opt.startswith(text):
+                break
+            matches.append(opt)
+        return matches
+
     def _update_prompt(self):
         """Update prompt based on context stack and theme."""
         if not self.context_stack:
@@ -296,6 +474,22 @@ class AWSNetShellBase(cmd2.Cmd):
         show_indices = self.config.show_indices()
         max_length = self.config.get_max_length()
 
+        # Entering and leaving contexts revisits the same stacks; reuse their
+        # rendered prompts instead of building and rendering the Text again
+        memo_key = (
+            style,
+            show_indices,
+            max_length,
+            tuple(
+                (ctx.type, ctx.ref, ctx.name, ctx.selection_index)
+                for ctx in self.context_stack
+            ),
+        )
+        prompt = self._prompt_memo.get(memo_key)
+        if prompt is not None:
+            self.prompt = prompt
+            return
+
         prompt_parts = []
 
         for i, ctx in enumerate(self.context_stack):
@@ -303,16 +497,7 @@ class AWSNetShellBase(cmd2.Cmd):
             color = self.theme.get(ctx.type, "white")
 
             # Get abbreviation for context type
-            if ctx.type == "global-network":
-                abbrev = "gl"
-            elif ctx.type == "core-network":
-                abbrev = "cn"
-            elif ctx.type == "transit-gateway":
-                abbrev = "tg"
-            elif ctx.type == "ec2-instance":
-                abbrev = "ec"
-            else:
-                abbrev = ctx.type[:2]
+            abbrev = PROMPT_ABBREVIATIONS.get(ctx.type) or ctx.type[:2]
 
             if style == "short":
                 # Short format: use index number like gl:1, cn:1
@@ -379,12 +564,13 @@ class AWSNetShellBase(cmd2.Cmd):
             prompt_text.append("> ", style=separator_color)
 
         # Render Text to ANSI codes for cmd2
-        from rich.console import Console
-
         render_console = Console(force_terminal=True, color_system="standard")
         with render_console.capture() as capture:
             render_console.print(prompt_text, end="")
         self.prompt = capture.get()
+        if len(self._prompt_memo) >= PROMPT_MEMO_SIZE:
+            self._prompt_memo.clear()
+        self._prompt_memo[memo_key] = self.prompt
 
     def _enter(
         self,
@@ -402,16 +588,30 @@ class AWSNetShellBase(cmd2.Cmd):
 
     def _resolve(self, items: list, val: str) -> Optional[dict]:
         """Resolve a resource by index, ID, or name."""
-        try:
+        # isdecimal() avoids raising and catching ValueError for names and IDs
+        if val.isdecimal():
             idx = int(val)
             if 1 <= idx <= len(items):
                 return items[idx - 1]
-        except ValueError:
-            pass
-        for item in items:
-            if item.get("id") == val or (item.get("name") or "").lower() == val.lower():
-                return item
-        return None
+        by_id, by_name = self._resolve_lookup(items)
+        # First item matching on either field wins, as in a front-to-back scan
+        pos = min(by_id.get(val, len(items)), by_name.get(val.lower(), len(items)))
+        return items[pos] if pos < len(items) else None
+
+    def _resolve_lookup(self, items: list) -> tuple[dict, dict]:
+        """Position indexes by ID and lowercased name, built once per list."""
+        entry = self._resolve_index.get(id(items))
+        if entry is None or entry[0] is not items or entry[1] != len(items):
+            by_id: dict = {}
+            by_name: dict = {}
+            for pos, item in enumerate(items):
+                by_id.setdefault(item.get("id"), pos)
+                by_name.setdefault((item.get("name") or "").lower(), pos)
+            if len(self._resolve_index) >= RESOLVE_INDEX_SIZE:
+                self._resolve_index.clear()
+            entry = (items, len(items), by_id, by_name)
+            self._resolve_index[id(items)] = entry
+        return entry[2], entry[3]
 
     def _set_output_file(self, val):
         """Set output file for saving results."""
@@ -424,7 +624,6 @@ class AWSNetShellBase(cmd2.Cmd):
     def _save_output(self, data, filename: str = None):
         """Save data to file in current output format."""
         import json
-        import yaml
 
         target = filename or getattr(self, "output_file", None)
         if not target:
@@ -432,9 +631,9 @@ class AWSNetShellBase(cmd2.Cmd):
         try:
             with open(target, "w") as f:
                 if self.output_format == "json":
-                    json.dump(data, f, indent=2, default=str)
+                    json.dump(data, f, indent=2, default=json_default)
                 elif self.output_format == "yaml":
-                    yaml.safe_dump(data, f, sort_keys=False)
+                    dump_yaml(data, f)
                 else:
                     f.write(str(data))
             console.print(f"[green]Saved to {target}[/]")
@@ -460,9 +659,34 @@ class AWSNetShellBase(cmd2.Cmd):
         """Clear the screen."""
         console.clear()
 
+    def _disk_cache(self, key: Hashable) -> Optional[Cache]:
+        """On-disk copy of a show cache entry, if cache.persist is enabled."""
+        if self.no_cache or not self.config.get("cache.persist", False):
+            return None
+        ident = repr((self.profile, tuple(self.regions), key)).encode()
+        return Cache(f"shell-{hashlib.sha1(ident).hexdigest()[:16]}")
+
+    def _clear_discovery_cache(self, cache_key: Optional[str] = None):
+        """Clear on-disk discovery caches backing a cache key (all if None)."""
+        from ..modules.flowlogs import clear_flow_log_cache
+
+        # Flow log lookups back no show key; any refresh or clear drops them
+        clear_flow_log_cache()
+        if cache_key in (None, "transit_gateways"):
+            from ..modules import tgw
+
+            tgw.clear_discovery_cache()
+        if cache_key is None:
+            for path in CACHE_DIR.glob("shell-*.json"):
+                path.unlink(missing_ok=True)
+        elif disk := self._disk_cache(cache_key):
+            disk.clear()
+
     def do_clear_cache(self, _):
         """Clear all cached data."""
         self._cache.clear()
+        self._config_caches.clear()
+        self._clear_discovery_cache()
         console.print("[green]Cache cleared[/]")
 
     def do_refresh(self, args):
@@ -494,6 +718,7 @@ class AWSNetShellBase(cmd2.Cmd):
                 console.print("[yellow]No cache to refresh in current context[/]")
                 return
 
+            self._clear_discovery_cache(cache_key)
             if cache_key in self._cache:
                 del self._cache[cache_key]
                 console.print(f"[green]Refreshed {cache_key} cache[/]")
@@ -504,6 +729,8 @@ class AWSNetShellBase(cmd2.Cmd):
             # Clear entire cache
             count = len(self._cache)
             self._cache.clear()
+            self._config_caches.clear()
+            self._clear_discovery_cache()
             console.print(f"[green]Cleared {count} cache entries[/]")
 
         else:
@@ -559,6 +786,7 @@ class AWSNetShellBase(cmd2.Cmd):
 
             cache_key = cache_aliases.get(target, target)
 
+            self._clear_discovery_cache(cache_key)
             if cache_key in self._cache:
                 del self._cache[cache_key]
                 console.print(f"[green]Refreshed {cache_key} cache[/]")
@@ -571,15 +799,19 @@ class AWSNetShellBase(cmd2.Cmd):
 
     def precmd(self, line: cmd2.Statement) -> cmd2.Statement:
         """Expand aliases before command execution."""
-        raw = str(line).strip()
-        if not raw:
+        if not line.command:
+            if not str(line).strip():
+                return line
+            # A Statement built from a bare string has no parsed command word
+            line = self.statement_parser.parse(str(line))
+        # Expand aliases (e.g., 'sh vpcs' -> 'show vpcs'); other lines pass
+        # through without being reparsed
+        expanded = ALIASES.get(line.command)
+        if expanded is None:
             return line
-        # Expand aliases (e.g., 'sh vpcs' -> 'show vpcs')
-        parts = raw.split(maxsplit=1)
-        if parts[0] in ALIASES:
-            expanded = ALIASES[parts[0]] + (" " + parts[1] if len(parts) > 1 else "")
-            return cmd2.Statement(expanded)
-        return line
+        return self.statement_parser.parse(
+            " ".join(filter(None, (expanded, line.args, line.post_command)))
+        )
 
     def _apply_pipe_filter(self, output: str, pipe_cmd: str) -> str:
         """Apply pipe filter (include/exclude/grep) to output."""
@@ -587,12 +819,17 @@ class AWSNetShellBase(cmd2.Cmd):
         if len(parts) < 2:
             return output
         cmd, pattern = parts[0].lower(), parts[1]
-        lines = output.split("\n")
         if cmd in ("include", "grep", "i"):
-            return "\n".join(line for line in lines if pattern.lower() in line.lower())
+            # One regex pass over the whole output instead of a per-line loop
+            return "\n".join(_line_matcher(pattern).findall(output))
         elif cmd in ("exclude", "e"):
+            needle = pattern.lower()
             return "\n".join(
-                line for line in lines if pattern.lower() not in line.lower()
+                line
+                for line, lowered in zip(
+                    output.split("\n"), output.lower().split("\n")
+                )
+                if needle not in lowered
             )
         return output
 
@@ -605,7 +842,7 @@ class AWSNetShellBase(cmd2.Cmd):
             base = line[:-1].strip()
             if base in ("show", "set"):
                 console.print(f"[bold]{base} options:[/]")
-                for opt in sorted(self.hierarchy.get(base, [])):
+                for opt in self.hierarchy_sorted.get(base, ()):
                     console.print(f"  {base} {opt}")
             else:
                 console.print(f"[red]Unknown: {base}[/]")
@@ -615,5 +852,5 @@ class AWSNetShellBase(cmd2.Cmd):
     def _show_cmds(self):
         """Display available commands for current context."""
         console.print("[bold]Commands:[/]")
-        for cmd in sorted(self.hierarchy.get("commands", [])):
+        for cmd in self.hierarchy_sorted.get("commands", ()):
             console.print(f"  {cmd}")
@@ -4,7 +4,9 @@ This module provides dynamic derivation of list/set commands from the
 canonical HIERARCHY definition, eliminating hardcoded mappings that can drift.
 """
 
-from typing import Dict, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from .base import HIERARCHY
 
@@ -46,6 +48,9 @@ class CommandDiscovery:
         self._reverse_list_cache: Dict[str, str] = {}
         self._reverse_set_cache: Dict[str, str] = {}
         self._build_caches()
+        self._list_view = MappingProxyType(self._list_cache)
+        self._set_view = MappingProxyType(self._set_cache)
+        self._alias_to_ctx = {alias: ct for ct, alias in self.SET_ALIASES.items()}
 
     def _build_caches(self) -> None:
         """Build all command caches from hierarchy."""
@@ -58,6 +63,14 @@ class CommandDiscovery:
                 self._list_cache[ctx_type] = f"show {plural}"
                 self._reverse_list_cache[f"show {plural}"] = ctx_type
 
+        # Nested context -> first parent context whose set list contains it
+        parent_index: Dict[str, str] = {}
+        for parent_ctx, parent_def in self._hierarchy.items():
+            if parent_ctx is None:
+                continue
+            for child in parent_def.get("set", []):
+                parent_index.setdefault(child, parent_ctx)
+
         # Build set command cache
         for ctx_type in self._hierarchy:
             if ctx_type is None:
@@ -70,15 +83,10 @@ class CommandDiscovery:
             if ctx_type in root_sets or alias in root_sets:
                 self._set_cache[ctx_type] = f"set {alias}"
                 self._reverse_set_cache[f"set {alias}"] = ctx_type
-            else:
-                # Check if it's a nested context
-                for parent_ctx, parent_def in self._hierarchy.items():
-                    if parent_ctx is None:
-                        continue
-                    if ctx_type in parent_def.get("set", []):
-                        self._set_cache[ctx_type] = f"set {alias}"
-                        self._reverse_set_cache[f"set {alias}"] = ctx_type
-                        break
+            elif ctx_type in parent_index:
+                # Nested context, entered from its parent
+                self._set_cache[ctx_type] = f"set {alias}"
+                self._reverse_set_cache[f"set {alias}"] = ctx_type
 
     def get_list_command(self, ctx_type: Optional[str]) -> Optional[str]:
         """Get the list command for a context type.
@@ -129,22 +137,22 @@ class CommandDiscovery:
         return self._reverse_set_cache.get(set_cmd)
 
     @property
-    def context_list_commands(self) -> Dict[str, str]:
+    def context_list_commands(self) -> Mapping[str, str]:
         """Get all context -> list command mappings.
 
         Returns:
-            Dict mapping context_type to list command
+            Read-only mapping of context_type to list command
         """
-        return self._list_cache.copy()
+        return self._list_view
 
     @property
-    def context_set_commands(self) -> Dict[str, str]:
+    def context_set_commands(self) -> Mapping[str, str]:
         """Get all context -> set command mappings.
 
         Returns:
-            Dict mapping context_type to set command
+            Read-only mapping of context_type to set command
         """
-        return self._set_cache.copy()
+        return self._set_view
 
     def get_sub_context(self, set_opt: str) -> Optional[str]:
         """Map a set option to its context type.
@@ -160,12 +168,19 @@ class CommandDiscovery:
             return set_opt
 
         # Check reverse alias
-        for ctx_type, alias in self.SET_ALIASES.items():
-            if alias == set_opt and ctx_type in self._hierarchy:
-                return ctx_type
+        ctx_type = self._alias_to_ctx.get(set_opt)
+        return ctx_type if ctx_type in self._hierarchy else None
+
 
-        return None
+@functools.cache
+def get_discovery() -> CommandDiscovery:
+    """Get the shared CommandDiscovery, built on first use."""
+    return CommandDiscovery()
 
 
-# Singleton instance for easy import
-discovery = CommandDiscovery()
+def __getattr__(name: str):
+    # Keep ``from .discovery import discovery`` working without building the
+    # singleton at import time.
+    if name == "discovery":
+        return get_discovery()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,17 +10,15 @@ class EC2HandlersMixin:
     """Handlers for EC2 instance context."""
 
     def _show_ec2_instances(self, _):
-        key = f"ec2-instance:{','.join(self.regions) if self.regions else 'all'}"
-        if key not in self._cache or self.no_cache:
-            from ...modules.ec2 import EC2Client
-            from ...core import run_with_spinner
+        from ...modules.ec2 import EC2Client
 
-            self._cache[key] = run_with_spinner(
-                lambda: EC2Client(self.profile).discover(self.regions or None),
-                "Fetching EC2 instances",
-            )
-        instances = self._cache.get(key, [])
-        if self.output_format == "json":
+        # Tuple key: hashed directly, no per-call string join/format
+        instances = self._cached(
+            ("ec2-instance", tuple(self.regions)),
+            lambda: EC2Client(self.profile).discover(self.regions or None),
+            "Fetching EC2 instances",
+        )
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(instances, lambda: None)
             return
         table = Table(title="EC2 Instances")
@@ -138,7 +136,7 @@ class EC2HandlersMixin:
         if self.ctx_type != "ec2-instance":
             return
         enis = self.ctx.data.get("enis", [])
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(enis, lambda: None)
             return
         if not enis:
@@ -51,7 +51,7 @@ class ELBHandlersMixin:
         if not elbs:
             console.print("[yellow]No load balancers found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(elbs, lambda: None)
             return
         table = Table(title="Load Balancers")
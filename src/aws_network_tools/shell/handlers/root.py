@@ -2,6 +2,7 @@
 
 from rich.table import Table
 from rich.console import Console
+from rich.text import Text
 from ...core.logging import get_logger
 
 console = Console()
@@ -11,6 +12,22 @@ logger = get_logger("shell.root")
 class RootHandlersMixin:
     """Handlers for root-level commands."""
 
+    def _print_listing(self, key: str, data: list, build_table):
+        """Print ``build_table()``, reusing the last rendering of ``data``.
+
+        Repeating a show command over the same cached list (same object, same
+        console width) replays the captured output instead of laying the
+        table out again; refreshed data is a new list and renders afresh.
+        """
+        width = console.width
+        memo = self._render_memo.get(key)
+        if memo is None or memo[0] is not data or memo[1] != width:
+            with console.capture() as capture:
+                console.print(build_table())
+            memo = (data, width, Text.from_ansi(capture.get()))
+            self._render_memo[key] = memo
+        console.print(memo[2], end="")
+
     def _show_version(self, _):
         """Show CLI version and system information."""
         import platform
@@ -58,13 +75,9 @@ class RootHandlersMixin:
         try:
 
             def fetch_regions():
-                import boto3
+                from ...core.base import get_session
 
-                if self.profile:
-                    session = boto3.Session(profile_name=self.profile)
-                else:
-                    session = boto3.Session()
-                ec2 = session.client("ec2", region_name="us-east-1")
+                ec2 = get_session(self.profile).client("ec2", region_name="us-east-1")
                 response = ec2.describe_regions(
                     AllRegions=False
                 )  # Only opted-in regions
@@ -137,7 +150,7 @@ class RootHandlersMixin:
                 age = int(info["age_seconds"])
                 status = f"age: {age}s" if not info["expired"] else "stale"
                 data = topo_cache.get(ignore_expiry=True)
-                entries = len(data.get("eni_index", {})) if data else 0
+                entries = len(data.get("eni_ip_to_idx", {})) if data else 0
                 table.add_row("Topology", str(entries), status)
             else:
                 table.add_row("Topology", "0", "empty")
@@ -174,7 +187,7 @@ class RootHandlersMixin:
         if not gns:
             console.print("[yellow]No global networks found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(gns, lambda: None)
             return
         table = Table(title="Global Networks")
@@ -197,23 +210,29 @@ class RootHandlersMixin:
         if not vpcs:
             console.print("[yellow]No VPCs found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(vpcs, lambda: None)
             return
-        table = Table(title="VPCs")
-        table.add_column("#", style="dim")
-        table.add_column("Name")
-        table.add_column("ID")
-        table.add_column("CIDRs")
-        table.add_column("Region")
-        for i, v in enumerate(vpcs, 1):
-            cidrs = (
-                ", ".join(v.get("cidrs", [])) if v.get("cidrs") else v.get("cidr", "")
-            )
-            table.add_row(
-                str(i), v.get("name", ""), v["id"], cidrs, v.get("region", "")
-            )
-        console.print(table)
+
+        def build():
+            table = Table(title="VPCs")
+            table.add_column("#", style="dim")
+            table.add_column("Name")
+            table.add_column("ID")
+            table.add_column("CIDRs")
+            table.add_column("Region")
+            for i, v in enumerate(vpcs, 1):
+                cidrs = (
+                    ", ".join(v.get("cidrs", []))
+                    if v.get("cidrs")
+                    else v.get("cidr", "")
+                )
+                table.add_row(
+                    str(i), v.get("name", ""), v["id"], cidrs, v.get("region", "")
+                )
+            return table
+
+        self._print_listing("vpcs", vpcs, build)
         console.print("[dim]Use 'set vpc <#>' to select[/]")
 
     def _show_transit_gateways(self, _):
@@ -227,17 +246,21 @@ class RootHandlersMixin:
         if not tgws:
             console.print("[yellow]No Transit Gateways found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(tgws, lambda: None)
             return
-        table = Table(title="Transit Gateways")
-        table.add_column("#", style="dim")
-        table.add_column("Name")
-        table.add_column("ID")
-        table.add_column("Region")
-        for i, t in enumerate(tgws, 1):
-            table.add_row(str(i), t.get("name", ""), t["id"], t.get("region", ""))
-        console.print(table)
+
+        def build():
+            table = Table(title="Transit Gateways")
+            table.add_column("#", style="dim")
+            table.add_column("Name")
+            table.add_column("ID")
+            table.add_column("Region")
+            for i, t in enumerate(tgws, 1):
+                table.add_row(str(i), t.get("name", ""), t["id"], t.get("region", ""))
+            return table
+
+        self._print_listing("transit_gateways", tgws, build)
         console.print("[dim]Use 'set transit-gateway <#>' to select[/]")
 
     def _show_firewalls(self, _):
@@ -251,7 +274,7 @@ class RootHandlersMixin:
         if not fws:
             console.print("[yellow]No firewalls found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(fws, lambda: None)
             return
         table = Table(title="Network Firewalls")
@@ -483,19 +506,14 @@ class RootHandlersMixin:
             console.print(f"[red]{error}[/]")
             return
 
-        old_profile = self.profile
+        old_profile, old_regions = self.profile, self.regions.copy()
         self.profile = profile
         console.print(f"[green]Profile: {self.profile or '(default)'}[/]")
         self._sync_runtime_config()
 
-        # Auto-clear cache when profile changes
+        # Swap in the cache for the new profile (kept for switching back)
         if old_profile != self.profile:
-            count = len(self._cache)
-            if count > 0:
-                self._cache.clear()
-                console.print(
-                    f"[dim]Cleared {count} cache entries (profile changed)[/]"
-                )
+            self._swap_config_cache(old_profile, old_regions, "profile changed")
 
     def _set_regions(self, val):
         from ...core.validators import validate_regions
@@ -505,21 +523,16 @@ class RootHandlersMixin:
             console.print(f"[red]{error}[/]")
             return
 
-        old_regions = self.regions.copy()
+        old_profile, old_regions = self.profile, self.regions.copy()
         self.regions = regions if regions else []
         console.print(
             f"[green]Regions: {', '.join(self.regions) if self.regions else 'all'}[/]"
         )
         self._sync_runtime_config()
 
-        # Auto-clear cache when regions change
+        # Swap in the cache for the new regions (kept for switching back)
         if old_regions != self.regions:
-            count = len(self._cache)
-            if count > 0:
-                self._cache.clear()
-                console.print(
-                    f"[dim]Cleared {count} cache entries (regions changed)[/]"
-                )
+            self._swap_config_cache(old_profile, old_regions, "regions changed")
 
     def _set_no_cache(self, val):
         self.no_cache = val and val.lower() in ("on", "true", "1", "yes")
@@ -574,6 +587,7 @@ class RootHandlersMixin:
 
         try:
             self.theme = load_theme(theme_name)
+            self._prompt_memo.clear()
             self.config.set("prompt.theme", theme_name)
             self.config.save()
             console.print(f"[green]Theme set to: {self.theme.name}[/]")
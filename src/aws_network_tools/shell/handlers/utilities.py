@@ -1,12 +1,57 @@
 """Utility command handlers (trace, find_ip, run, cache, write)."""
 
-import boto3
+import asyncio
+import concurrent.futures
+import functools
+import ipaddress
+from typing import Optional
+
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
 
+@functools.cache
+def _bg_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Single worker for running coroutines when a loop is already running."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+@functools.cache
+def _available_regions(profile: Optional[str], service: str) -> tuple[str, ...]:
+    """Regions botocore knows for a service, parsed from endpoints data once."""
+    from ...core.base import get_session
+
+    return tuple(get_session(profile).get_available_regions(service))
+
+
+def _ip_filter_order(ip: str) -> list[str]:
+    """describe_instances filter names to try for an IP, most likely first.
+
+    EC2 ANDs distinct filter names, so private and public matches cannot be
+    combined into one call. Non-global addresses can only be private IPs and
+    need a single lookup; global ones are usually public IPs, with a private
+    fallback for VPCs using publicly routable CIDRs.
+    """
+    try:
+        is_global = ipaddress.ip_address(ip).is_global
+    except ValueError:
+        return ["private-ip-address", "ip-address"]
+    if is_global:
+        return ["ip-address", "private-ip-address"]
+    return ["private-ip-address"]
+
+
+def _run_coro_sync(coro):
+    """Run a coroutine to completion from synchronous handler code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _bg_pool().submit(asyncio.run, coro).result()
+
+
 class UtilityHandlersMixin:
     """Handlers for utility commands."""
 
@@ -34,20 +79,14 @@ class UtilityHandlersMixin:
             return
         try:
             from ...traceroute.topology import TopologyDiscovery
-            import asyncio
-            import concurrent.futures
 
             def on_status(msg):
                 console.print(f"[dim]  → {msg}[/]")
 
             discovery = TopologyDiscovery(profile=self.profile, on_status=on_status)
             console.print("[bold]Populating topology cache...[/]")
-            try:
-                # loop = asyncio.get_running_loop()  # Not used
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    pool.submit(asyncio.run, discovery.discover()).result()
-            except RuntimeError:
-                asyncio.run(discovery.discover())
+            _run_coro_sync(discovery.discover())
+            self._ip_completions = None
             console.print("[green]Cache populated[/]")
         except ImportError as e:
             console.print(f"[yellow]Topology module not available: {e}[/]")
@@ -63,7 +102,7 @@ class UtilityHandlersMixin:
         from ...modules import ip_finder
 
         console.print(f"[dim]Searching for {ip} across regions...[/]")
-        result = ip_finder.find_ip(ip, self.profile)
+        result = ip_finder.find_ip(ip, self.profile, self.regions or None)
 
         if not result:
             console.print(f"[yellow]No ENI found for {ip}[/]")
@@ -102,44 +141,49 @@ class UtilityHandlersMixin:
             console.print("[red]Usage: run <instance-id|ip> <command>[/]")
             return
         target, cmd = parts[0], parts[1]
-        session = boto3.Session(profile_name=self.profile)
         instance_id = inst_region = None
-        regions = self.regions or session.get_available_regions("ec2")
+        regions = self.regions or _available_regions(self.profile, "ec2")
+        ip_filters = [] if target.startswith("i-") else _ip_filter_order(target)
 
-        if target.startswith("i-"):
-            for r in regions:
-                try:
-                    ec2 = session.client("ec2", region_name=r)
+        def probe(region: str):
+            """Return (instance_id, region) if target resolves in region."""
+            try:
+                ec2 = self._get_client("ec2", region)
+                if target.startswith("i-"):
                     if ec2.describe_instances(InstanceIds=[target]).get("Reservations"):
-                        instance_id, inst_region = target, r
-                        break
-                except Exception:
-                    continue
-        else:
-            for r in regions:
-                try:
-                    ec2 = session.client("ec2", region_name=r)
-                    for filt in [
-                        {"Name": "private-ip-address", "Values": [target]},
-                        {"Name": "ip-address", "Values": [target]},
-                    ]:
-                        resp = ec2.describe_instances(Filters=[filt])
-                        for res in resp.get("Reservations", []):
-                            for inst in res.get("Instances", []):
-                                instance_id, inst_region = inst["InstanceId"], r
-                                break
-                        if instance_id:
-                            break
-                    if instance_id:
-                        break
-                except Exception:
-                    continue
+                        return target, region
+                    return None
+                for name in ip_filters:
+                    resp = ec2.describe_instances(
+                        Filters=[{"Name": name, "Values": [target]}]
+                    )
+                    for res in resp.get("Reservations", []):
+                        for inst in res.get("Instances", []):
+                            return inst["InstanceId"], region
+            except Exception:
+                pass
+            return None
+
+        # Probe regions in parallel and stop at the first hit
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(16, len(regions)))
+        )
+        try:
+            futures = [pool.submit(probe, r) for r in regions]
+            for future in concurrent.futures.as_completed(futures):
+                hit = future.result()
+                if hit:
+                    instance_id, inst_region = hit
+                    break
+        finally:
+            # Go on at the first hit without waiting for in-flight regions
+            pool.shutdown(wait=False, cancel_futures=True)
 
         if not instance_id:
             console.print(f"[red]Could not resolve target '{target}' to an instance[/]")
             return
 
-        ssm = session.client("ssm", region_name=inst_region)
+        ssm = self._get_client("ssm", inst_region)
         try:
             resp = ssm.send_command(
                 InstanceIds=[instance_id],
@@ -148,23 +192,18 @@ class UtilityHandlersMixin:
             )
             cmd_id = resp["Command"]["CommandId"]
             console.print(f"[dim]Sent, command-id:[/] {cmd_id}")
-            import time
+            from botocore.exceptions import WaiterError
 
-            end = time.time() + 120
-            while time.time() < end:
-                inv = ssm.get_command_invocation(
-                    CommandId=cmd_id, InstanceId=instance_id
+            try:
+                ssm.get_waiter("command_executed").wait(
+                    CommandId=cmd_id,
+                    InstanceId=instance_id,
+                    WaiterConfig={"Delay": 2, "MaxAttempts": 60},
                 )
-                if inv.get("Status") in (
-                    "Success",
-                    "Cancelled",
-                    "Failed",
-                    "TimedOut",
-                    "Undeliverable",
-                    "Terminated",
-                ):
-                    break
-                time.sleep(2)
+            except WaiterError:
+                # Failed/cancelled commands or timeout: report the final state
+                pass
+            inv = ssm.get_command_invocation(CommandId=cmd_id, InstanceId=instance_id)
             console.print(
                 {
                     "Status": inv.get("Status"),
@@ -187,18 +226,9 @@ class UtilityHandlersMixin:
             return
         try:
             from ...traceroute import AWSTraceroute
-            import asyncio
-            import concurrent.futures
 
             def on_hop(hop):
-                style = {
-                    "destination": "green",
-                    "nfg": "yellow",
-                    "firewall": "red",
-                }.get(hop.type, "white")
-                console.print(
-                    f"[dim]{hop.seq}.[/] [{style}]{hop.type:18}[/] {hop.id} @ {hop.region}"
-                )
+                console.print(hop.markup(show_name=False))
 
             def on_status(msg):
                 console.print(f"[dim]  → {msg}[/]")
@@ -211,14 +241,7 @@ class UtilityHandlersMixin:
                 no_cache=no_cache,
             )
             console.print(f"\n[bold]Tracing {ips[0]} → {ips[1]}[/]\n")
-            try:
-                # loop = asyncio.get_running_loop()  # Not used
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    result = pool.submit(
-                        asyncio.run, tracer.trace(ips[0], ips[1])
-                    ).result()
-            except RuntimeError:
-                result = asyncio.run(tracer.trace(ips[0], ips[1]))
+            result = _run_coro_sync(tracer.trace(ips[0], ips[1]))
             if result.reachable:
                 console.print("\n[bold green]✅ REACHABLE[/]")
             else:
@@ -228,4 +251,20 @@ class UtilityHandlersMixin:
         except ImportError as e:
             console.print(f"[yellow]Traceroute module not available: {e}[/]")
 
+    def complete_trace(self, text, line, begidx, endidx):
+        """Tab completion for trace: flags, or IPs from the topology cache."""
+        if text.startswith("--"):
+            return [o for o in ("--no-cache",) if o.startswith(text)]
+        try:
+            from ...traceroute.topology import TopologyDiscovery, complete_ips
+        except ImportError:
+            return []
+        # Reloaded whenever the cache file changes; an empty list is not kept
+        stamp = TopologyDiscovery.cache_stamp()
+        if self._ip_completions is None or self._ip_completions[0] != stamp:
+            ips = TopologyDiscovery.all_ips()
+            self._ip_completions = (stamp, ips) if ips else None
+            return complete_ips(ips, text)
+        return complete_ips(self._ip_completions[1], text)
+
     # reachability command removed - duplicate of trace command
@@ -113,7 +113,7 @@ class VPCHandlersMixin:
         if not sgs:
             console.print("[yellow]No security groups[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(sgs, lambda: None)
             return
         if self.ctx_type == "ec2-instance":
@@ -161,7 +161,7 @@ class VPCHandlersMixin:
         if self.ctx_type != "vpc":
             return
         igws = self.ctx.data.get("igws", [])
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(igws, lambda: None)
             return
         table = Table(title="Internet Gateways")
@@ -175,7 +175,7 @@ class VPCHandlersMixin:
         if self.ctx_type != "vpc":
             return
         nats = self.ctx.data.get("nats", [])
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(nats, lambda: None)
             return
         table = Table(title="NAT Gateways")
@@ -190,7 +190,7 @@ class VPCHandlersMixin:
         if self.ctx_type != "vpc":
             return
         eps = self.ctx.data.get("endpoints", [])
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(eps, lambda: None)
             return
         table = Table(title="VPC Endpoints")
@@ -333,7 +333,7 @@ class VPCHandlersMixin:
             if not subs:
                 console.print("[yellow]No subnets found[/]")
                 return
-            if self.output_format == "json":
+            if self.output_format in ("json", "yaml"):
                 self._emit_json_or_table(subs, lambda: None)
                 return
             table = Table(title="VPC Subnets (All)")
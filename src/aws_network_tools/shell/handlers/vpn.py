@@ -46,7 +46,7 @@ class VPNHandlersMixin:
         if not vpns:
             console.print("[yellow]No VPN connections found[/]")
             return
-        if self.output_format == "json":
+        if self.output_format in ("json", "yaml"):
             self._emit_json_or_table(vpns, lambda: None)
             return
         table = Table(title="Site-to-Site VPN Connections")
@@ -56,8 +56,8 @@ class VPNHandlersMixin:
         table.add_column("State")
         table.add_column("Type")
         table.add_column("Region")
-        for i, v in enumerate(vpns, 1):
-            table.add_row(
+        rows = [
+            (
                 str(i),
                 v.get("name", ""),
                 v["id"],
@@ -65,6 +65,10 @@ class VPNHandlersMixin:
                 v.get("type", ""),
                 v.get("region", ""),
             )
+            for i, v in enumerate(vpns, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
         console.print("[dim]Use 'set vpn <#>' to select[/]")
 
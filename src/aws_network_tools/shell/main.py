@@ -1,9 +1,13 @@
 """Main shell class composing all handler mixins."""
 
-import yaml
+import re
+import threading
+from typing import Hashable
+
 from rich.console import Console
 
-from .base import AWSNetShellBase
+from .base import AWSNetShellBase, HANDLER_NAMES
+from ..core.records import dump_json, dump_yaml, json_default
 from .handlers import (
     RootHandlersMixin,
     CloudWANHandlersMixin,
@@ -18,6 +22,11 @@ from .handlers import (
 
 console = Console()
 
+_MISSING = object()
+
+# Colour and cursor escape sequences in captured Rich output
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 class AWSNetShell(
     RootHandlersMixin,
@@ -33,24 +42,60 @@ class AWSNetShell(
 ):
     """Cisco IOS-style hierarchical CLI for AWS networking."""
 
-    def _cached(self, key: str, fetch_fn, msg: str = "Loading..."):
+    def _cached(self, key: Hashable, fetch_fn, msg: str = "Loading..."):
         from ..core import run_with_spinner
 
-        if key not in self._cache or self.no_cache:
-            self._cache[key] = run_with_spinner(fetch_fn, msg)
-        return self._cache[key]
+        # One probe on a hit; the sentinel keeps cached None values as hits
+        data = _MISSING if self.no_cache else self._cache.get(key, _MISSING)
+        if data is not _MISSING:
+            return data
+
+        # Single flight: callers arriving while the same key is being fetched
+        # wait for that fetch instead of repeating its AWS calls
+        with self._cache_lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+        if not leader:
+            event.wait()
+            data = self._cache.get(key, _MISSING)
+            if data is not _MISSING:
+                return data
+            # The first fetch failed: try again here
+
+        try:
+            disk = self._disk_cache(key)
+            data = disk.get() if disk else None
+            if data is None:
+                data = run_with_spinner(fetch_fn, msg)
+                if disk:
+                    ttl = self.config.get("cache.expire_minutes", 30) * 60
+                    try:
+                        disk.set(data, ttl_seconds=ttl)
+                    except (TypeError, ValueError, OSError):
+                        pass  # Not JSON-serialisable or not writable: memory only
+            self._cache[key] = data
+        finally:
+            if leader:
+                with self._cache_lock:
+                    del self._inflight[key]
+                event.set()
+        return data
 
     def _emit_json_or_table(self, data, render_table_fn):
         if self.output_format == "json":
             try:
-                import json
-
-                console.print_json(json.dumps(data, default=str))
+                if console.no_color:
+                    # Piped or colourless output: skip Rich's JSON highlighting
+                    print(dump_json(data), file=console.file)
+                else:
+                    console.print_json(data=data, default=json_default)
             except Exception:
                 console.print(data)
         elif self.output_format == "yaml":
             try:
-                console.print(yaml.safe_dump(data, sort_keys=False))
+                console.print(dump_yaml(data))
             except Exception:
                 console.print(data)
         else:
@@ -68,7 +113,7 @@ class AWSNetShell(
         parts = raw.strip().split()
         if not parts or parts[0] == "?":
             console.print("[bold]show options:[/]")
-            for opt in sorted(self.hierarchy.get("show", [])):
+            for opt in self.hierarchy_sorted.get("show", ()):
                 console.print(f"  show {opt}")
             console.print(
                 "\n[dim]Pipe operators: | include <text>, | exclude <text>[/]"
@@ -95,12 +140,12 @@ class AWSNetShell(
                 self._run_with_pipe(lambda: self._show_vpc(sub), pipe_filter)
             return
 
-        valid = self.hierarchy.get("show", [])
-        if opt not in valid:
+        if opt not in self.hierarchy_sets.get("show", ()):
+            valid = self.hierarchy.get("show", [])
             console.print(f"[red]Invalid: '{opt}'. Valid: {', '.join(valid)}[/]")
             return
 
-        handler = getattr(self, f"_show_{opt.replace('-', '_')}", None)
+        handler = getattr(self, HANDLER_NAMES[("show", opt)], None)
         if not handler:
             console.print(f"[yellow]Not implemented: show {opt}[/]")
             return
@@ -115,23 +160,19 @@ class AWSNetShell(
         if not pipe_filter:
             fn()
             return
+        import contextlib
         import io
-        from rich.console import Console as RichConsole
 
+        # Handler modules each print through their own Console, and Consoles
+        # built without a file write to whatever sys.stdout is at print time,
+        # so redirecting stdout captures all of them. Their colour settings
+        # were fixed at start-up, hence stripping escape codes afterwards.
         buf = io.StringIO()
-        temp_console = RichConsole(file=buf, force_terminal=False, no_color=True)
-        # Temporarily swap console
-        import aws_network_tools.shell.main as main_mod
-
-        orig = main_mod.console
-        main_mod.console = temp_console
-        try:
+        with contextlib.redirect_stdout(buf):
             fn()
-        finally:
-            main_mod.console = orig
-        output = buf.getvalue()
+        output = _ANSI_ESCAPE.sub("", buf.getvalue())
         filtered = self._apply_pipe_filter(output, pipe_filter)
-        console.print(filtered)
+        console.out(filtered, highlight=False)
 
     def _watch_loop(self, fn, interval):
         import time
@@ -148,7 +189,7 @@ class AWSNetShell(
     def complete_show(self, text, line, begidx, endidx):
         parts = line[:begidx].strip().split()
         if len(parts) <= 1:
-            return [o for o in self.hierarchy.get("show", []) if o.startswith(text)]
+            return self._complete_option("show", text)
         subcommand = parts[1] if len(parts) > 1 else ""
         if subcommand == "vpc":
             return (
@@ -197,17 +238,17 @@ class AWSNetShell(
         parts = str(args).strip().split(maxsplit=1)
         if not parts or parts[0] == "?":
             console.print("[bold]set options:[/]")
-            for opt in sorted(self.hierarchy.get("set", [])):
+            for opt in self.hierarchy_sorted.get("set", ()):
                 console.print(f"  set {opt}")
             return
 
         opt, val = parts[0], parts[1] if len(parts) > 1 else None
-        valid = self.hierarchy.get("set", [])
-        if opt not in valid:
+        if opt not in self.hierarchy_sets.get("set", ()):
+            valid = self.hierarchy.get("set", [])
             console.print(f"[red]Invalid: '{opt}'. Valid: {', '.join(valid)}[/]")
             return
 
-        handler = getattr(self, f"_set_{opt.replace('-', '_')}", None)
+        handler = getattr(self, HANDLER_NAMES[("set", opt)], None)
         handler(val) if handler else console.print(
             f"[yellow]Not implemented: set {opt}[/]"
         )
@@ -215,7 +256,7 @@ class AWSNetShell(
     def complete_set(self, text, line, begidx, endidx):
         parts = line[:begidx].split()
         if len(parts) <= 1:
-            return [o for o in self.hierarchy.get("set", []) if o.startswith(text)]
+            return self._complete_option("set", text)
         key = parts[1]
         cache_key = {"transit-gateway": "tgw"}.get(key, key)
         items = self._cache.get(cache_key, [])
@@ -234,7 +275,7 @@ class AWSNetShell(
             from rich.table import Table
 
             rts = self.ctx.data.get("route_tables", [])
-            if self.output_format == "json":
+            if self.output_format in ("json", "yaml"):
                 self._emit_json_or_table(rts, lambda: None)
                 return
             if not rts:
@@ -1,68 +1,72 @@
 """CLI for traceroute."""
 
+import argparse
 import asyncio
-import sys
 import time
+from typing import Optional, Sequence
 from rich.console import Console
 from .engine import AWSTraceroute
 from .topology import TopologyDiscovery
 
 
-def main():
-    args = sys.argv[1:]
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aws-trace", description="Trace a path between two IPs in AWS."
+    )
+    parser.add_argument("src_ip", nargs="?", help="Source IP address")
+    parser.add_argument("dst_ip", nargs="?", help="Destination IP address")
+    parser.add_argument("--profile", help="AWS profile to use")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Don't use cached topology"
+    )
+    parser.add_argument(
+        "--skip-stale-check",
+        action="store_true",
+        help="Use cache without checking for changes (fastest)",
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true", help="Force refresh of cached topology"
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Clear the topology cache and exit",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = _build_parser()
+    ns = parser.parse_args(argv)
 
     # Handle cache commands
-    if "--clear-cache" in args:
+    if ns.clear_cache:
         TopologyDiscovery().clear_cache()
         print("Cache cleared")
         return
 
-    if len(args) < 2 or args[0].startswith("-"):
-        print("Usage: aws-trace <src_ip> <dst_ip> [options]")
-        print("Options:")
-        print("  --profile <name>      AWS profile to use")
-        print("  --no-cache            Don't use cached topology")
-        print(
-            "  --skip-stale-check    Use cache without checking for changes (fastest)"
-        )
-        print("  --refresh-cache       Force refresh of cached topology")
-        print("  --clear-cache         Clear the topology cache and exit")
-        sys.exit(1)
-
-    src_ip = args[0]
-    dst_ip = args[1]
-    profile = None
-    no_cache = "--no-cache" in args
-    refresh_cache = "--refresh-cache" in args
-    skip_stale_check = "--skip-stale-check" in args
-
-    if "--profile" in args:
-        idx = args.index("--profile")
-        profile = args[idx + 1] if idx + 1 < len(args) else None
+    if not ns.src_ip or not ns.dst_ip:
+        parser.error("src_ip and dst_ip are required")
+
+    src_ip = ns.src_ip
+    dst_ip = ns.dst_ip
 
     console = Console()
     console.print(f"\n[bold]Tracing {src_ip} → {dst_ip}[/]\n")
 
     def on_hop(hop):
-        style = "green" if hop.type == "destination" else "white"
-        if hop.type == "nfg":
-            style = "yellow"
-        elif hop.type == "firewall":
-            style = "red"
-        console.print(
-            f"[dim]{hop.seq}.[/] [{style}]{hop.type:18}[/] {hop.id} [dim]({hop.name})[/] @ {hop.region}"
-        )
+        console.print(hop.markup())
 
     def on_status(msg):
         console.print(f"[dim]  → {msg}[/]")
 
     tracer = AWSTraceroute(
-        profile=profile,
+        profile=ns.profile,
         on_hop=on_hop,
         on_status=on_status,
-        no_cache=no_cache,
-        refresh_cache=refresh_cache,
-        skip_stale_check=skip_stale_check,
+        no_cache=ns.no_cache,
+        refresh_cache=ns.refresh_cache,
+        skip_stale_check=ns.skip_stale_check,
     )
 
     start = time.time()
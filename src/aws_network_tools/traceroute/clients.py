@@ -0,0 +1,92 @@
+"""Shared boto3 session and client handling for traceroute."""
+
+import functools
+import os
+import socket
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+
+from ..core.base import DEFAULT_BOTO_CONFIG, get_session, session_client
+from ..core.cache import Cache
+
+# Pool sized for concurrent regional calls; retries come from
+# DEFAULT_BOTO_CONFIG.
+TRACE_BOTO_CONFIG = DEFAULT_BOTO_CONFIG.merge(Config(max_pool_connections=50))
+
+# Candidates probed when choosing the region for account-wide EC2 calls
+SEED_REGIONS = (
+    "us-east-1",
+    "us-west-2",
+    "eu-west-1",
+    "eu-central-1",
+    "ap-southeast-1",
+    "ap-northeast-1",
+)
+SEED_REGION_TTL = 86400
+
+
+def _connect_time(region: str) -> float:
+    """Seconds to open a TCP connection to the region's EC2 endpoint."""
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((f"ec2.{region}.amazonaws.com", 443), 1.0):
+            return time.perf_counter() - start
+    except OSError:
+        return float("inf")
+
+
+@functools.cache
+def seed_region() -> str:
+    """Closest region for calls any region can answer, like DescribeRegions.
+
+    ``AWSNET_SEED_REGION`` overrides the choice; otherwise the lowest-latency
+    of SEED_REGIONS is measured once and cached on disk for a day.
+    """
+    override = os.environ.get("AWSNET_SEED_REGION")
+    if override:
+        return override
+    cache = Cache("seed_region")
+    cached = cache.get()
+    if cached:
+        return cached
+    with ThreadPoolExecutor(max_workers=len(SEED_REGIONS)) as pool:
+        times = dict(zip(SEED_REGIONS, pool.map(_connect_time, SEED_REGIONS)))
+    region = min(SEED_REGIONS, key=times.__getitem__)
+    if times[region] != float("inf"):
+        cache.set(region, ttl_seconds=SEED_REGION_TTL)
+    return region
+
+
+def trace_client(session: boto3.Session, service: str, region: str):
+    """The shared traceroute client for a session, service and region."""
+    return session_client(session, service, region, TRACE_BOTO_CONFIG)
+
+
+def resolve_session(
+    profile: Optional[str], session: Optional[boto3.Session] = None
+) -> boto3.Session:
+    """Use the given session, else the process-wide one for the profile."""
+    return session or get_session(profile)
+
+
+_account_ids: "weakref.WeakKeyDictionary[boto3.Session, str]" = (
+    weakref.WeakKeyDictionary()
+)
+_account_lock = threading.Lock()
+
+
+def get_account_id(session: boto3.Session) -> str:
+    """The session's AWS account ID, looked up once via STS."""
+    account = _account_ids.get(session)
+    if account is None:
+        sts = session_client(session, "sts", "us-east-1")
+        account = sts.get_caller_identity()["Account"]
+        with _account_lock:
+            _account_ids[session] = account
+    return account
@@ -1,17 +1,48 @@
 """Deterministic AWS Network Traceroute Engine."""
 
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from ipaddress import ip_network, ip_address
-from typing import Optional
+from typing import Callable, Optional
 import boto3
 
-from .models import Hop, TraceResult
+from .clients import resolve_session, seed_region, trace_client
+from .models import Hop, Route, TraceResult
 from .topology import TopologyDiscovery, NetworkTopology
 
 
-@dataclass
+def _arn_resource_id(arn: str) -> str:
+    """Trailing resource ID of an ARN (``.../vpc/vpc-123`` -> ``vpc-123``)."""
+    return arn.rsplit("/", 1)[-1]
+
+
+# Regions probed first when an IP has to be found via the API
+PRIORITY_REGIONS = ("eu-west-1", "eu-west-2", "us-east-1", "us-west-2")
+
+
+def _priority_order(regions: list[str]) -> tuple[str, ...]:
+    """Regions with PRIORITY_REGIONS first, the rest in their given order."""
+    available = frozenset(regions)
+    priority = tuple(r for r in PRIORITY_REGIONS if r in available)
+    return priority + tuple(r for r in regions if r not in PRIORITY_REGIONS)
+
+
+def _thread_pool_size() -> int:
+    """Worker count for blocking boto3 calls (THREAD_POOL_SIZE overrides)."""
+    default = min(32, (os.cpu_count() or 1) * 4)
+    try:
+        return max(1, int(os.getenv("THREAD_POOL_SIZE", default)))
+    except ValueError:
+        return default
+
+
+PrefixEntry = tuple[int, int, int, dict]  # (network, netmask, prefixlen, route)
+PrefixTables = tuple[list[PrefixEntry], list[PrefixEntry]]  # (IPv4, IPv6)
+
+
+@dataclass(slots=True)
 class ENIInfo:
     """Resolved ENI information."""
 
@@ -23,6 +54,62 @@ class ENIInfo:
     security_groups: list[str]
 
 
+class _ENIBatcher:
+    """Coalesce concurrent ENI lookups in one region into one API call.
+
+    Lookups arriving within ``MAX_DELAY`` seconds of each other share a single
+    describe_network_interfaces call (up to ``MAX_VALUES`` IPs per filter).
+    """
+
+    MAX_DELAY = 0.05
+    MAX_VALUES = 200
+
+    def __init__(self, tracer: "AWSTraceroute", region: str):
+        self.tracer = tracer
+        self.region = region
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop keeps only weak references to tasks; hold running batches
+        self._tasks: set[asyncio.Task] = set()
+
+    async def lookup(self, ip: str) -> Optional[ENIInfo]:
+        future = self._pending.get(ip)
+        if future is None:
+            future = self.loop.create_future()
+            self._pending[ip] = future
+            if len(self._pending) >= self.MAX_VALUES:
+                self._flush()
+            elif self._timer is None:
+                self._timer = self.loop.call_later(self.MAX_DELAY, self._flush)
+        # Shield: a cancelled caller must not cancel the shared batch result
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = self.loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]):
+        try:
+            found = await self.loop.run_in_executor(
+                self.tracer._executor,
+                self.tracer._find_enis_in_region,
+                list(batch),
+                self.region,
+            )
+        except Exception:
+            found = {}
+        for ip, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(ip))
+
+
 class AWSTraceroute:
     """Deterministic AWS network path tracer."""
 
@@ -34,19 +121,29 @@ class AWSTraceroute:
         no_cache=False,
         refresh_cache=False,
         skip_stale_check=False,
+        session: Optional[boto3.Session] = None,
     ):
         self.profile = profile
-        self.session = (
-            boto3.Session(profile_name=profile) if profile else boto3.Session()
-        )
-        self._executor = ThreadPoolExecutor(max_workers=10)
+        self.session = resolve_session(profile, session)
+        self._executor = ThreadPoolExecutor(max_workers=_thread_pool_size())
         self._on_hop = on_hop
         self._on_status = on_status
         self._no_cache = no_cache
         self._refresh_cache = refresh_cache
         self._skip_stale_check = skip_stale_check
         self._topology: Optional[NetworkTopology] = None
-        self._discovery = TopologyDiscovery(profile=profile, on_status=on_status)
+        self._prefix_cache: dict[str, PrefixTables] = {}
+        self._eni_info: dict[str, ENIInfo] = {}
+        self._eni_batchers: dict[str, _ENIBatcher] = {}
+        self._rt_inflight: dict[str, asyncio.Future] = {}
+        self._ordered_regions: tuple[str, ...] = ()
+        self._cwan_att_by_vpc: dict[tuple[str, Optional[str]], dict] = {}
+        self._nfg_atts: dict[tuple[str, Optional[str]], list[dict]] = {}
+        self._send_via: dict[tuple[str, str], Optional[str]] = {}
+        self._send_via_any: dict[str, Optional[str]] = {}
+        self._discovery = TopologyDiscovery(
+            profile=profile, on_status=on_status, session=self.session
+        )
 
     def _emit(self, hop: Hop):
         if self._on_hop:
@@ -57,7 +154,7 @@ class AWSTraceroute:
             self._on_status(msg)
 
     def _client(self, service: str, region: str):
-        return self.session.client(service, region_name=region)
+        return trace_client(self.session, service, region)
 
     async def _ensure_topology(self):
         """Load or discover topology."""
@@ -72,10 +169,47 @@ class AWSTraceroute:
             self._topology = self._discovery.get_cached(check_staleness=check_staleness)
             if self._topology:
                 self._status("Using cached topology")
+                self._index_topology()
                 return
 
         self._status("Discovering network topology (this may take a minute)...")
-        self._topology = await self._discovery.discover()
+        # --no-cache ignores the cached active-region list too
+        self._topology = await self._discovery.discover(full_scan=self._no_cache)
+        self._index_topology()
+
+    def _index_topology(self):
+        """Build Cloud WAN lookup indexes from the loaded topology (one pass)."""
+        self._eni_info.clear()
+        self._ordered_regions = _priority_order(self._topology.regions)
+        self._cwan_att_by_vpc = {}
+        self._nfg_atts = {}
+        for att in self._topology.cwan_attachments:
+            region = att.get("EdgeLocation")
+            vpc_id = _arn_resource_id(att.get("ResourceArn", ""))
+            # First matching attachment wins, as with the previous linear scan
+            self._cwan_att_by_vpc.setdefault((vpc_id, region), att)
+            nfg = att.get("NetworkFunctionGroupName")
+            if nfg:
+                self._nfg_atts.setdefault((nfg, region), []).append(att)
+
+        # send-via: (src, dst) -> NFG, with "*" expanded over known segments.
+        # setdefault keeps the first matching action, as policy order decides.
+        policy = self._topology.cwan_policy
+        segments = [seg.get("name") for seg in policy.get("segments", [])]
+        self._send_via = {}
+        self._send_via_any = {}
+        for action in policy.get("segment-actions", []):
+            src = action.get("segment")
+            if action.get("action") != "send-via" or not src:
+                continue
+            nfgs = action.get("via", {}).get("network-function-groups", [])
+            nfg = nfgs[0] if nfgs else None
+            when_sent_to = action.get("when-sent-to", {}).get("segments", [])
+            if when_sent_to == "*":
+                self._send_via_any.setdefault(src, nfg)
+                when_sent_to = segments
+            for dst in when_sent_to:
+                self._send_via.setdefault((src, dst), nfg)
 
     async def trace(self, src_ip: str, dst_ip: str) -> TraceResult:
         """Trace network path between two IPs."""
@@ -86,8 +220,10 @@ class AWSTraceroute:
         await self._ensure_topology()
 
         # Step 1: Find source and destination ENIs from index
-        src_eni = self._find_eni_cached(src_ip)
-        dst_eni = self._find_eni_cached(dst_ip)
+        # (concurrently, so API fallbacks for both share batched calls)
+        src_eni, dst_eni = await asyncio.gather(
+            self._find_eni_cached(src_ip), self._find_eni_cached(dst_ip)
+        )
 
         if not src_eni:
             result.blocked_reason = f"Source IP {src_ip} not found in topology"
@@ -110,11 +246,7 @@ class AWSTraceroute:
         self._emit(hop)
 
         # Step 2: Get source route table (from cache or API)
-        src_rt = self._get_route_table_cached(src_eni.subnet_id, src_eni.vpc_id)
-        if not src_rt:
-            src_rt = await self._get_subnet_route_table(
-                src_eni.region, src_eni.vpc_id, src_eni.subnet_id
-            )
+        src_rt = await self._route_table_task(src_eni)
         hop_seq += 1
         hop = Hop(
             hop_seq, "route_table", src_rt["id"], src_rt.get("name", ""), src_eni.region
@@ -123,7 +255,7 @@ class AWSTraceroute:
         self._emit(hop)
 
         # Step 3: Find matching route
-        route = self._find_best_route(src_rt["routes"], dst_ip)
+        route = self._find_best_route(src_rt, dst_ip)
         if not route:
             result.blocked_reason = (
                 f"No route to {dst_ip} in route table {src_rt['id']}"
@@ -160,125 +292,134 @@ class AWSTraceroute:
         result.blocked_reason = f"Unsupported route target: {target}"
         return result
 
-    def _find_eni_cached(self, ip: str) -> Optional[ENIInfo]:
+    async def _find_eni_cached(self, ip: str) -> Optional[ENIInfo]:
         """Find ENI from cached topology, fallback to API if not found."""
+        if ip in self._eni_info:
+            return self._eni_info[ip]
         if self._topology:
-            eni_data = self._topology.eni_index.get(ip)
+            eni_data = self._topology.lookup_eni(ip)
             if eni_data:
-                return ENIInfo(
+                info = ENIInfo(
                     eni_id=eni_data["eni_id"],
                     ip=ip,
                     vpc_id=eni_data["vpc_id"],
                     subnet_id=eni_data["subnet_id"],
                     region=eni_data["region"],
-                    security_groups=eni_data.get("security_groups", []),
+                    security_groups=eni_data["security_groups"],
                 )
+                self._eni_info[ip] = info
+                return info
 
         # Fallback: search via API (IP might be new)
         self._status(f"IP {ip} not in cache, searching...")
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            return pool.submit(asyncio.run, self._find_eni_api(ip)).result()
+        return await self._find_eni_api(ip)
 
     async def _find_eni_api(self, ip: str) -> Optional[ENIInfo]:
         """Find ENI via API calls (fallback for uncached IPs)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        # Try cached regions first
-        regions = self._topology.regions if self._topology else []
-        if not regions:
-            ec2 = self._client("ec2", "us-east-1")
+        # Try cached regions first (ordered once when the topology loaded)
+        ordered = self._ordered_regions
+        if not ordered:
+            # The seed region may probe endpoints on first use; keep it off
+            # the event loop along with the call itself.
             resp = await loop.run_in_executor(
-                self._executor, lambda: ec2.describe_regions(AllRegions=False)
+                self._executor,
+                lambda: self._client("ec2", seed_region()).describe_regions(
+                    AllRegions=False
+                ),
             )
-            regions = [r["RegionName"] for r in resp["Regions"]]
+            ordered = _priority_order([r["RegionName"] for r in resp["Regions"]])
 
-        # Priority regions first
-        priority = ["eu-west-1", "eu-west-2", "us-east-1", "us-west-2"]
-        ordered = [r for r in priority if r in regions] + [
-            r for r in regions if r not in priority
+        # Probe all regions concurrently (priority regions are submitted first
+        # so they start first when the pool is saturated); first hit wins.
+        probes = [
+            asyncio.ensure_future(self._eni_batcher(region).lookup(ip))
+            for region in ordered
         ]
-
-        for region in ordered:
-            result = await loop.run_in_executor(
-                self._executor, self._find_eni_in_region, ip, region
-            )
-            if result:
-                # Add to cache for next time
-                if self._topology:
-                    self._topology.eni_index[ip] = {
-                        "eni_id": result.eni_id,
-                        "vpc_id": result.vpc_id,
-                        "subnet_id": result.subnet_id,
-                        "region": result.region,
-                        "security_groups": result.security_groups,
-                    }
-                return result
+        try:
+            for next_done in asyncio.as_completed(probes):
+                result = await next_done
+                if result:
+                    # Add to cache for next time
+                    if self._topology:
+                        self._topology.add_eni(
+                            ip,
+                            result.eni_id,
+                            result.vpc_id,
+                            result.subnet_id,
+                            result.region,
+                            result.security_groups,
+                        )
+                    return result
+        finally:
+            for probe in probes:
+                probe.cancel()
         return None
 
-    def _find_eni_in_region(self, ip: str, region: str) -> Optional[ENIInfo]:
-        """Check if IP exists in a specific region."""
+    def _eni_batcher(self, region: str) -> "_ENIBatcher":
+        """Get the lookup batcher for a region on the running event loop."""
+        batcher = self._eni_batchers.get(region)
+        if batcher is None or batcher.loop is not asyncio.get_running_loop():
+            batcher = _ENIBatcher(self, region)
+            self._eni_batchers[region] = batcher
+        return batcher
+
+    def _find_enis_in_region(self, ips: list[str], region: str) -> dict[str, ENIInfo]:
+        """Look up several IPs in a region with one API call."""
+        found: dict[str, ENIInfo] = {}
         try:
             ec2 = self._client("ec2", region)
-            resp = ec2.describe_network_interfaces(
-                Filters=[{"Name": "addresses.private-ip-address", "Values": [ip]}]
-            )
-            if resp.get("NetworkInterfaces"):
-                eni = resp["NetworkInterfaces"][0]
-                return ENIInfo(
-                    eni_id=eni["NetworkInterfaceId"],
-                    ip=ip,
-                    vpc_id=eni["VpcId"],
-                    subnet_id=eni["SubnetId"],
-                    region=region,
-                    security_groups=[g["GroupId"] for g in eni.get("Groups", [])],
-                )
+            paginator = ec2.get_paginator("describe_network_interfaces")
+            wanted = set(ips)
+            for page in paginator.paginate(
+                Filters=[{"Name": "addresses.private-ip-address", "Values": ips}]
+            ):
+                for eni in page.get("NetworkInterfaces", []):
+                    for addr in eni.get("PrivateIpAddresses", []):
+                        ip = addr.get("PrivateIpAddress")
+                        if ip in wanted and ip not in found:
+                            found[ip] = ENIInfo(
+                                eni_id=eni["NetworkInterfaceId"],
+                                ip=ip,
+                                vpc_id=eni["VpcId"],
+                                subnet_id=eni["SubnetId"],
+                                region=region,
+                                security_groups=[
+                                    g["GroupId"] for g in eni.get("Groups", [])
+                                ],
+                            )
         except Exception:
             pass
-        return None
+        return found
 
     def _get_route_table_cached(self, subnet_id: str, vpc_id: str) -> Optional[dict]:
         """Get route table from cached topology."""
         if not self._topology:
             return None
-        # Try subnet-specific first, then main RT for VPC
-        return self._topology.route_tables.get(
-            subnet_id
-        ) or self._topology.route_tables.get(f"main:{vpc_id}")
+        # Discovery maps each indexed subnet to its effective table; the
+        # main-RT key covers subnets added by API lookups since.
+        subnet_rts = self._topology.subnet_route_tables
+        rt_id = subnet_rts.get(subnet_id) or subnet_rts.get(f"main:{vpc_id}")
+        return self._topology.route_tables.get(rt_id) if rt_id else None
 
     def _get_segment_for_vpc(self, vpc_id: str, region: str) -> Optional[str]:
         """Find segment name for a VPC from cached attachments."""
-        for att in self._topology.cwan_attachments:
-            if (
-                att.get("ResourceArn", "").endswith(vpc_id)
-                and att.get("EdgeLocation") == region
-            ):
-                return att.get("SegmentName")
-        return None
+        att = self._cwan_att_by_vpc.get((vpc_id, region))
+        return att.get("SegmentName") if att else None
 
     def _get_nfg_for_vpc(self, vpc_id: str, region: str) -> Optional[str]:
         """Find NFG name for a VPC from cached attachments."""
-        for att in self._topology.cwan_attachments:
-            if (
-                att.get("ResourceArn", "").endswith(vpc_id)
-                and att.get("EdgeLocation") == region
-            ):
-                return att.get("NetworkFunctionGroupName")
-        return None
+        att = self._cwan_att_by_vpc.get((vpc_id, region))
+        return att.get("NetworkFunctionGroupName") if att else None
 
     def _get_send_via_nfg(self, src_segment: str, dst_segment: str) -> Optional[str]:
         """Check if traffic between segments goes via an NFG."""
-        for action in self._topology.cwan_policy.get("segment-actions", []):
-            if (
-                action.get("action") == "send-via"
-                and action.get("segment") == src_segment
-            ):
-                when_sent_to = action.get("when-sent-to", {}).get("segments", [])
-                if when_sent_to == "*" or dst_segment in when_sent_to:
-                    nfgs = action.get("via", {}).get("network-function-groups", [])
-                    return nfgs[0] if nfgs else None
-        return None
+        key = (src_segment, dst_segment)
+        if key in self._send_via:
+            return self._send_via[key]
+        # Destinations outside the policy's segment list only match "*"
+        return self._send_via_any.get(src_segment)
 
     async def _trace_via_cloudwan(
         self, result: TraceResult, hop_seq: int, src_eni: ENIInfo, dst_eni: ENIInfo
@@ -313,27 +454,23 @@ class AWSTraceroute:
             self._emit(hop)
 
             # Find the firewall attachment for this NFG
-            for att in self._topology.cwan_attachments:
-                if (
-                    att.get("NetworkFunctionGroupName") == nfg
-                    and att.get("EdgeLocation") == src_eni.region
-                ):
-                    hop_seq += 1
-                    fw_name = next(
-                        (t["Value"] for t in att.get("Tags", []) if t["Key"] == "Name"),
-                        "firewall",
-                    )
-                    fw_vpc = att.get("ResourceArn", "").split("/")[-1]
-                    hop = Hop(
-                        hop_seq,
-                        "firewall",
-                        fw_vpc,
-                        fw_name,
-                        att.get("EdgeLocation", ""),
-                        {"attachment_id": att["AttachmentId"]},
-                    )
-                    result.hops.append(hop)
-                    self._emit(hop)
+            for att in self._nfg_atts.get((nfg, src_eni.region), []):
+                hop_seq += 1
+                fw_name = next(
+                    (t["Value"] for t in att.get("Tags", []) if t["Key"] == "Name"),
+                    "firewall",
+                )
+                fw_vpc = _arn_resource_id(att.get("ResourceArn", ""))
+                hop = Hop(
+                    hop_seq,
+                    "firewall",
+                    fw_vpc,
+                    fw_name,
+                    att.get("EdgeLocation", ""),
+                    {"attachment_id": att["AttachmentId"]},
+                )
+                result.hops.append(hop)
+                self._emit(hop)
 
         # Cross-region?
         if src_eni.region != dst_eni.region:
@@ -391,11 +528,37 @@ class AWSTraceroute:
         result.reachable = True
         return result
 
+    def _route_table_task(self, eni: ENIInfo) -> "asyncio.Future[dict]":
+        """Route table for an ENI's subnet, fetched at most once (single-flight).
+
+        Concurrent traces through the same subnet share one task; failed
+        fetches are dropped so the next caller retries.
+        """
+        task = self._rt_inflight.get(eni.subnet_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_route_table(eni))
+            self._rt_inflight[eni.subnet_id] = task
+
+            def _done(t: asyncio.Future, subnet_id: str = eni.subnet_id):
+                if t.cancelled() or t.exception() is not None:
+                    self._rt_inflight.pop(subnet_id, None)
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _load_route_table(self, eni: ENIInfo) -> dict:
+        rt = self._get_route_table_cached(eni.subnet_id, eni.vpc_id)
+        if rt:
+            return rt
+        return await self._get_subnet_route_table(
+            eni.region, eni.vpc_id, eni.subnet_id
+        )
+
     async def _get_subnet_route_table(
         self, region: str, vpc_id: str, subnet_id: str
     ) -> dict:
         """Get route table for a subnet."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         ec2 = self._client("ec2", region)
 
         def fetch():
@@ -420,43 +583,64 @@ class AWSTraceroute:
     def _parse_route_table(self, rt: dict) -> dict:
         """Parse route table into simplified format."""
         name = next((t["Value"] for t in rt.get("Tags", []) if t["Key"] == "Name"), "")
-        routes = []
-        for r in rt.get("Routes", []):
-            target = (
-                r.get("GatewayId")
-                or r.get("NatGatewayId")
-                or r.get("TransitGatewayId")
-                or r.get("NetworkInterfaceId")
-                or "local"
-            )
-            dest = (
-                r.get("DestinationCidrBlock") or r.get("DestinationIpv6CidrBlock") or ""
-            )
-            routes.append(
-                {
-                    "destination": dest,
-                    "target": target if target != "local" else "local",
-                    "core_network_arn": r.get("CoreNetworkArn"),
-                    "state": r.get("State", "active"),
-                }
+        routes = [Route.from_api(r) for r in rt.get("Routes", [])]
+        parsed = {"id": rt["RouteTableId"], "name": name, "routes": routes}
+        self._prefix_tables(parsed)
+        return parsed
+
+    def _prefix_tables(self, rt: dict) -> PrefixTables:
+        """Get the LPM tables for a route table, built once per table."""
+        tables = self._prefix_cache.get(rt["id"])
+        if tables is None:
+            tables = build_prefix_tables(
+                rt["routes"],
+                lambda dest: self._status(
+                    f"Ignoring invalid route {dest!r} in {rt['id']}"
+                ),
             )
-        return {"id": rt["RouteTableId"], "name": name, "routes": routes}
+            self._prefix_cache[rt["id"]] = tables
+        return tables
 
-    def _find_best_route(self, routes: list[dict], dst_ip: str) -> Optional[dict]:
+    def _find_best_route(self, rt: dict, dst_ip: str) -> Optional[dict]:
         """Find most specific matching route (longest prefix match)."""
         dst = ip_address(dst_ip)
-        best_match = None
-        best_prefix_len = -1
+        v4, v6 = self._prefix_tables(rt)
+        dst_int = int(dst)
+        # Tables are sorted longest prefix first, so the first match wins
+        for network, mask, _prefixlen, route in v4 if dst.version == 4 else v6:
+            if dst_int & mask == network:
+                return route
+        return None
 
-        for route in routes:
-            dest = route.get("destination", "")
-            if not dest or route.get("state") == "blackhole":
-                continue
-            try:
-                network = ip_network(dest, strict=False)
-                if dst in network and network.prefixlen > best_prefix_len:
-                    best_match = route
-                    best_prefix_len = network.prefixlen
-            except ValueError:
-                continue
-        return best_match
+
+def build_prefix_tables(
+    routes: list[dict], on_invalid: Optional[Callable[[str], None]] = None
+) -> PrefixTables:
+    """Pre-parse routes into integer prefix tables, longest prefix first.
+
+    Blackhole and unparseable routes are dropped (``on_invalid`` is called with
+    each unparseable destination). The sort is stable, so among equal-length
+    prefixes the first route listed still wins.
+    """
+    v4: list[PrefixEntry] = []
+    v6: list[PrefixEntry] = []
+    for route in routes:
+        dest = route.get("destination", "")
+        if not dest or route.get("state") == "blackhole":
+            continue
+        try:
+            network = ip_network(dest, strict=False)
+        except ValueError:
+            if on_invalid:
+                on_invalid(dest)
+            continue
+        entry = (
+            int(network.network_address),
+            int(network.netmask),
+            network.prefixlen,
+            route,
+        )
+        (v4 if network.version == 4 else v6).append(entry)
+    v4.sort(key=lambda e: -e[2])
+    v6.sort(key=lambda e: -e[2])
+    return v4, v6
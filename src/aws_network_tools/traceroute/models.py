@@ -1,14 +1,48 @@
 """Data models for traceroute."""
 
 from dataclasses import dataclass, field
-from typing import Literal
+from io import StringIO
+from typing import Literal, Optional
+
+from ..core.records import Record
 
 HopType = Literal[
     "eni", "route_table", "cloud_wan_segment", "nfg", "firewall", "destination"
 ]
 
+# Rich style per hop type when printing a trace
+HOP_STYLES: dict[str, str] = {
+    "destination": "green",
+    "nfg": "yellow",
+    "firewall": "red",
+}
+
+
+@dataclass(slots=True)
+class Route(Record):
+    """Simplified VPC route table entry."""
 
-@dataclass
+    destination: str
+    target: str
+    core_network_arn: Optional[str] = None
+    state: str = "active"
+
+    @classmethod
+    def from_api(cls, r: dict) -> "Route":
+        """Build from an EC2 DescribeRouteTables route."""
+        return cls(
+            r.get("DestinationCidrBlock") or r.get("DestinationIpv6CidrBlock") or "",
+            r.get("GatewayId")
+            or r.get("NatGatewayId")
+            or r.get("TransitGatewayId")
+            or r.get("NetworkInterfaceId")
+            or "local",
+            r.get("CoreNetworkArn"),
+            r.get("State", "active"),
+        )
+
+
+@dataclass(slots=True)
 class Hop:
     """Single hop in the trace path."""
 
@@ -17,14 +51,24 @@ class Hop:
     id: str
     name: str = ""
     region: str = ""
-    detail: dict = field(default_factory=dict)
+    detail: dict | None = None  # most hops carry no detail
 
     def __str__(self):
-        name_str = f" ({self.name})" if self.name else ""
-        return f"{self.seq}. [{self.type}] {self.id}{name_str} @ {self.region}"
+        if self.name:
+            return f"{self.seq}. [{self.type}] {self.id} ({self.name}) @ {self.region}"
+        return f"{self.seq}. [{self.type}] {self.id} @ {self.region}"
+
+    def markup(self, show_name: bool = True) -> str:
+        """Rich markup line for live trace output."""
+        style = HOP_STYLES.get(self.type, "white")
+        name_str = f" [dim]({self.name})[/]" if show_name else ""
+        return (
+            f"[dim]{self.seq}.[/] [{style}]{self.type:18}[/] {self.id}{name_str}"
+            f" @ {self.region}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityCheck:
     """Security evaluation at a hop."""
 
@@ -34,7 +78,7 @@ class SecurityCheck:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceResult:
     """Complete trace result."""
 
@@ -50,9 +94,15 @@ class TraceResult:
         status = (
             "✅ REACHABLE" if self.reachable else f"❌ BLOCKED at {self.blocked_at}"
         )
-        lines = [f"Trace: {self.src_ip} → {self.dst_ip}", status, "", "Path:"]
+        buf = StringIO()
+        write = buf.write
+        write(f"Trace: {self.src_ip} → {self.dst_ip}\n{status}\n\nPath:")
         for hop in self.hops:
-            lines.append(f"  {hop}")
+            # Same format as Hop.__str__, inlined
+            write(f"\n  {hop.seq}. [{hop.type}] {hop.id}")
+            if hop.name:
+                write(f" ({hop.name})")
+            write(f" @ {hop.region}")
         if self.blocked_reason:
-            lines.append(f"\nBlocked: {self.blocked_reason}")
-        return "\n".join(lines)
+            write(f"\n\nBlocked: {self.blocked_reason}")
+        return buf.getvalue()
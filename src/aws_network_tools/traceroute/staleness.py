@@ -1,40 +1,61 @@
 """Staleness detection for network topology cache - PoC."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 import boto3
 
 from ..core.cache import Cache
+from .clients import resolve_session, trace_client
 
 
-@dataclass
+# (region, tgw_count, vpc_count); a count is None when its lookup failed
+RegionMarker = tuple[str, Optional[int], Optional[int]]
+
+
+@dataclass(slots=True)
 class ChangeMarkers:
     """Quick-check markers for cache staleness."""
 
     cwan_policy_version: Optional[int] = None
     cwan_attachment_count: int = 0
-    tgw_count: dict[str, int] = None  # region -> count
-    vpc_count: dict[str, int] = None  # region -> count
+    regions: tuple[RegionMarker, ...] = ()  # sorted by region
+
+    @property
+    def region_names(self) -> list[str]:
+        return [r[0] for r in self.regions]
 
-    def __post_init__(self):
-        self.tgw_count = self.tgw_count or {}
-        self.vpc_count = self.vpc_count or {}
+    @property
+    def tgw_count(self) -> dict[str, int]:
+        return {r: tgws for r, tgws, _ in self.regions if tgws is not None}
+
+    @property
+    def vpc_count(self) -> dict[str, int]:
+        return {r: vpcs for r, _, vpcs in self.regions if vpcs is not None}
 
     def to_dict(self) -> dict:
         return {
             "cwan_policy_version": self.cwan_policy_version,
             "cwan_attachment_count": self.cwan_attachment_count,
-            "tgw_count": self.tgw_count,
-            "vpc_count": self.vpc_count,
+            "regions": [list(r) for r in self.regions],
         }
 
     @classmethod
     def from_dict(cls, d: dict) -> "ChangeMarkers":
+        if "regions" in d:
+            regions = tuple(tuple(r) for r in d["regions"])
+        else:
+            # Markers saved before the flat layout: region -> count dicts
+            tgw_count = d.get("tgw_count") or {}
+            vpc_count = d.get("vpc_count") or {}
+            regions = tuple(
+                (r, tgw_count.get(r), vpc_count.get(r))
+                for r in sorted(tgw_count.keys() | vpc_count.keys())
+            )
         return cls(
             cwan_policy_version=d.get("cwan_policy_version"),
             cwan_attachment_count=d.get("cwan_attachment_count", 0),
-            tgw_count=d.get("tgw_count", {}),
-            vpc_count=d.get("vpc_count", {}),
+            regions=regions,
         )
 
 
@@ -42,57 +63,77 @@ class StalenessChecker:
     """Check if cached topology is stale without full rebuild."""
 
     MARKERS_CACHE = "topology_markers"
+    # Seconds for which markers saved or confirmed fresh are trusted as-is
+    VERIFIED_WINDOW = 60
 
-    def __init__(self, profile: Optional[str] = None):
+    def __init__(
+        self, profile: Optional[str] = None, session: Optional[boto3.Session] = None
+    ):
         self.profile = profile
-        self.session = (
-            boto3.Session(profile_name=profile) if profile else boto3.Session()
-        )
+        self.session = resolve_session(profile, session)
         self._markers_cache = Cache(self.MARKERS_CACHE)
 
     def _client(self, service: str, region: str = "us-east-1"):
-        return self.session.client(service, region_name=region)
+        return trace_client(self.session, service, region)
 
     def get_current_markers(self, regions: list[str] = None) -> ChangeMarkers:
-        """Get current state markers (fast - few API calls)."""
+        """Get current state markers (fast - few API calls, run concurrently)."""
         markers = ChangeMarkers()
+        regions = regions or []
+
+        # One worker for the Cloud WAN chain plus two calls per region
+        with ThreadPoolExecutor(max_workers=min(32, 1 + 2 * len(regions))) as pool:
+            cwan = pool.submit(self._fetch_cwan_markers)
+            tgw_futures = {
+                r: pool.submit(
+                    self._count, r, "describe_transit_gateways", "TransitGateways"
+                )
+                for r in regions
+            }
+            vpc_futures = {
+                r: pool.submit(self._count, r, "describe_vpcs", "Vpcs") for r in regions
+            }
+
+            markers.cwan_policy_version, markers.cwan_attachment_count = cwan.result()
+            markers.regions = tuple(
+                (r, tgw_futures[r].result(), vpc_futures[r].result())
+                for r in sorted(set(regions))
+            )
+
+        return markers
 
-        # 1. Cloud WAN policy version (1 API call)
+    def _fetch_cwan_markers(self) -> tuple[Optional[int], int]:
+        """Cloud WAN policy version and attachment count (sequential chain)."""
         try:
             nm = self._client("networkmanager", "us-east-1")
             networks = nm.list_core_networks().get("CoreNetworks", [])
             if networks:
                 cn_id = networks[0]["CoreNetworkId"]
                 policy = nm.get_core_network_policy(CoreNetworkId=cn_id)
-                markers.cwan_policy_version = policy.get("CoreNetworkPolicy", {}).get(
-                    "PolicyVersionId"
-                )
-
-                # Attachment count (1 more call)
+                version = policy.get("CoreNetworkPolicy", {}).get("PolicyVersionId")
                 attachments = nm.list_attachments(CoreNetworkId=cn_id)
-                markers.cwan_attachment_count = len(attachments.get("Attachments", []))
+                return version, len(attachments.get("Attachments", []))
         except Exception:
             pass
+        return None, 0
 
-        # 2. TGW and VPC counts per region (2 calls per region, but fast)
-        if regions:
-            for region in regions[:5]:  # Limit to 5 regions for speed
-                try:
-                    ec2 = self._client("ec2", region)
-                    tgws = ec2.describe_transit_gateways().get("TransitGateways", [])
-                    markers.tgw_count[region] = len(tgws)
-
-                    vpcs = ec2.describe_vpcs().get("Vpcs", [])
-                    markers.vpc_count[region] = len(vpcs)
-                except Exception:
-                    pass
-
-        return markers
+    def _count(self, region: str, operation: str, key: str) -> Optional[int]:
+        """Count resources returned by a describe call, None on error."""
+        try:
+            ec2 = self._client("ec2", region)
+            return len(getattr(ec2, operation)().get(key, []))
+        except Exception:
+            return None
 
     def save_markers(self, markers: ChangeMarkers):
         """Save markers alongside topology cache."""
         self._markers_cache.set(markers.to_dict())
 
+    def recently_verified(self) -> bool:
+        """True if markers were saved within VERIFIED_WINDOW (local check)."""
+        info = self._markers_cache.get_info()
+        return bool(info) and info["age_seconds"] < self.VERIFIED_WINDOW
+
     def get_saved_markers(self) -> Optional[ChangeMarkers]:
         """Get previously saved markers."""
         data = self._markers_cache.get(
@@ -102,21 +143,33 @@ class StalenessChecker:
             return ChangeMarkers.from_dict(data)
         return None
 
-    def is_stale(self, regions: list[str] = None) -> tuple[bool, str]:
+    def is_stale(
+        self,
+        regions: list[str] = None,
+        saved: Optional[ChangeMarkers] = None,
+        current: Optional[ChangeMarkers] = None,
+    ) -> tuple[bool, str]:
         """
         Quick check if cache is likely stale.
         Returns (is_stale, reason).
+
+        Already-loaded ``saved`` or prefetched ``current`` markers may be
+        passed in to skip reading or fetching them again.
         """
-        saved = self.get_saved_markers()
+        saved = saved or self.get_saved_markers()
         if not saved:
             return True, "No markers saved"
 
-        current = self.get_current_markers(regions)
+        current = current or self.get_current_markers(regions)
+
+        # Common case: nothing changed at all (flat tuples compare in one step)
+        if current == saved:
+            return False, "No changes detected"
 
-        # Check Cloud WAN policy version
+        # Check Cloud WAN policy version (a failed lookup now reports None,
+        # which is not treated as a change)
         if (
             current.cwan_policy_version is not None
-            and saved.cwan_policy_version is not None
             and current.cwan_policy_version != saved.cwan_policy_version
         ):
             return (
@@ -135,17 +188,17 @@ class StalenessChecker:
                 f"Attachment count changed: {saved.cwan_attachment_count} → {current.cwan_attachment_count}",
             )
 
-        # Check TGW counts (only for regions we checked before)
-        for region, count in current.tgw_count.items():
-            saved_count = saved.tgw_count.get(region)
-            if saved_count is not None and saved_count != count:
-                return True, f"TGW count changed in {region}: {saved_count} → {count}"
-
-        # Check VPC counts (only for regions we checked before)
-        for region, count in current.vpc_count.items():
-            saved_count = saved.vpc_count.get(region)
-            if saved_count is not None and saved_count != count:
-                return True, f"VPC count changed in {region}: {saved_count} → {count}"
+        # Check per-region counts (only for regions checked before, and only
+        # where both lookups succeeded)
+        saved_by_region = {r: (tgws, vpcs) for r, tgws, vpcs in saved.regions}
+        for region, tgws, vpcs in current.regions:
+            before = saved_by_region.get(region)
+            if before is None:
+                continue
+            if tgws is not None and before[0] is not None and tgws != before[0]:
+                return True, f"TGW count changed in {region}: {before[0]} → {tgws}"
+            if vpcs is not None and before[1] is not None and vpcs != before[1]:
+                return True, f"VPC count changed in {region}: {before[1]} → {vpcs}"
 
         return False, "No changes detected"
 
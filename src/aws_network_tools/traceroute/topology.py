@@ -1,21 +1,63 @@
 """Network topology discovery and caching."""
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+import bisect
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Optional, Sequence
 import boto3
 
 from ..core.cache import Cache
+from .clients import get_account_id, resolve_session, seed_region, trace_client
+from .models import Route
 from .staleness import StalenessChecker
 
+# Fields kept from raw AWS records before they are stored in the topology;
+# tracing reads only these, so the rest would just bloat the cache file.
+_PROJECTIONS: dict[str, tuple[str, ...]] = {
+    "vpc": ("VpcId", "CidrBlock", "State", "IsDefault", "OwnerId"),
+    "tgw": ("TransitGatewayId", "State", "OwnerId"),
+    "tgw_route_table": (
+        "TransitGatewayRouteTableId",
+        "TransitGatewayId",
+        "State",
+        "DefaultAssociationRouteTable",
+        "DefaultPropagationRouteTable",
+    ),
+    "cwan_attachment": (
+        "AttachmentId",
+        "AttachmentType",
+        "State",
+        "EdgeLocation",
+        "ResourceArn",
+        "SegmentName",
+        "NetworkFunctionGroupName",
+    ),
+}
+
+
+def _project(kind: str, item: dict) -> dict:
+    """Keep the ``_PROJECTIONS`` fields of ``item`` plus its Name tag."""
+    out = {k: item[k] for k in _PROJECTIONS[kind] if k in item}
+    for tag in item.get("Tags", ()):
+        if tag["Key"] == "Name":
+            out["Tags"] = [tag]
+            break
+    return out
+
 
 @dataclass
 class NetworkTopology:
     """Cached network topology."""
 
     account_id: str
+    # Every enabled region, searched by API fallbacks and staleness checks
     regions: list[str] = field(default_factory=list)
+    # Regions whose resources were discovered (active ones between full scans)
+    scanned_regions: list[str] = field(default_factory=list)
 
     # Cloud WAN
     global_networks: list[dict] = field(default_factory=list)
@@ -30,30 +72,100 @@ class NetworkTopology:
     # VPCs by region
     vpcs: dict[str, list[dict]] = field(default_factory=dict)
 
-    # Route tables: subnet_id -> {id, name, routes}
+    # Route tables: route table id -> {id, name, routes, vpc_id}
     route_tables: dict[str, dict] = field(default_factory=dict)
-
-    # ENI index: ip -> {eni_id, vpc_id, subnet_id, region}
-    eni_index: dict[str, dict] = field(default_factory=dict)
+    # subnet_id (or "main:<vpc_id>") -> id of the route table that applies
+    subnet_route_tables: dict[str, str] = field(default_factory=dict)
+
+    # ENI index as parallel columns: ip -> row, then one list per attribute
+    eni_ip_to_idx: dict[str, int] = field(default_factory=dict)
+    eni_ids: list[str] = field(default_factory=list)
+    vpc_ids: list[Optional[str]] = field(default_factory=list)
+    subnet_ids: list[Optional[str]] = field(default_factory=list)
+    eni_regions: list[str] = field(default_factory=list)
+    sg_lists: list[list[str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Field mapping for caching, sharing the field values rather than
+        deep-copying them as ``asdict`` does."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def add_eni(
+        self,
+        ip: str,
+        eni_id: str,
+        vpc_id: Optional[str],
+        subnet_id: Optional[str],
+        region: str,
+        security_groups: list[str],
+    ):
+        """Index an IP, replacing any existing row for it."""
+        idx = self.eni_ip_to_idx.get(ip)
+        if idx is None:
+            self.eni_ip_to_idx[ip] = len(self.eni_ids)
+            self.eni_ids.append(eni_id)
+            self.vpc_ids.append(vpc_id)
+            self.subnet_ids.append(subnet_id)
+            self.eni_regions.append(region)
+            self.sg_lists.append(security_groups)
+        else:
+            self.eni_ids[idx] = eni_id
+            self.vpc_ids[idx] = vpc_id
+            self.subnet_ids[idx] = subnet_id
+            self.eni_regions[idx] = region
+            self.sg_lists[idx] = security_groups
+
+    def lookup_eni(self, ip: str) -> Optional[dict]:
+        """ENI details for an IP as a dict, or None if not indexed."""
+        idx = self.eni_ip_to_idx.get(ip)
+        if idx is None:
+            return None
+        return {
+            "eni_id": self.eni_ids[idx],
+            "vpc_id": self.vpc_ids[idx],
+            "subnet_id": self.subnet_ids[idx],
+            "region": self.eni_regions[idx],
+            "security_groups": self.sg_lists[idx],
+        }
 
 
 class TopologyDiscovery:
-    """Discover and cache AWS network topology."""
+    """Discover and cache AWS network topology.
 
-    CACHE_NAMESPACE = "topology"
+    Discovery fans out boto3 calls over a thread pool. Its size comes from
+    ``max_parallel_requests``, then the ``AWSNET_MAX_PARALLEL`` environment
+    variable, then ``os.cpu_count() * 5``.
+    """
 
-    def __init__(self, profile: Optional[str] = None, on_status=None):
+    CACHE_NAMESPACE = "topology"
+    # Regions worth scanning, from the last full scan; re-scan all daily
+    ACTIVE_REGIONS_CACHE = "topology_active_regions"
+    FULL_SCAN_INTERVAL = 86400
+
+    def __init__(
+        self,
+        profile: Optional[str] = None,
+        on_status=None,
+        session: Optional[boto3.Session] = None,
+        max_parallel_requests: Optional[int] = None,
+    ):
         self.profile = profile
-        self.session = (
-            boto3.Session(profile_name=profile) if profile else boto3.Session()
+        self.session = resolve_session(profile, session)
+        workers = max_parallel_requests or int(
+            os.environ.get("AWSNET_MAX_PARALLEL", (os.cpu_count() or 1) * 5)
         )
-        self._executor = ThreadPoolExecutor(max_workers=20)
+        self._max_workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # Bounds region calls in flight; made on first use per event loop
+        self._region_sem: Optional[asyncio.Semaphore] = None
+        self._region_sem_loop: Optional[asyncio.AbstractEventLoop] = None
         self._cache = Cache(self.CACHE_NAMESPACE)
+        self._active_regions = Cache(self.ACTIVE_REGIONS_CACHE)
         self._on_status = on_status
-        self._staleness = StalenessChecker(profile=profile)
+        self._staleness = StalenessChecker(profile=profile, session=self.session)
 
     def _client(self, service: str, region: str = "us-east-1"):
-        return self.session.client(service, region_name=region)
+        return trace_client(self.session, service, region)
 
     def _status(self, msg: str):
         if self._on_status:
@@ -61,70 +173,149 @@ class TopologyDiscovery:
 
     def get_cached(self, check_staleness: bool = True) -> Optional[NetworkTopology]:
         """Get topology from cache if valid and not stale."""
+        # Fetch current markers in the background while the account lookup
+        # and cache load run, so the staleness API calls overlap them.
+        saved_markers = current_markers = None
+        if check_staleness and not self._staleness.recently_verified():
+            saved_markers = self._staleness.get_saved_markers()
+            if saved_markers:
+                # Use regions from saved markers, not topology
+                current_markers = self._executor.submit(
+                    self._staleness.get_current_markers,
+                    saved_markers.region_names,
+                )
+
         account_id = self._get_account_id()
         data = self._cache.get(current_account=account_id)
-        if not data:
+        if not data or "eni_index" in data or "subnet_route_tables" not in data:
+            # Nothing cached, or a cache from before the columnar ENI index or
+            # the route tables stored once by ID
+            if current_markers:
+                current_markers.cancel()
             return None
 
         topology = NetworkTopology(**data)
 
         # Quick staleness check using saved markers (not new regions)
-        if check_staleness:
+        if current_markers:
             self._status("Checking for changes...")
-            saved_markers = self._staleness.get_saved_markers()
-            if saved_markers:
-                # Use regions from saved markers, not topology
-                check_regions = list(saved_markers.tgw_count.keys())[:5]
-                is_stale, reason = self._staleness.is_stale(regions=check_regions)
-                if is_stale:
-                    self._status(f"Cache stale: {reason}")
-                    return None
+            is_stale, reason = self._staleness.is_stale(
+                saved=saved_markers, current=current_markers.result()
+            )
+            if is_stale:
+                self._status(f"Cache stale: {reason}")
+                return None
+            # Re-save to restart the window in which no re-check is needed
+            self._staleness.save_markers(saved_markers)
 
         return topology
 
     def clear_cache(self):
-        """Clear the topology cache."""
+        """Clear the topology cache (the next discovery scans every region)."""
         self._cache.clear()
+        self._active_regions.clear()
 
-    def _get_account_id(self) -> str:
-        sts = self._client("sts")
-        return sts.get_caller_identity()["Account"]
+    @classmethod
+    def all_ips(cls) -> tuple[str, ...]:
+        """Sorted IPs from the cached ENI index, for prefix completion."""
+        data = Cache(cls.CACHE_NAMESPACE).get(ignore_expiry=True)
+        if not data:
+            return ()
+        return tuple(sorted(data.get("eni_ip_to_idx", {})))
+
+    @classmethod
+    def cache_stamp(cls) -> Optional[int]:
+        """Modification time of the topology cache file, or None if absent."""
+        try:
+            return Cache(cls.CACHE_NAMESPACE).cache_file.stat().st_mtime_ns
+        except OSError:
+            return None
 
-    async def discover(self, regions: list[str] = None) -> NetworkTopology:
-        """Discover full network topology."""
+    def _get_account_id(self) -> str:
+        return get_account_id(self.session)
+
+    @classmethod
+    def discover_isolated(
+        cls, profile: Optional[str] = None, regions: Optional[list[str]] = None
+    ) -> NetworkTopology:
+        """Run ``discover()`` in a separate process and return its result.
+
+        For hosts that already run an event loop (e.g. a web server): the
+        worker gets its own loop, sessions and clients, so none of them are
+        shared with or left behind in the caller's process.
+        """
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            data = pool.submit(_discover_worker, profile, regions).result()
+        return NetworkTopology(**data)
+
+    async def discover(
+        self, regions: list[str] = None, full_scan: bool = False
+    ) -> NetworkTopology:
+        """Discover full network topology.
+
+        Without explicit ``regions``, resources are only discovered in regions
+        that held some at the last full scan, unless ``full_scan`` is set or
+        that scan is older than FULL_SCAN_INTERVAL. ``topology.regions`` always
+        lists every enabled region.
+        """
         loop = asyncio.get_event_loop()
         account_id = await loop.run_in_executor(self._executor, self._get_account_id)
 
         # Get regions
         self._status("Getting regions...")
-        if not regions:
-            ec2 = self._client("ec2", "us-east-1")
+        scanned_all = False
+        if regions:
+            scan = regions
+        else:
+            # The seed region may probe endpoints on first use; keep it off
+            # the event loop along with the call itself.
             resp = await loop.run_in_executor(
-                self._executor, lambda: ec2.describe_regions(AllRegions=False)
+                self._executor,
+                lambda: self._client("ec2", seed_region()).describe_regions(
+                    AllRegions=False
+                ),
             )
             regions = [r["RegionName"] for r in resp["Regions"]]
+            active = (
+                None
+                if full_scan
+                else self._active_regions.get(current_account=account_id)
+            )
+            scan = [r for r in regions if r in active] if active else regions
+            scanned_all = scan is regions
 
-        topology = NetworkTopology(account_id=account_id, regions=regions)
+        topology = NetworkTopology(
+            account_id=account_id, regions=regions, scanned_regions=scan
+        )
 
         # Discover in parallel
         await asyncio.gather(
             self._discover_cloudwan(topology),
-            self._discover_tgws(topology, regions),
-            self._discover_vpcs(topology, regions),
+            self._discover_tgws(topology, scan),
+            self._discover_vpcs(topology, scan),
         )
 
         # Build ENI index from VPCs
         self._status("Building ENI index...")
-        await self._build_eni_index(topology, regions)
+        await self._build_eni_index(topology, scan)
+        self._resolve_subnet_route_tables(topology)
 
         # Cache it
         self._status("Caching topology...")
-        self._cache.set(asdict(topology), account_id=account_id)
+        self._cache.set(topology.to_dict(), account_id=account_id)
 
-        # Save staleness markers
-        markers = self._staleness.get_current_markers(regions=regions[:5])
+        # Save staleness markers for every enabled region, so resources
+        # appearing in a region skipped by this scan still mark the cache stale
+        markers = self._staleness.get_current_markers(regions=regions)
         self._staleness.save_markers(markers)
 
+        if scanned_all:
+            self._active_regions.set(
+                _active_regions(topology),
+                ttl_seconds=self.FULL_SCAN_INTERVAL,
+                account_id=account_id,
+            )
+
         return topology
 
     async def _discover_cloudwan(self, topology: NetworkTopology):
@@ -132,13 +323,11 @@ class TopologyDiscovery:
         loop = asyncio.get_event_loop()
         nm = self._client("networkmanager", "us-east-1")
 
-        def fetch():
-            self._status("Discovering Cloud WAN...")
-            # Global networks
+        def fetch_global_networks():
             gn_resp = nm.describe_global_networks()
             topology.global_networks = gn_resp.get("GlobalNetworks", [])
 
-            # Core networks
+        def fetch_core_network():
             cn_resp = nm.list_core_networks()
             topology.core_networks = cn_resp.get("CoreNetworks", [])
 
@@ -146,8 +335,6 @@ class TopologyDiscovery:
                 cn_id = topology.core_networks[0]["CoreNetworkId"]
 
                 # Policy
-                import json
-
                 policy_resp = nm.get_core_network_policy(CoreNetworkId=cn_id)
                 policy_doc = policy_resp.get("CoreNetworkPolicy", {}).get(
                     "PolicyDocument", "{}"
@@ -162,125 +349,191 @@ class TopologyDiscovery:
                 self._status("Getting Cloud WAN attachments...")
                 paginator = nm.get_paginator("list_attachments")
                 for page in paginator.paginate(CoreNetworkId=cn_id):
-                    topology.cwan_attachments.extend(page.get("Attachments", []))
+                    topology.cwan_attachments.extend(
+                        _project("cwan_attachment", a)
+                        for a in page.get("Attachments", [])
+                    )
 
-        await loop.run_in_executor(self._executor, fetch)
+        # Global networks don't feed the core network chain; fetch both at once
+        self._status("Discovering Cloud WAN...")
+        await asyncio.gather(
+            loop.run_in_executor(self._executor, fetch_global_networks),
+            loop.run_in_executor(self._executor, fetch_core_network),
+        )
+
+    async def _map_regions(self, fn: Callable[[str], Any], regions: list[str]):
+        """Run ``fn(region)`` on the pool for each region; return the results.
+
+        At most ``_max_workers`` calls are handed to the pool at once across
+        all phases, and if any region fails the calls not yet started are
+        cancelled instead of running on against a discovery that has failed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._region_sem is None or self._region_sem_loop is not loop:
+            self._region_sem = asyncio.Semaphore(self._max_workers)
+            self._region_sem_loop = loop
+        sem = self._region_sem
+
+        async def run(region: str):
+            async with sem:
+                return await loop.run_in_executor(self._executor, fn, region)
+
+        tasks = [asyncio.ensure_future(run(r)) for r in regions]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
     async def _discover_tgws(self, topology: NetworkTopology, regions: list[str]):
         """Discover Transit Gateways in all regions."""
-        loop = asyncio.get_event_loop()
 
-        async def fetch_region(region: str):
-            def _fetch():
-                ec2 = self._client("ec2", region)
-                tgw_resp = ec2.describe_transit_gateways()
-                tgws = tgw_resp.get("TransitGateways", [])
-                if tgws:
-                    topology.tgws[region] = tgws
-                    # Get route tables for each TGW
-                    for tgw in tgws:
-                        rt_resp = ec2.describe_transit_gateway_route_tables(
-                            Filters=[
-                                {
-                                    "Name": "transit-gateway-id",
-                                    "Values": [tgw["TransitGatewayId"]],
-                                }
-                            ]
-                        )
-                        topology.tgw_route_tables[tgw["TransitGatewayId"]] = (
-                            rt_resp.get("TransitGatewayRouteTables", [])
-                        )
-
-            return await loop.run_in_executor(self._executor, _fetch)
+        def fetch(region: str) -> tuple[list[dict], dict[str, list[dict]]]:
+            ec2 = self._client("ec2", region)
+            tgw_resp = ec2.describe_transit_gateways()
+            tgws = tgw_resp.get("TransitGateways", [])
+            if not tgws:
+                return [], {}
+            # Route tables for every TGW in the region in one call
+            by_tgw = {tgw["TransitGatewayId"]: [] for tgw in tgws}
+            paginator = ec2.get_paginator("describe_transit_gateway_route_tables")
+            for page in paginator.paginate(
+                Filters=[{"Name": "transit-gateway-id", "Values": list(by_tgw)}]
+            ):
+                for rt in page.get("TransitGatewayRouteTables", []):
+                    by_tgw.setdefault(rt["TransitGatewayId"], []).append(
+                        _project("tgw_route_table", rt)
+                    )
+            return [_project("tgw", t) for t in tgws], by_tgw
 
         self._status("Discovering Transit Gateways...")
-        await asyncio.gather(*[fetch_region(r) for r in regions])
+        results = await self._map_regions(fetch, regions)
+        # Merge per-region results here, on the loop, not from the workers
+        for region, (tgws, route_tables) in zip(regions, results):
+            if tgws:
+                topology.tgws[region] = tgws
+                topology.tgw_route_tables.update(route_tables)
 
     async def _discover_vpcs(self, topology: NetworkTopology, regions: list[str]):
         """Discover VPCs and route tables in all regions."""
-        loop = asyncio.get_event_loop()
 
-        async def fetch_region(region: str):
-            def _fetch():
-                ec2 = self._client("ec2", region)
-                vpc_resp = ec2.describe_vpcs()
-                vpcs = vpc_resp.get("Vpcs", [])
-                if vpcs:
-                    topology.vpcs[region] = vpcs
-                    # Get route tables for this region
-                    rt_resp = ec2.describe_route_tables(
-                        Filters=[
-                            {"Name": "vpc-id", "Values": [v["VpcId"] for v in vpcs]}
-                        ]
-                    )
-                    for rt in rt_resp.get("RouteTables", []):
-                        name = next(
-                            (
-                                t["Value"]
-                                for t in rt.get("Tags", [])
-                                if t["Key"] == "Name"
-                            ),
-                            "",
-                        )
-                        routes = []
-                        for r in rt.get("Routes", []):
-                            target = (
-                                r.get("GatewayId")
-                                or r.get("NatGatewayId")
-                                or r.get("TransitGatewayId")
-                                or r.get("NetworkInterfaceId")
-                                or "local"
-                            )
-                            routes.append(
-                                {
-                                    "destination": r.get("DestinationCidrBlock", ""),
-                                    "target": target if target != "local" else "local",
-                                    "core_network_arn": r.get("CoreNetworkArn"),
-                                    "state": r.get("State", "active"),
-                                }
-                            )
-                        rt_data = {
-                            "id": rt["RouteTableId"],
-                            "name": name,
-                            "routes": routes,
-                            "vpc_id": rt["VpcId"],
-                        }
-                        # Index by subnet associations
-                        for assoc in rt.get("Associations", []):
-                            if assoc.get("SubnetId"):
-                                topology.route_tables[assoc["SubnetId"]] = rt_data
-                            if assoc.get("Main"):
-                                # Store main RT under vpc_id for fallback
-                                topology.route_tables[f"main:{rt['VpcId']}"] = rt_data
-
-            return await loop.run_in_executor(self._executor, _fetch)
+        def fetch(region: str) -> tuple[list[dict], dict[str, dict], dict[str, str]]:
+            ec2 = self._client("ec2", region)
+            vpc_resp = ec2.describe_vpcs()
+            vpcs = vpc_resp.get("Vpcs", [])
+            route_tables: dict[str, dict] = {}
+            subnet_route_tables: dict[str, str] = {}
+            if not vpcs:
+                return [], route_tables, subnet_route_tables
+            # Get route tables for this region
+            paginator = ec2.get_paginator("describe_route_tables")
+            pages = paginator.paginate(
+                Filters=[{"Name": "vpc-id", "Values": [v["VpcId"] for v in vpcs]}]
+            )
+            for rt in (rt for page in pages for rt in page["RouteTables"]):
+                name = next(
+                    (t["Value"] for t in rt.get("Tags", ()) if t["Key"] == "Name"),
+                    "",
+                )
+                rt_data = {
+                    "id": rt["RouteTableId"],
+                    "name": name,
+                    "routes": [Route.from_api(r) for r in rt.get("Routes", ())],
+                    "vpc_id": rt["VpcId"],
+                }
+                route_tables[rt_data["id"]] = rt_data
+                # Index by subnet associations
+                for assoc in rt.get("Associations", []):
+                    if assoc.get("SubnetId"):
+                        subnet_route_tables[assoc["SubnetId"]] = rt_data["id"]
+                    if assoc.get("Main"):
+                        # Store main RT under vpc_id for fallback
+                        subnet_route_tables[f"main:{rt['VpcId']}"] = rt_data["id"]
+            return [_project("vpc", v) for v in vpcs], route_tables, subnet_route_tables
 
         self._status("Discovering VPCs and route tables...")
-        await asyncio.gather(*[fetch_region(r) for r in regions])
+        results = await self._map_regions(fetch, regions)
+        for region, (vpcs, route_tables, subnet_route_tables) in zip(regions, results):
+            if vpcs:
+                topology.vpcs[region] = vpcs
+                topology.route_tables.update(route_tables)
+                topology.subnet_route_tables.update(subnet_route_tables)
+
+    def _resolve_subnet_route_tables(self, topology: NetworkTopology):
+        """Point every indexed subnet at the route table that applies to it.
+
+        Subnets without an explicit association use their VPC's main table;
+        mapping the subnet ID to its table ID makes lookups two dict gets.
+        """
+        subnet_rts = topology.subnet_route_tables
+        for subnet_id, vpc_id in zip(topology.subnet_ids, topology.vpc_ids):
+            if subnet_id and subnet_id not in subnet_rts:
+                main_rt_id = subnet_rts.get(f"main:{vpc_id}")
+                if main_rt_id:
+                    subnet_rts[subnet_id] = main_rt_id
 
     async def _build_eni_index(self, topology: NetworkTopology, regions: list[str]):
         """Build IP -> ENI index for fast lookups."""
-        loop = asyncio.get_event_loop()
 
-        async def fetch_region(region: str):
-            def _fetch():
-                ec2 = self._client("ec2", region)
-                paginator = ec2.get_paginator("describe_network_interfaces")
-                for page in paginator.paginate():
-                    for eni in page.get("NetworkInterfaces", []):
-                        for addr in eni.get("PrivateIpAddresses", []):
-                            ip = addr.get("PrivateIpAddress")
-                            if ip:
-                                topology.eni_index[ip] = {
-                                    "eni_id": eni["NetworkInterfaceId"],
-                                    "vpc_id": eni.get("VpcId"),
-                                    "subnet_id": eni.get("SubnetId"),
-                                    "region": region,
-                                    "security_groups": [
-                                        g["GroupId"] for g in eni.get("Groups", [])
-                                    ],
-                                }
-
-            return await loop.run_in_executor(self._executor, _fetch)
-
-        await asyncio.gather(*[fetch_region(r) for r in regions])
+        def fetch(region: str) -> list[tuple]:
+            ec2 = self._client("ec2", region)
+            paginator = ec2.get_paginator("describe_network_interfaces")
+            rows = []
+            for page in paginator.paginate():
+                for eni in page.get("NetworkInterfaces", []):
+                    groups = [g["GroupId"] for g in eni.get("Groups", [])]
+                    for addr in eni.get("PrivateIpAddresses", []):
+                        ip = addr.get("PrivateIpAddress")
+                        if ip:
+                            rows.append(
+                                (
+                                    ip,
+                                    eni["NetworkInterfaceId"],
+                                    eni.get("VpcId"),
+                                    eni.get("SubnetId"),
+                                    region,
+                                    groups,
+                                )
+                            )
+            return rows
+
+        # Rows are appended here, on the loop, so the columns stay aligned
+        for rows in await self._map_regions(fetch, regions):
+            for row in rows:
+                topology.add_eni(*row)
+
+
+def _active_regions(topology: NetworkTopology) -> list[str]:
+    """Regions with TGWs, non-default VPCs, ENIs or Cloud WAN attachments."""
+    active = set(topology.tgws)
+    active.update(
+        region
+        for region, vpcs in topology.vpcs.items()
+        if any(not v.get("IsDefault") for v in vpcs)
+    )
+    active.update(topology.eni_regions)
+    active.update(a.get("EdgeLocation") for a in topology.cwan_attachments)
+    return [r for r in topology.scanned_regions if r in active]
+
+
+def _discover_worker(profile: Optional[str], regions: Optional[list[str]]) -> dict:
+    """Process-pool entry point for ``TopologyDiscovery.discover_isolated``."""
+    loop = asyncio.new_event_loop()
+    try:
+        topology = loop.run_until_complete(
+            TopologyDiscovery(profile).discover(regions)
+        )
+    finally:
+        loop.close()
+    return topology.to_dict()
+
+
+def complete_ips(ips: Sequence[str], text: str) -> list[str]:
+    """Return IPs from a sorted sequence that start with ``text``."""
+    start = bisect.bisect_left(ips, text)
+    return list(
+        itertools.takewhile(
+            lambda ip: ip.startswith(text), itertools.islice(ips, start, None)
+        )
+    )